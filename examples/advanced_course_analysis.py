@@ -11,85 +11,95 @@ This example showcases:
 5. Comprehensive strategic insights using real course characteristics
 """
 
-import os
+import io
 import sys
-
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from concurrent.futures import ThreadPoolExecutor
 
 from src.models.athlete import AthleteProfile
 from src.models.conditions import RaceConditions
-from src.pipelines.core_strategy import RaceStrategyPipeline
 from src.utils.config import setup_dspy_model
-from src.utils.course_loader import load_alpe_dhuez_real, load_happy_valley_70_3_gps
+
+# One template per crux segment so each dict field is looked up exactly once
+CRUX_SEGMENT_TEMPLATE = (
+    "\n   {i}. {name} - Mile {start_mile:.1f}\n"
+    "      • Distance: {length_miles:.1f} miles\n"
+    "      • Gradient: {avg_grade:.1f}% avg, {max_grade:.1f}% max\n"
+    "      • Elevation: {elevation_gain_ft} ft gain\n"
+    "      • Difficulty: {difficulty_score:.2f}/1.0\n"
+    "      • Strategy: {strategic_importance}\n"
+)
 
 
 def print_enhanced_analysis(course_name, results):
     """Pretty print the enhanced course analysis results"""
-    print(f"\n{'=' * 80}")
-    print(f"🚴 ENHANCED COURSE ANALYSIS: {course_name}")
-    print(f"{'=' * 80}")
+    # Build the whole report in memory and emit it with a single write
+    buf = io.StringIO()
+    w = buf.write
+
+    w(f"\n{'=' * 80}\n")
+    w(f"🚴 ENHANCED COURSE ANALYSIS: {course_name}\n")
+    w(f"{'=' * 80}\n")
 
     # Difficulty Metrics from Calculator
     diff_metrics = results["difficulty_metrics"]
-    print("\n📊 OBJECTIVE DIFFICULTY METRICS:")
-    print(f"   Overall Rating: {diff_metrics.overall_rating}/10")
-    print(f"   Elevation Intensity: {diff_metrics.elevation_intensity:.1f} ft/mile")
-    print(f"   Average Gradient: {diff_metrics.avg_gradient:.1f}%")
-    print(f"   Maximum Gradient: {diff_metrics.max_gradient:.1f}%")
-    print(
-        f"   Climb Clustering: {diff_metrics.climb_clustering_score:.2f} (0=rolling, 1=sustained)"
+    w("\n📊 OBJECTIVE DIFFICULTY METRICS:\n")
+    w(f"   Overall Rating: {diff_metrics.overall_rating}/10\n")
+    w(f"   Elevation Intensity: {diff_metrics.elevation_intensity:.1f} ft/mile\n")
+    w(f"   Average Gradient: {diff_metrics.avg_gradient:.1f}%\n")
+    w(f"   Maximum Gradient: {diff_metrics.max_gradient:.1f}%\n")
+    w(
+        f"   Climb Clustering: {diff_metrics.climb_clustering_score:.2f} (0=rolling, 1=sustained)\n"
     )
-    print(f"   Technical Difficulty: {diff_metrics.technical_difficulty:.2f}/1.0")
-    print(f"   \n   Justification: {diff_metrics.difficulty_justification}")
+    w(f"   Technical Difficulty: {diff_metrics.technical_difficulty:.2f}/1.0\n")
+    w(f"   \n   Justification: {diff_metrics.difficulty_justification}\n")
 
     # Enhanced Course Analysis
     course_analysis = results["enhanced_course_analysis"]
-    print("\n🧠 AI-ENHANCED STRATEGIC ANALYSIS:")
-    print(f"   {course_analysis.strategic_analysis}")
+    w("\n🧠 AI-ENHANCED STRATEGIC ANALYSIS:\n")
+    w(f"   {course_analysis.strategic_analysis}\n")
 
-    print("\n🎯 POWER & PACING PLAN:")
-    print(f"   {course_analysis.power_pacing_plan}")
+    w("\n🎯 POWER & PACING PLAN:\n")
+    w(f"   {course_analysis.power_pacing_plan}\n")
 
-    print("\n📈 SEGMENT-BY-SEGMENT BREAKDOWN:")
-    print(f"   {course_analysis.segment_analysis}")
+    w("\n📈 SEGMENT-BY-SEGMENT BREAKDOWN:\n")
+    w(f"   {course_analysis.segment_analysis}\n")
 
-    print("\n💡 TACTICAL INSIGHTS:")
-    print(f"   {course_analysis.tactical_insights}")
+    w("\n💡 TACTICAL INSIGHTS:\n")
+    w(f"   {course_analysis.tactical_insights}\n")
 
     # Crux Segments Analysis
-    print("\n🎯 CRUX SEGMENTS (Most Critical Points):")
-    for i, segment in enumerate(diff_metrics.crux_segments[:3], 1):
-        print(f"\n   {i}. {segment['name']} - Mile {segment['start_mile']:.1f}")
-        print(f"      • Distance: {segment['length_miles']:.1f} miles")
-        print(
-            f"      • Gradient: {segment['avg_grade']:.1f}% avg, {segment['max_grade']:.1f}% max"
+    w("\n🎯 CRUX SEGMENTS (Most Critical Points):\n")
+    w(
+        "".join(
+            CRUX_SEGMENT_TEMPLATE.format(i=i, **segment)
+            for i, segment in enumerate(diff_metrics.crux_segments[:3], 1)
         )
-        print(f"      • Elevation: {segment['elevation_gain_ft']} ft gain")
-        print(f"      • Difficulty: {segment['difficulty_score']:.2f}/1.0")
-        print(f"      • Strategy: {segment['strategic_importance']}")
+    )
 
     # Individual Segment Analysis
     if results["segment_analyses"]:
-        print("\n🔍 DETAILED SEGMENT ANALYSIS:")
+        w("\n🔍 DETAILED SEGMENT ANALYSIS:\n")
         for i, seg_analysis in enumerate(results["segment_analyses"][:3], 1):
-            print(f"\n   Segment {i} Power Recommendation:")
-            print(f"   {seg_analysis.power_recommendation}")
-            print(f"\n   Segment {i} Tactical Approach:")
-            print(f"   {seg_analysis.tactical_approach}")
+            w(f"\n   Segment {i} Power Recommendation:\n")
+            w(f"   {seg_analysis.power_recommendation}\n")
+            w(f"\n   Segment {i} Tactical Approach:\n")
+            w(f"   {seg_analysis.tactical_approach}\n")
 
     # Final Strategy with Enhanced Data
     final_strategy = results["final_strategy"]
-    print("\n🏆 FINAL ENHANCED STRATEGY:")
-    print(f"   {final_strategy.final_strategy}")
+    w("\n🏆 FINAL ENHANCED STRATEGY:\n")
+    w(f"   {final_strategy.final_strategy}\n")
+
+    w("\n⏱️ TIME PREDICTION (Enhanced):\n")
+    w(f"   {final_strategy.time_prediction}\n")
 
-    print("\n⏱️ TIME PREDICTION (Enhanced):")
-    print(f"   {final_strategy.time_prediction}")
+    w("\n📊 SUCCESS PROBABILITY:\n")
+    w(f"   {final_strategy.success_probability}\n")
 
-    print("\n📊 SUCCESS PROBABILITY:")
-    print(f"   {final_strategy.success_probability}")
+    w("\n🔑 KEY SUCCESS FACTORS:\n")
+    w(f"   {final_strategy.key_success_factors}\n")
 
-    print("\n🔑 KEY SUCCESS FACTORS:")
-    print(f"   {final_strategy.key_success_factors}")
+    sys.stdout.write(buf.getvalue())
 
 
 def main():
@@ -112,6 +122,11 @@ def main():
         print("💡 Check your .env file and API keys")
         return
 
+    # Deferred until the model is configured so a setup failure exits without
+    # loading the pipeline, GPS and NumPy stack
+    from src.pipelines.core_strategy import RaceStrategyPipeline
+    from src.utils.course_loader import load_alpe_dhuez_real, load_happy_valley_70_3_gps
+
     # Create enhanced pipeline
     enhanced_pipeline = RaceStrategyPipeline()
 
@@ -140,56 +155,88 @@ def main():
         humidity_percent=75,
     )
 
-    # Test 1: Happy Valley 70.3 with Enhanced Analysis
-    print("\n" + "─" * 80)
-    print("TEST 1: HAPPY VALLEY 70.3 - ENHANCED ANALYSIS")
-    print("─" * 80)
+    # Load both courses up front so the two analyses can run concurrently;
+    # generate_strategy is bound by LLM round-trips, not CPU.
+    happy_valley = alpe_dhuez = None
+    hv_results = ad_results = None
 
     try:
         happy_valley = load_happy_valley_70_3_gps()
-        print(f"✅ Loaded real GPS data: {happy_valley.name}")
-        print(
-            f"   Course Profile: {len(happy_valley.key_climbs)} key climbs identified"
-        )
-        print(
-            f"   Elevation Data: {happy_valley.bike_elevation_gain_ft}ft total gain over {happy_valley.bike_distance_miles} miles"
-        )
-
-        hv_results = enhanced_pipeline.generate_strategy(
-            happy_valley, elite_athlete, race_conditions
-        )
-        print_enhanced_analysis(happy_valley.name, hv_results)
+    except Exception as e:
+        print(f"❌ Error loading Happy Valley: {e}")
 
+    try:
+        alpe_dhuez = load_alpe_dhuez_real()
     except Exception as e:
-        print(f"❌ Error analyzing Happy Valley: {e}")
-        import traceback
+        print(f"❌ Error loading Alpe d'Huez: {e}")
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        hv_future = ad_future = None
+        if happy_valley is not None:
+            hv_future = pool.submit(
+                enhanced_pipeline.generate_strategy,
+                happy_valley,
+                elite_athlete,
+                race_conditions,
+            )
+        if alpe_dhuez is not None:
+            ad_future = pool.submit(
+                enhanced_pipeline.generate_strategy,
+                alpe_dhuez,
+                elite_athlete,
+                race_conditions,
+            )
 
-        traceback.print_exc()
+        # Test 1: Happy Valley 70.3 with Enhanced Analysis
+        print("\n" + "─" * 80)
+        print("TEST 1: HAPPY VALLEY 70.3 - ENHANCED ANALYSIS")
+        print("─" * 80)
 
-    # Test 2: Alpe d'Huez with Enhanced Analysis
-    print("\n" + "─" * 80)
-    print("TEST 2: ALPE D'HUEZ - ENHANCED ANALYSIS")
-    print("─" * 80)
+        if hv_future is not None:
+            try:
+                print(f"✅ Loaded real GPS data: {happy_valley.name}")
+                print(
+                    f"   Course Profile: {len(happy_valley.key_climbs)} key climbs identified"
+                )
+                print(
+                    f"   Elevation Data: {happy_valley.bike_elevation_gain_ft}ft total gain over {happy_valley.bike_distance_miles} miles"
+                )
 
-    try:
-        alpe_dhuez = load_alpe_dhuez_real()
-        print(f"✅ Loaded real GPS data: {alpe_dhuez.name}")
-        print(f"   Course Profile: {len(alpe_dhuez.key_climbs)} key climbs identified")
-        print(
-            f"   Elevation Data: {alpe_dhuez.bike_elevation_gain_ft}ft total gain over {alpe_dhuez.bike_distance_miles} miles"
-        )
-        print(f"   Altitude: {alpe_dhuez.altitude_ft}ft (altitude effects considered)")
+                hv_results = hv_future.result()
+                print_enhanced_analysis(happy_valley.name, hv_results)
 
-        ad_results = enhanced_pipeline.generate_strategy(
-            alpe_dhuez, elite_athlete, race_conditions
-        )
-        print_enhanced_analysis(alpe_dhuez.name, ad_results)
+            except Exception as e:
+                print(f"❌ Error analyzing Happy Valley: {e}")
+                import traceback
 
-    except Exception as e:
-        print(f"❌ Error analyzing Alpe d'Huez: {e}")
-        import traceback
+                traceback.print_exc()
+
+        # Test 2: Alpe d'Huez with Enhanced Analysis
+        print("\n" + "─" * 80)
+        print("TEST 2: ALPE D'HUEZ - ENHANCED ANALYSIS")
+        print("─" * 80)
+
+        if ad_future is not None:
+            try:
+                print(f"✅ Loaded real GPS data: {alpe_dhuez.name}")
+                print(
+                    f"   Course Profile: {len(alpe_dhuez.key_climbs)} key climbs identified"
+                )
+                print(
+                    f"   Elevation Data: {alpe_dhuez.bike_elevation_gain_ft}ft total gain over {alpe_dhuez.bike_distance_miles} miles"
+                )
+                print(
+                    f"   Altitude: {alpe_dhuez.altitude_ft}ft (altitude effects considered)"
+                )
+
+                ad_results = ad_future.result()
+                print_enhanced_analysis(alpe_dhuez.name, ad_results)
+
+            except Exception as e:
+                print(f"❌ Error analyzing Alpe d'Huez: {e}")
+                import traceback
 
-        traceback.print_exc()
+                traceback.print_exc()
 
     # Test 3: Compare Enhanced Analysis Results
     print("\n" + "─" * 80)
@@ -197,9 +244,11 @@ def main():
     print("─" * 80)
 
     try:
-        if "hv_results" in locals() and "ad_results" in locals():
-            hv_difficulty = hv_results["difficulty_metrics"].overall_rating
-            ad_difficulty = ad_results["difficulty_metrics"].overall_rating
+        if hv_results is not None and ad_results is not None:
+            hv_metrics = hv_results["difficulty_metrics"]
+            ad_metrics = ad_results["difficulty_metrics"]
+            hv_difficulty = hv_metrics.overall_rating
+            ad_difficulty = ad_metrics.overall_rating
 
             print("\n📊 DIFFICULTY COMPARISON:")
             print(f"   Happy Valley 70.3: {hv_difficulty}/10 difficulty")
@@ -207,8 +256,8 @@ def main():
             print(f"   Difference: {ad_difficulty - hv_difficulty:.1f} points")
 
             print("\n🎯 STRATEGIC DIFFERENCES:")
-            hv_crux_count = len(hv_results["difficulty_metrics"].crux_segments)
-            ad_crux_count = len(ad_results["difficulty_metrics"].crux_segments)
+            hv_crux_count = len(hv_metrics.crux_segments)
+            ad_crux_count = len(ad_metrics.crux_segments)
             print(f"   Happy Valley crux segments: {hv_crux_count}")
             print(f"   Alpe d'Huez crux segments: {ad_crux_count}")
 
@@ -230,31 +279,29 @@ def main():
         print(f"❌ Error in comparison: {e}")
 
     # Summary
-    print(f"\n{'=' * 80}")
-    print("📋 ENHANCED ANALYSIS SUMMARY")
-    print(f"{'=' * 80}")
-
-    print("\n✅ Successfully demonstrated Issue #13 requirements:")
-    print("   1. ✅ Enhanced CourseAnalyzer signature with real elevation data")
-    print("   2. ✅ Segment-by-segment strategic analysis")
-    print("   3. ✅ Power/pacing recommendations based on actual gradients")
-    print("   4. ✅ Integration with course difficulty calculations")
-    print("   5. ✅ Improved strategic insights using real course characteristics")
-
-    print("\n🎯 Enhancement Highlights:")
-    print("   • Real GPS elevation data integration")
-    print("   • Objective difficulty scoring from DifficultyCalculator")
-    print("   • Crux segment identification and tactical analysis")
-    print("   • Athlete-specific power recommendations per segment")
-    print("   • Enhanced strategic insights based on course realities")
-
-    print("\n🚀 Next Steps:")
-    print("   • Test with additional real course data")
-    print("   • Validate power recommendations against race results")
-    print("   • Expand segment analysis to include run course data")
-
-    print("\n✨ Enhanced DSPy Course Analysis (Issue #13) Complete!")
-    print("=" * 80)
+    sys.stdout.write(
+        f"\n{'=' * 80}\n"
+        "📋 ENHANCED ANALYSIS SUMMARY\n"
+        f"{'=' * 80}\n"
+        "\n✅ Successfully demonstrated Issue #13 requirements:\n"
+        "   1. ✅ Enhanced CourseAnalyzer signature with real elevation data\n"
+        "   2. ✅ Segment-by-segment strategic analysis\n"
+        "   3. ✅ Power/pacing recommendations based on actual gradients\n"
+        "   4. ✅ Integration with course difficulty calculations\n"
+        "   5. ✅ Improved strategic insights using real course characteristics\n"
+        "\n🎯 Enhancement Highlights:\n"
+        "   • Real GPS elevation data integration\n"
+        "   • Objective difficulty scoring from DifficultyCalculator\n"
+        "   • Crux segment identification and tactical analysis\n"
+        "   • Athlete-specific power recommendations per segment\n"
+        "   • Enhanced strategic insights based on course realities\n"
+        "\n🚀 Next Steps:\n"
+        "   • Test with additional real course data\n"
+        "   • Validate power recommendations against race results\n"
+        "   • Expand segment analysis to include run course data\n"
+        "\n✨ Enhanced DSPy Course Analysis (Issue #13) Complete!\n"
+        f"{'=' * 80}\n"
+    )
 
 
 if __name__ == "__main__":
@@ -1,14 +1,7 @@
-import os
-import sys
-
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from src.models.athlete import AthleteProfile
 from src.models.conditions import RaceConditions
 from src.models.course import ClimbSegment, CourseProfile
-from src.pipelines.core_strategy import RaceStrategyPipeline
 from src.utils.config import setup_dspy_model
-from src.utils.course_loader import load_happy_valley_70_3
 
 
 def main():
@@ -26,6 +19,11 @@ def main():
         print("💡 Check your .env file and API keys")
         return
 
+    # Deferred until the model is configured so a setup failure exits without
+    # loading the pipeline, GPS and NumPy stack
+    from src.pipelines.core_strategy import RaceStrategyPipeline
+    from src.utils.course_loader import load_happy_valley_70_3
+
     # Load real course data
     print("📊 Loading Happy Valley 70.3 course data...")
     try:
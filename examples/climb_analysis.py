@@ -7,42 +7,118 @@ Includes climb categorization, power estimates, pacing strategies,
 and training recommendations.
 
 Usage:
-    python examples/climb_analysis.py
+    python examples/climb_analysis.py [--no-cache]
 
 Dependencies:
     - src.utils.gps_parser
     - src.models.course
 """
 
-import math
+import argparse
 import sys
+from collections import defaultdict, namedtuple
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+import numpy as np
 
 # Add src directory to path for imports
 current_dir = Path(__file__).parent
 project_root = current_dir.parent
 sys.path.insert(0, str(project_root))
 
-from src.models.course import ClimbSegment
-from src.utils.gps_parser import GPSParser, GPSParserConfig
+# The GPS parser stack is imported lazily in main() so runs without any GPX
+# files exit before paying its import cost
+if TYPE_CHECKING:
+    from src.models.course import ClimbSegment
+    from src.utils.gps_parser import GPSParserConfig
+
+GPX_DIR = current_dir / "gpx"
+
+# Courses with climbing potential: (filename, display name, emoji)
+CLIMBING_COURSES = [
+    ("hilly_course.gpx", "Hilly Course", "🟡"),
+    ("mountain_course.gpx", "Mountain Course", "🔴"),
+    ("urban_course.gpx", "Urban Course", "🏙️"),
+]
+
+# Climb categories from hardest to easiest, mapped to their sort rank
+CATEGORY_RANK = {"HC": 0, "1": 1, "2": 2, "3": 3, "4": 4, "Uncategorized": 5}
+CATEGORY_EMOJIS = {
+    "HC": "🏆",
+    "1": "🥇",
+    "2": "🥈",
+    "3": "🥉",
+    "4": "🎯",
+    "Uncategorized": "⚪",
+}
+
+# Difficulty-point thresholds and the category each bin maps to (easiest first)
+_POINT_BINS = np.array([100.0, 200.0, 400.0, 800.0, 1600.0])
+_CATS = np.array(["Uncategorized", "4", "3", "2", "1", "HC"])
+
+# One climb plus the course it belongs to; numeric scores live in the climb table
+ClimbRow = namedtuple("ClimbRow", ["climb", "course", "emoji"])
+
+# Raw per-climb fields and the full table with derived scores
+CLIMB_FIELDS_DTYPE = np.dtype(
+    [("length", "f8"), ("grade", "f8"), ("max_grade", "f8"), ("gain", "f8")]
+)
+CLIMB_TABLE_DTYPE = np.dtype(
+    CLIMB_FIELDS_DTYPE.descr
+    + [
+        ("points", "f8"),
+        ("fiets", "f8"),
+        ("rel_diff", "f8"),
+        ("vam", "f8"),
+        ("power", "f8", (3,)),  # One column per effort level
+        ("time_min", "f8", (3,)),
+    ]
+)
+
+# Effort levels used for power/time estimates, in display order
+EFFORT_LEVELS = ("easy", "moderate", "hard")
+_POWER_PER_GRADE = {"easy": 35, "moderate": 45, "hard": 55}  # Watts per % grade
+# (flat speed mph, mph lost per % grade) for each effort level
+_SPEED_COEFFS = {"easy": (12, 0.4), "moderate": (15, 0.5), "hard": (18, 0.6)}
 
+# The same tables as arrays, one column per effort level, for vectorized scoring
+_EFFORT_POWER_PER_GRADE = np.array(
+    [_POWER_PER_GRADE[level] for level in EFFORT_LEVELS], dtype=float
+)
+_EFFORT_SPEED_BASE, _EFFORT_SPEED_SLOPE = np.array(
+    [_SPEED_COEFFS[level] for level in EFFORT_LEVELS], dtype=float
+).T
 
-def main():
+
+def main(argv: Optional[List[str]] = None):
     """Main climb analysis function."""
+    parser = argparse.ArgumentParser(description="Detailed climb analysis demo")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Reparse GPX files instead of reusing cached course profiles",
+    )
+    args = parser.parse_args(argv)
+
     print("🏔️  Advanced Climb Analysis Tool")
     print("=" * 70)
 
-    # Initialize GPS parser with sensitive settings to catch more climbs
+    if not any((GPX_DIR / filename).exists() for filename, _, _ in CLIMBING_COURSES):
+        print(f"❌ No GPX files found in {GPX_DIR}")
+        return
+
+    from src.utils.gps_parser import GPSParserConfig
+
+    # Parser settings tuned to catch more climbs (smoothing is always applied)
     config = GPSParserConfig(
-        min_climb_length_miles=0.1,  # Catch shorter climbs
+        min_climb_distance=0.1,  # Catch shorter climbs
         min_climb_grade=3.0,  # Lower grade threshold
-        enable_smoothing=True,
     )
-    parser = GPSParser(config)
 
     # Load courses with climbing focus
-    courses = load_climbing_courses(parser)
+    courses = load_climbing_courses(config, use_cache=not args.no_cache)
 
     if not courses:
         print("❌ No courses loaded for climb analysis.")
@@ -57,456 +133,466 @@ def main():
 
     print(f"Found {len(all_climbs)} climbs across {len(courses)} courses\n")
 
+    # Per-climb scores computed once as whole-array operations
+    table = build_climb_table(all_climbs)
+    cols = format_climb_columns(all_climbs, table)
+
     # Various analysis sections
-    analyze_climb_categories(all_climbs)
+    analyze_climb_categories(all_climbs, table, cols)
     print()
-    analyze_climb_difficulty_scoring(all_climbs)
+    analyze_climb_difficulty_scoring(all_climbs, table, cols)
     print()
-    analyze_power_requirements(all_climbs)
+    analyze_power_requirements(all_climbs, table, cols)
     print()
     analyze_pacing_strategies(all_climbs)
     print()
-    compare_similar_climbs(all_climbs)
+    partition = partition_climbs(all_climbs, table)
+    compare_similar_climbs(all_climbs, partition, cols)
     print()
-    provide_training_recommendations(all_climbs)
+    provide_training_recommendations(partition, table)
     print()
     generate_climb_profiles(courses)
 
 
-def load_climbing_courses(parser: GPSParser) -> List[Dict[str, Any]]:
-    """Load courses that have significant climbing."""
-    gpx_dir = current_dir / "gpx"
+def _parse_course(config: "GPSParserConfig", file_path: str, use_cache: bool = True):
+    """Parse one GPX file in a worker process with a fresh parser.
 
-    # Focus on courses with climbing potential
-    climbing_courses = [
-        ("hilly_course.gpx", "Hilly Course", "🟡"),
-        ("mountain_course.gpx", "Mountain Course", "🔴"),
-        ("urban_course.gpx", "Urban Course", "🏙️"),
-    ]
+    Parsed profiles are reused from the on-disk cache unless ``use_cache`` is
+    False, so reruns skip XML parsing and climb detection for unchanged files.
+    """
+    from src.utils.gps_parser import GPSParser
+
+    parser = GPSParser(config)
+    if use_cache:
+        return parser.parse_gpx_file_cached(file_path)
+    return parser.parse_gpx_file(file_path)
 
+
+def load_climbing_courses(
+    config: "GPSParserConfig", use_cache: bool = True
+) -> List[Dict[str, Any]]:
+    """Load courses that have significant climbing."""
     courses = []
     print("Loading courses with significant climbing...")
 
-    for filename, name, emoji in climbing_courses:
-        file_path = gpx_dir / filename
-
-        if not file_path.exists():
+    available = []
+    for filename, name, emoji in CLIMBING_COURSES:
+        if (GPX_DIR / filename).exists():
+            available.append((filename, name, emoji))
+        else:
             print(f"⚠️  Skipping missing file: {filename}")
-            continue
 
-        try:
-            course_profile = parser.parse_gpx_file(str(file_path))
-            if course_profile.key_climbs:  # Only include courses with climbs
-                courses.append(
-                    {
-                        "name": name,
-                        "emoji": emoji,
-                        "filename": filename,
-                        "profile": course_profile,
-                    }
-                )
-                print(f"✅ Loaded: {name} ({len(course_profile.key_climbs)} climbs)")
-            else:
-                print(f"⚠️  No climbs found in: {name}")
-
-        except Exception as e:
-            print(f"❌ Error loading {filename}: {e}")
+    if not available:
+        return courses
+
+    # GPX parsing is CPU-bound and independent per file, so parse the files in
+    # parallel. Results are collected in submission order to keep output stable.
+    with ProcessPoolExecutor(max_workers=len(available)) as executor:
+        futures = [
+            (
+                executor.submit(
+                    _parse_course, config, str(GPX_DIR / entry[0]), use_cache
+                ),
+                entry,
+            )
+            for entry in available
+        ]
+
+        for future, (filename, name, emoji) in futures:
+            try:
+                course_profile = future.result()
+                if course_profile.key_climbs:  # Only include courses with climbs
+                    courses.append(
+                        {
+                            "name": name,
+                            "emoji": emoji,
+                            "filename": filename,
+                            "profile": course_profile,
+                        }
+                    )
+                    print(
+                        f"✅ Loaded: {name} ({len(course_profile.key_climbs)} climbs)"
+                    )
+                else:
+                    print(f"⚠️  No climbs found in: {name}")
+
+            except Exception as e:
+                print(f"❌ Error loading {filename}: {e}")
 
     return courses
 
 
-def collect_all_climbs(courses: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """Collect all climbs from all courses with metadata."""
-    all_climbs = []
+def collect_all_climbs(courses: List[Dict[str, Any]]) -> List[ClimbRow]:
+    """Collect all climbs from all courses with their course name and emoji."""
+    return [
+        ClimbRow(climb, course_data["name"], course_data["emoji"])
+        for course_data in courses
+        for climb in course_data["profile"].key_climbs
+    ]
 
-    for course_data in courses:
-        course = course_data["profile"]
-        for climb in course.key_climbs:
-            all_climbs.append(
-                {
-                    "climb": climb,
-                    "course_name": course_data["name"],
-                    "course_emoji": course_data["emoji"],
-                }
-            )
 
-    return all_climbs
+def build_climb_table(climbs: List[ClimbRow]) -> np.ndarray:
+    """Extract climb fields into a structured array and score every climb at once.
+
+    Rows are indexed by position in ``climbs``. ``power`` and ``time_min`` hold
+    one value per entry in EFFORT_LEVELS.
+    """
+    n = len(climbs)
+    table = np.empty(n, dtype=CLIMB_TABLE_DTYPE)
+    table[list(CLIMB_FIELDS_DTYPE.names)] = np.fromiter(
+        (
+            (c.length_miles, c.avg_grade, c.max_grade, c.elevation_gain_ft)
+            for c in (row.climb for row in climbs)
+        ),
+        dtype=CLIMB_FIELDS_DTYPE,
+        count=n,
+    )
+
+    length = table["length"]
+    grade = table["grade"]
+    gain = table["gain"]
+    speed = np.maximum(
+        _EFFORT_SPEED_BASE - grade[:, None] * _EFFORT_SPEED_SLOPE, 4.0
+    )  # Minimum 4 mph
+
+    grade_frac = grade * 0.01
+    table["points"] = gain * grade_frac * np.sqrt(length)
+    table["fiets"] = (gain / 3.281) * grade_frac**2 * length * 1.609
+    table["rel_diff"] = np.minimum(
+        (grade / 20) * 5 + (length / 10) * 3 + (gain / 3000) * 2, 10.0
+    )
+    table["vam"] = np.maximum(1200 - (grade - 6) * 50, 800)
+    table["power"] = 150 + grade[:, None] * _EFFORT_POWER_PER_GRADE
+    table["time_min"] = length[:, None] / speed * 60
+
+    return table
+
+
+def format_climb_columns(climbs: List[ClimbRow], table: np.ndarray) -> Dict[str, Any]:
+    """Pre-format the numeric climb columns used by the report sections.
+
+    Each format spec is applied once per column rather than once per printed
+    value. Entries are indexed by position in ``climbs``.
+    """
+    return {
+        "length": np.char.mod("%.1f", table["length"]),
+        "grade": np.char.mod("%.1f", table["grade"]),
+        "max_grade": np.char.mod("%.1f", table["max_grade"]),
+        # Format from the source values so integer gains keep their exact form
+        "gain": [f"{row.climb.elevation_gain_ft:,}" for row in climbs],
+        "points": np.char.mod("%.0f", table["points"]),
+        "fiets": np.char.mod("%.0f", table["fiets"]),
+        "rel_diff": np.char.mod("%.1f", table["rel_diff"]),
+        "vam": np.char.mod("%.0f", table["vam"]),
+        "power": np.char.mod("%.0f", table["power"]),
+        "w_per_kg": np.char.mod("%.1f", table["power"] / 70),
+    }
 
 
-def analyze_climb_categories(climbs: List[Dict[str, Any]]):
+def analyze_climb_categories(
+    climbs: List[ClimbRow], table: np.ndarray, cols: Dict[str, Any]
+):
     """Categorize climbs using cycling categorization system."""
-    print("🏆 Climb Categorization (Cycling Standards)")
-    print("-" * 70)
-
-    categorized = []
-    for climb_data in climbs:
-        climb = climb_data["climb"]
-        category = categorize_climb(climb)
-        categorized.append(
-            {
-                "climb_data": climb_data,
-                "category": category,
-                "points": calculate_climb_points(climb),
-            }
-        )
+    lines = ["🏆 Climb Categorization (Cycling Standards)", "-" * 70]
+
+    categories = categorize_climbs_vec(table["points"]).tolist()
 
     # Sort by difficulty (HC first, then Cat 1, etc.)
-    category_order = ["HC", "1", "2", "3", "4", "Uncategorized"]
-    categorized.sort(
-        key=lambda x: (
-            category_order.index(x["category"])
-            if x["category"] in category_order
-            else 999
-        )
+    order = sorted(
+        range(len(climbs)), key=lambda i: CATEGORY_RANK.get(categories[i], 999)
     )
 
-    # Print categorized climbs
-    for item in categorized:
-        climb = item["climb_data"]["climb"]
-        course = item["climb_data"]["course_name"]
-        emoji = item["climb_data"]["course_emoji"]
-        category = item["category"]
-        points = item["points"]
+    # Report categorized climbs
+    for i in order:
+        row = climbs[i]
+        category = categories[i]
 
         cat_emoji = get_category_emoji(category)
-        print(f"{cat_emoji} Cat {category}: {climb.name}")
-        print(f"    Course: {emoji} {course}")
-        print(
-            f"    Length: {climb.length_miles:.1f} mi | Grade: {climb.avg_grade:.1f}% | Gain: {climb.elevation_gain_ft:,} ft"
+        lines.append(f"{cat_emoji} Cat {category}: {row.climb.name}")
+        lines.append(f"    Course: {row.emoji} {row.course}")
+        lines.append(
+            f"    Length: {cols['length'][i]} mi | Grade: {cols['grade'][i]}% | Gain: {cols['gain'][i]} ft"
         )
-        print(f"    Difficulty Points: {points:.0f}")
-        print()
+        lines.append(f"    Difficulty Points: {cols['points'][i]}")
+        lines.append("")
 
+    print("\n".join(lines))
 
-def analyze_climb_difficulty_scoring(climbs: List[Dict[str, Any]]):
+
+def analyze_climb_difficulty_scoring(
+    climbs: List[ClimbRow], table: np.ndarray, cols: Dict[str, Any]
+):
     """Analyze climbs using various difficulty scoring systems."""
-    print("📊 Climb Difficulty Scoring Systems")
-    print("-" * 70)
+    lines = ["📊 Climb Difficulty Scoring Systems", "-" * 70]
+
+    variable = table["max_grade"] > table["grade"] * 1.5
 
-    for climb_data in climbs:
-        climb = climb_data["climb"]
-        course = climb_data["course_name"]
-        emoji = climb_data["course_emoji"]
+    for i, (climb, course, emoji) in enumerate(climbs):
+        grade = cols["grade"][i]
+        max_grade = cols["max_grade"][i]
 
-        print(f"🏔️  {climb.name} ({emoji} {course})")
+        lines.append(f"🏔️  {climb.name} ({emoji} {course})")
 
         # Multiple scoring systems
-        fiets_score = calculate_fiets_score(climb)
-        relative_difficulty = calculate_relative_difficulty(climb)
-        vam_estimate = calculate_vam_estimate(climb)
-
-        print(f"    FIETS Score: {fiets_score:.0f} (climbing difficulty index)")
-        print(f"    Relative Difficulty: {relative_difficulty:.1f}/10")
-        print(
-            f"    Estimated VAM: {vam_estimate:.0f} m/h (Vertical Ascent Meters per hour)"
+        lines.append(f"    FIETS Score: {cols['fiets'][i]} (climbing difficulty index)")
+        lines.append(f"    Relative Difficulty: {cols['rel_diff'][i]}/10")
+        lines.append(
+            f"    Estimated VAM: {cols['vam'][i]} m/h (Vertical Ascent Meters per hour)"
         )
 
         # Difficulty breakdown
-        print("    Grade Analysis:")
-        print(
-            f"      - Average: {climb.avg_grade:.1f}% | Maximum: {climb.max_grade:.1f}%"
-        )
+        lines.append("    Grade Analysis:")
+        lines.append(f"      - Average: {grade}% | Maximum: {max_grade}%")
 
-        if climb.max_grade > climb.avg_grade * 1.5:
-            print(
-                f"      - ⚠️  Variable gradient (max {climb.max_grade:.1f}% vs avg {climb.avg_grade:.1f}%)"
+        if variable[i]:
+            lines.append(
+                f"      - ⚠️  Variable gradient (max {max_grade}% vs avg {grade}%)"
             )
 
-        print()
+        lines.append("")
 
+    print("\n".join(lines))
 
-def analyze_power_requirements(climbs: List[Dict[str, Any]]):
-    """Analyze estimated power requirements for each climb."""
-    print("⚡ Estimated Power Requirements")
-    print("-" * 70)
-    print("Note: Estimates based on 70kg cyclist, moderate aerodynamics")
-    print()
 
-    for climb_data in climbs:
-        climb = climb_data["climb"]
-        course = climb_data["course_name"]
-        emoji = climb_data["course_emoji"]
+def analyze_power_requirements(
+    climbs: List[ClimbRow], table: np.ndarray, cols: Dict[str, Any]
+):
+    """Analyze estimated power requirements for each climb."""
+    lines = ["⚡ Estimated Power Requirements", "-" * 70]
+    lines.append("Note: Estimates based on 70kg cyclist, moderate aerodynamics")
+    lines.append("")
 
-        print(f"🚴 {climb.name} ({emoji} {course})")
+    for i, (climb, course, emoji) in enumerate(climbs):
+        lines.append(f"🚴 {climb.name} ({emoji} {course})")
 
         # Power estimates for different pacing scenarios
-        easy_power = estimate_climbing_power(climb, effort_level="easy")
-        moderate_power = estimate_climbing_power(climb, effort_level="moderate")
-        hard_power = estimate_climbing_power(climb, effort_level="hard")
+        easy_power, moderate_power, hard_power = cols["power"][i]
+        easy_wkg, moderate_wkg, hard_wkg = cols["w_per_kg"][i]
 
-        print("    Power Requirements (70kg cyclist):")
-        print(
-            f"      - Easy pace (recovery): {easy_power:.0f}W ({easy_power / 70:.1f} W/kg)"
-        )
-        print(
-            f"      - Moderate pace (endurance): {moderate_power:.0f}W ({moderate_power / 70:.1f} W/kg)"
-        )
-        print(
-            f"      - Hard pace (tempo): {hard_power:.0f}W ({hard_power / 70:.1f} W/kg)"
+        lines.append("    Power Requirements (70kg cyclist):")
+        lines.append(f"      - Easy pace (recovery): {easy_power}W ({easy_wkg} W/kg)")
+        lines.append(
+            f"      - Moderate pace (endurance): {moderate_power}W ({moderate_wkg} W/kg)"
         )
+        lines.append(f"      - Hard pace (tempo): {hard_power}W ({hard_wkg} W/kg)")
 
         # Time estimates
-        easy_time = estimate_climb_time(climb, effort_level="easy")
-        moderate_time = estimate_climb_time(climb, effort_level="moderate")
-        hard_time = estimate_climb_time(climb, effort_level="hard")
+        easy_time, moderate_time, hard_time = table["time_min"][i]
 
-        print("    Estimated Climb Times:")
-        print(f"      - Easy pace: {format_time(easy_time)}")
-        print(f"      - Moderate pace: {format_time(moderate_time)}")
-        print(f"      - Hard pace: {format_time(hard_time)}")
+        lines.append("    Estimated Climb Times:")
+        lines.append(f"      - Easy pace: {format_time(easy_time)}")
+        lines.append(f"      - Moderate pace: {format_time(moderate_time)}")
+        lines.append(f"      - Hard pace: {format_time(hard_time)}")
 
-        print()
+        lines.append("")
 
+    print("\n".join(lines))
 
-def analyze_pacing_strategies(climbs: List[Dict[str, Any]]):
-    """Analyze optimal pacing strategies for each climb."""
-    print("🎯 Pacing Strategy Recommendations")
-    print("-" * 70)
 
-    for climb_data in climbs:
-        climb = climb_data["climb"]
-        course = climb_data["course_name"]
-        emoji = climb_data["course_emoji"]
+def analyze_pacing_strategies(climbs: List[ClimbRow]):
+    """Analyze optimal pacing strategies for each climb."""
+    lines = ["🎯 Pacing Strategy Recommendations", "-" * 70]
 
-        print(f"📈 {climb.name} ({emoji} {course})")
+    for climb, course, emoji in climbs:
+        lines.append(f"📈 {climb.name} ({emoji} {course})")
 
         # Analyze climb characteristics for pacing
         strategy = determine_pacing_strategy(climb)
 
-        print(f"    Recommended Strategy: {strategy['name']}")
-        print(f"    Rationale: {strategy['rationale']}")
-        print("    Key Points:")
+        lines.append(f"    Recommended Strategy: {strategy['name']}")
+        lines.append(f"    Rationale: {strategy['rationale']}")
+        lines.append("    Key Points:")
         for point in strategy["key_points"]:
-            print(f"      • {point}")
+            lines.append(f"      • {point}")
 
         # Specific power zones
-        print("    Power Zone Guidance:")
-        print(
+        lines.append("    Power Zone Guidance:")
+        lines.append(
             f"      • First 1/3: {strategy['first_third']} ({strategy['first_third_power']})"
         )
-        print(
+        lines.append(
             f"      • Middle 1/3: {strategy['middle_third']} ({strategy['middle_third_power']})"
         )
-        print(
+        lines.append(
             f"      • Final 1/3: {strategy['final_third']} ({strategy['final_third_power']})"
         )
 
-        print()
+        lines.append("")
 
+    print("\n".join(lines))
 
-def compare_similar_climbs(climbs: List[Dict[str, Any]]):
-    """Compare climbs with similar characteristics."""
-    print("🔄 Similar Climb Comparisons")
-    print("-" * 70)
 
-    # Group climbs by similar characteristics
-    short_steep = []
-    long_moderate = []
-    mixed_gradient = []
+def partition_climbs(climbs: List[ClimbRow], table: np.ndarray) -> Dict[str, Any]:
+    """Group climbs by type using vectorized masks, and by course.
 
-    for climb_data in climbs:
-        climb = climb_data["climb"]
+    Returns a dict with ``short_steep``, ``long_moderate`` and ``variable``
+    lists of table row indices, ``by_course`` mapping course name to the table
+    row indices of its climbs, and ``counts`` holding the size of each type
+    group.
+    """
+    length = table["length"]
+    grade = table["grade"]
 
-        if climb.length_miles < 1.0 and climb.avg_grade > 8:
-            short_steep.append(climb_data)
-        elif climb.length_miles > 2.0 and 4 <= climb.avg_grade <= 8:
-            long_moderate.append(climb_data)
-        elif climb.max_grade > climb.avg_grade * 1.4:
-            mixed_gradient.append(climb_data)
+    # Mutually exclusive, checked in priority order
+    short_steep_mask = (length < 1.0) & (grade > 8)
+    long_moderate_mask = (
+        ~short_steep_mask & (length > 2.0) & (grade >= 4) & (grade <= 8)
+    )
+    variable_mask = (
+        ~short_steep_mask & ~long_moderate_mask & (table["max_grade"] > grade * 1.4)
+    )
+
+    short_steep = np.flatnonzero(short_steep_mask).tolist()
+    long_moderate = np.flatnonzero(long_moderate_mask).tolist()
+    variable = np.flatnonzero(variable_mask).tolist()
+
+    by_course = defaultdict(list)
+    for i, row in enumerate(climbs):
+        by_course[row.course].append(i)
+
+    return {
+        "short_steep": short_steep,
+        "long_moderate": long_moderate,
+        "variable": variable,
+        "by_course": by_course,
+        "counts": {
+            "short_steep": len(short_steep),
+            "long_moderate": len(long_moderate),
+            "variable": len(variable),
+        },
+    }
+
+
+def compare_similar_climbs(
+    climbs: List[ClimbRow], partition: Dict[str, Any], cols: Dict[str, Any]
+):
+    """Compare climbs with similar characteristics."""
+    lines = ["🔄 Similar Climb Comparisons", "-" * 70]
+
+    # Groups of climbs with similar characteristics
+    short_steep = partition["short_steep"]
+    long_moderate = partition["long_moderate"]
+    mixed_gradient = partition["variable"]
 
     # Compare groups
     if short_steep:
-        print("⚡ Short & Steep Climbs:")
-        compare_climb_group(short_steep, "Power and anaerobic capacity")
-        print()
+        lines.append("⚡ Short & Steep Climbs:")
+        lines += compare_climb_group(
+            short_steep, climbs, cols, "Power and anaerobic capacity"
+        )
+        lines.append("")
 
     if long_moderate:
-        print("🏃 Long & Moderate Climbs:")
-        compare_climb_group(long_moderate, "Endurance and pacing")
-        print()
+        lines.append("🏃 Long & Moderate Climbs:")
+        lines += compare_climb_group(
+            long_moderate, climbs, cols, "Endurance and pacing"
+        )
+        lines.append("")
 
     if mixed_gradient:
-        print("🌊 Variable Gradient Climbs:")
-        compare_climb_group(mixed_gradient, "Tactical pacing and gear selection")
-        print()
+        lines.append("🌊 Variable Gradient Climbs:")
+        lines += compare_climb_group(
+            mixed_gradient, climbs, cols, "Tactical pacing and gear selection"
+        )
+        lines.append("")
+
+    print("\n".join(lines))
 
 
-def provide_training_recommendations(climbs: List[Dict[str, Any]]):
+def provide_training_recommendations(partition: Dict[str, Any], table: np.ndarray):
     """Provide specific training recommendations for each climb type."""
-    print("🏋️  Training Recommendations")
-    print("-" * 70)
+    lines = ["🏋️  Training Recommendations", "-" * 70]
 
-    # Analyze climb distribution and provide targeted advice
-    climb_types = analyze_climb_distribution(climbs)
+    # Use the climb distribution to provide targeted advice
+    climb_types = partition["counts"]
 
-    print("Based on your course climbs, focus training on:")
-    print()
+    lines.append("Based on your course climbs, focus training on:")
+    lines.append("")
 
     if climb_types["short_steep"] > 0:
-        print("💥 Short Steep Climbs Training:")
-        print("   • VO2 Max intervals: 5x3min at 110-120% FTP")
-        print("   • Neuromuscular power: 10x15sec all-out efforts")
-        print("   • Standing climb practice with high cadence")
-        print()
+        lines.append("💥 Short Steep Climbs Training:")
+        lines.append("   • VO2 Max intervals: 5x3min at 110-120% FTP")
+        lines.append("   • Neuromuscular power: 10x15sec all-out efforts")
+        lines.append("   • Standing climb practice with high cadence")
+        lines.append("")
 
     if climb_types["long_moderate"] > 0:
-        print("🔄 Long Moderate Climbs Training:")
-        print("   • Tempo intervals: 3x20min at 85-95% FTP")
-        print("   • Sweet spot training: 4x10min at 88-93% FTP")
-        print("   • Seated climbing efficiency at target race power")
-        print()
+        lines.append("🔄 Long Moderate Climbs Training:")
+        lines.append("   • Tempo intervals: 3x20min at 85-95% FTP")
+        lines.append("   • Sweet spot training: 4x10min at 88-93% FTP")
+        lines.append("   • Seated climbing efficiency at target race power")
+        lines.append("")
 
     if climb_types["variable"] > 0:
-        print("🌊 Variable Gradient Training:")
-        print("   • Over/under intervals: Alternate above/below FTP every 2min")
-        print("   • Climbing technique: Practice shifting and position changes")
-        print("   • Tactical pacing: Learn to read gradients and adjust effort")
-        print()
+        lines.append("🌊 Variable Gradient Training:")
+        lines.append("   • Over/under intervals: Alternate above/below FTP every 2min")
+        lines.append("   • Climbing technique: Practice shifting and position changes")
+        lines.append("   • Tactical pacing: Learn to read gradients and adjust effort")
+        lines.append("")
 
     # Course-specific recommendations
-    print("📋 Course-Specific Training Schedule:")
-    for course_name, climbs_in_course in group_climbs_by_course(climbs).items():
-        total_climbing = sum(c["climb"].elevation_gain_ft for c in climbs_in_course)
-        longest_climb = max(c["climb"].length_miles for c in climbs_in_course)
+    lines.append("📋 Course-Specific Training Schedule:")
+    for course_name, indices in partition["by_course"].items():
+        course_rows = table[indices]
+        total_climbing = int(course_rows["gain"].sum())
+        longest_climb = course_rows["length"].max()
+
+        lines.append(f"   {course_name}:")
+        lines.append(f"     • Total climbing volume: {total_climbing:,} ft")
+        lines.append(f"     • Longest single climb: {longest_climb:.1f} miles")
+        lines.append(f"     • Training focus: {get_training_focus(course_rows)}")
 
-        print(f"   {course_name}:")
-        print(f"     • Total climbing volume: {total_climbing:,} ft")
-        print(f"     • Longest single climb: {longest_climb:.1f} miles")
-        print(f"     • Training focus: {get_training_focus(climbs_in_course)}")
+    print("\n".join(lines))
 
 
 def generate_climb_profiles(courses: List[Dict[str, Any]]):
     """Generate text-based elevation profiles for key climbs."""
-    print("📈 Climb Elevation Profiles")
-    print("-" * 70)
+    lines = ["📈 Climb Elevation Profiles", "-" * 70]
 
     for course_data in courses:
         course = course_data["profile"]
         if not course.key_climbs:
             continue
 
-        print(f"{course_data['emoji']} {course_data['name']} - Key Climbs:")
-        print()
+        lines.append(f"{course_data['emoji']} {course_data['name']} - Key Climbs:")
+        lines.append("")
+
+        key_climbs = course.key_climbs[:2]  # Show top 2 climbs per course
 
-        for i, climb in enumerate(
-            course.key_climbs[:2], 1
-        ):  # Show top 2 climbs per course
-            print(f"  Climb {i}: {climb.name}")
-            print(
+        # Generate simple text-based profiles for all shown climbs at once
+        profiles = _profile_for_grades(
+            np.fromiter((c.avg_grade for c in key_climbs), float, count=len(key_climbs))
+        )
+
+        for i, (climb, profile) in enumerate(zip(key_climbs, profiles), 1):
+            lines.append(f"  Climb {i}: {climb.name}")
+            lines.append(
                 f"  Length: {climb.length_miles:.1f} mi | Grade: {climb.avg_grade:.1f}% avg, {climb.max_grade:.1f}% max"
             )
+            lines.append(f"  Profile: {profile}")
+            lines.append("")
 
-            # Generate simple text-based profile
-            profile = generate_text_profile(climb)
-            print(f"  Profile: {profile}")
-            print()
+    print("\n".join(lines))
 
 
 # Helper functions
 
 
-def categorize_climb(climb: ClimbSegment) -> str:
-    """Categorize climb using cycling standards."""
-    points = calculate_climb_points(climb)
-
-    if points >= 1600:
-        return "HC"  # Hors Catégorie
-    elif points >= 800:
-        return "1"
-    elif points >= 400:
-        return "2"
-    elif points >= 200:
-        return "3"
-    elif points >= 100:
-        return "4"
-    else:
-        return "Uncategorized"
-
+def categorize_climbs_vec(points_arr: np.ndarray) -> np.ndarray:
+    """Categorize climbs from an array of difficulty points in one pass.
 
-def calculate_climb_points(climb: ClimbSegment) -> float:
-    """Calculate climb difficulty points."""
-    # Simplified FIETS-style calculation
-    return (
-        climb.elevation_gain_ft
-        * (climb.avg_grade / 100)
-        * math.sqrt(climb.length_miles)
-    )
+    np.digitize places each value in the bin with bins[i-1] <= x < bins[i],
+    matching the ``>=`` thresholds of the cycling categories (HC at 1600+).
+    """
+    return _CATS[np.digitize(points_arr, _POINT_BINS)]
 
 
 def get_category_emoji(category: str) -> str:
     """Get emoji for climb category."""
-    emojis = {
-        "HC": "🏆",
-        "1": "🥇",
-        "2": "🥈",
-        "3": "🥉",
-        "4": "🎯",
-        "Uncategorized": "⚪",
-    }
-    return emojis.get(category, "⚪")
-
-
-def calculate_fiets_score(climb: ClimbSegment) -> float:
-    """Calculate FIETS difficulty score."""
-    return (
-        (climb.elevation_gain_ft / 3.281)
-        * (climb.avg_grade / 100) ** 2
-        * climb.length_miles
-        * 1.609
-    )
-
-
-def calculate_relative_difficulty(climb: ClimbSegment) -> float:
-    """Calculate relative difficulty on 1-10 scale."""
-    # Normalize based on typical climb ranges
-    base_score = (
-        (climb.avg_grade / 20) * 5
-        + (climb.length_miles / 10) * 3
-        + (climb.elevation_gain_ft / 3000) * 2
-    )
-    return min(base_score, 10.0)
-
-
-def calculate_vam_estimate(climb: ClimbSegment) -> float:
-    """Calculate estimated VAM (Vertical Ascent Meters per hour)."""
-    # Simplified estimate based on grade and length
-    base_vam = 1200 - (climb.avg_grade - 6) * 50  # Decrease VAM with steeper grades
-    return max(base_vam, 800)  # Minimum realistic VAM
-
-
-def estimate_climbing_power(
-    climb: ClimbSegment, effort_level: str = "moderate"
-) -> float:
-    """Estimate power required for climb (70kg cyclist)."""
-    # Simplified power calculation
-    base_power_per_grade = {"easy": 35, "moderate": 45, "hard": 55}  # Watts per % grade
-
-    power_per_grade = base_power_per_grade.get(effort_level, 45)
-    estimated_power = 150 + (
-        climb.avg_grade * power_per_grade
-    )  # Base power + gradient component
-
-    return estimated_power
-
-
-def estimate_climb_time(climb: ClimbSegment, effort_level: str = "moderate") -> float:
-    """Estimate time to complete climb in minutes."""
-    # Simplified speed calculation based on grade
-    speed_mph = {
-        "easy": 12 - climb.avg_grade * 0.4,
-        "moderate": 15 - climb.avg_grade * 0.5,
-        "hard": 18 - climb.avg_grade * 0.6,
-    }
-
-    speed = max(
-        speed_mph.get(effort_level, 15 - climb.avg_grade * 0.5), 4.0
-    )  # Minimum 4 mph
-    time_hours = climb.length_miles / speed
+    return CATEGORY_EMOJIS.get(category, "⚪")
 
-    return time_hours * 60  # Convert to minutes
 
-
-def determine_pacing_strategy(climb: ClimbSegment) -> Dict[str, Any]:
+def determine_pacing_strategy(climb: "ClimbSegment") -> Dict[str, Any]:
     """Determine optimal pacing strategy for a climb."""
     if climb.length_miles < 0.5:
         # Short climb - power strategy
@@ -561,57 +647,29 @@ def determine_pacing_strategy(climb: ClimbSegment) -> Dict[str, Any]:
         }
 
 
-def compare_climb_group(climb_group: List[Dict[str, Any]], focus_area: str):
-    """Compare a group of similar climbs."""
-    print(f"    Focus Area: {focus_area}")
-    for climb_data in climb_group:
-        climb = climb_data["climb"]
-        course = climb_data["course_name"]
-        emoji = climb_data["course_emoji"]
-
-        difficulty = calculate_relative_difficulty(climb)
-        print(f"    • {climb.name} ({emoji} {course})")
-        print(
-            f"      {climb.length_miles:.1f} mi, {climb.avg_grade:.1f}% avg, {climb.elevation_gain_ft:,} ft gain"
+def compare_climb_group(
+    indices: List[int],
+    climbs: List[ClimbRow],
+    cols: Dict[str, Any],
+    focus_area: str,
+) -> List[str]:
+    """Describe a group of similar climbs, given by table row index, as report lines."""
+    lines = [f"    Focus Area: {focus_area}"]
+    for i in indices:
+        climb, course, emoji = climbs[i]
+        lines.append(f"    • {climb.name} ({emoji} {course})")
+        lines.append(
+            f"      {cols['length'][i]} mi, {cols['grade'][i]}% avg, {cols['gain'][i]} ft gain"
         )
-        print(f"      Difficulty: {difficulty:.1f}/10")
-
-
-def analyze_climb_distribution(climbs: List[Dict[str, Any]]) -> Dict[str, int]:
-    """Analyze distribution of climb types."""
-    distribution = {"short_steep": 0, "long_moderate": 0, "variable": 0}
-
-    for climb_data in climbs:
-        climb = climb_data["climb"]
-
-        if climb.length_miles < 1.0 and climb.avg_grade > 8:
-            distribution["short_steep"] += 1
-        elif climb.length_miles > 2.0 and 4 <= climb.avg_grade <= 8:
-            distribution["long_moderate"] += 1
-        elif climb.max_grade > climb.avg_grade * 1.4:
-            distribution["variable"] += 1
+        lines.append(f"      Difficulty: {cols['rel_diff'][i]}/10")
 
-    return distribution
+    return lines
 
 
-def group_climbs_by_course(
-    climbs: List[Dict[str, Any]],
-) -> Dict[str, List[Dict[str, Any]]]:
-    """Group climbs by their course."""
-    grouped = {}
-    for climb_data in climbs:
-        course_name = climb_data["course_name"]
-        if course_name not in grouped:
-            grouped[course_name] = []
-        grouped[course_name].append(climb_data)
-
-    return grouped
-
-
-def get_training_focus(climbs: List[Dict[str, Any]]) -> str:
-    """Get training focus based on climb characteristics."""
-    total_elevation = sum(c["climb"].elevation_gain_ft for c in climbs)
-    avg_grade = sum(c["climb"].avg_grade for c in climbs) / len(climbs)
+def get_training_focus(course_rows: np.ndarray) -> str:
+    """Get training focus based on a course's climb table rows."""
+    total_elevation = course_rows["gain"].sum()
+    avg_grade = course_rows["grade"].mean()
 
     if avg_grade > 8:
         return "Power and VO2 max development"
@@ -621,15 +679,13 @@ def get_training_focus(climbs: List[Dict[str, Any]]) -> str:
         return "Tempo and threshold development"
 
 
-def generate_text_profile(climb: ClimbSegment) -> str:
-    """Generate a simple text-based elevation profile."""
-    # Create a simple ASCII-style profile
-    if climb.avg_grade < 4:
-        return "▁▂▃▄▃▂▁ (gentle)"
-    elif climb.avg_grade < 8:
-        return "▂▄▆█▆▄▂ (moderate)"
-    else:
-        return "▄██████▄ (steep)"
+def _profile_for_grades(grades: np.ndarray) -> np.ndarray:
+    """Pick a text elevation profile for each climb from its average grade."""
+    return np.select(
+        [grades < 4, grades < 8],
+        ["▁▂▃▄▃▂▁ (gentle)", "▂▄▆█▆▄▂ (moderate)"],
+        default="▄██████▄ (steep)",
+    )
 
 
 def format_time(minutes: float) -> str:
@@ -13,9 +13,16 @@ Dependencies:
     - src.models.course
 """
 
+import io
+import os
 import sys
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import List
+
+import numpy as np
 
 # Add src directory to path for imports
 current_dir = Path(__file__).parent
@@ -23,7 +30,27 @@ project_root = current_dir.parent
 sys.path.insert(0, str(project_root))
 
 from src.models.course import CourseProfile
+from src.utils.course_analyzer import elevation_rating_index
 from src.utils.gps_parser import GPSParser, GPSParserConfig
+from src.utils.grade_kernels import (
+    classify_climb_grades,
+    compute_grades,
+    elevation_gain_per_mile,
+)
+
+# One loaded example course and its display metadata
+Course = namedtuple("Course", ["name", "emoji", "filename", "profile"])
+
+# Table row layouts, compiled once and shared by the header and data rows
+_SUMMARY_ROW = "{0:<15} {1:<10} {2:<12} {3:<8} {4:<15}\n".format
+_PROFILE_ROW = "{0:<15} {1:<10} {2:<10} {3:<10} {4:<10} {5:<10}\n".format
+_QUALITY_ROW = "{0:<15} {1:<10} {2:<10} {3:<10} {4:<10}\n".format
+
+# Fetches the three per-climb maxima inputs in one C-level call
+_CLIMB_EXTREMES = attrgetter("max_grade", "length_miles", "elevation_gain_ft")
+
+# Labels for each elevation_rating_index bucket, easiest first
+_RATING_LABELS = ("Easy", "Moderate", "Hard", "Very Hard", "Extreme")
 
 
 def main():
@@ -56,7 +83,7 @@ def main():
     provide_course_recommendations(courses)
 
 
-def load_example_courses(parser: GPSParser) -> List[Dict[str, Any]]:
+def load_example_courses(parser: GPSParser) -> List[Course]:
     """Load all example GPX files and return course data."""
     gpx_dir = current_dir / "gpx"
 
@@ -71,85 +98,93 @@ def load_example_courses(parser: GPSParser) -> List[Dict[str, Any]]:
 
     print(f"Loading courses from: {gpx_dir}")
 
-    for filename, name, emoji in example_files:
-        file_path = gpx_dir / filename
-
-        if not file_path.exists():
-            print(f"⚠️  Skipping missing file: {filename}")
-            continue
-
-        try:
-            course_profile = parser.parse_gpx_file(str(file_path))
-            courses.append(
-                {
-                    "name": name,
-                    "emoji": emoji,
-                    "filename": filename,
-                    "profile": course_profile,
-                }
+    # One directory scan instead of a stat call per example file
+    try:
+        with os.scandir(gpx_dir) as entries:
+            present = {entry.name for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        present = set()
+    available = [entry for entry in example_files if entry[0] in present]
+
+    # GPX parsing is CPU-bound and independent per file, so parse the files in
+    # parallel. Results are reported in the original order to keep output stable.
+    with ProcessPoolExecutor(
+        max_workers=max(1, min(len(available), os.cpu_count() or 1))
+    ) as executor:
+        futures = {
+            filename: executor.submit(
+                parser.parse_gpx_file_cached, os.fspath(gpx_dir / filename)
             )
-            print(f"✅ Loaded: {name}")
+            for filename, _, _ in available
+        }
 
-        except Exception as e:
-            print(f"❌ Error loading {filename}: {e}")
+        for filename, name, emoji in example_files:
+            future = futures.get(filename)
+            if future is None:
+                print(f"⚠️  Skipping missing file: {filename}")
+                continue
+
+            try:
+                course_profile = future.result()
+                courses.append(Course(name, emoji, filename, course_profile))
+                print(f"✅ Loaded: {name}")
+
+            except Exception as e:
+                print(f"❌ Error loading {filename}: {e}")
 
     print(f"\nLoaded {len(courses)} courses for comparison\n")
     return courses
 
 
-def print_course_summary_table(courses: List[Dict[str, Any]]):
+def print_course_summary_table(courses: List[Course]):
     """Print a summary table comparing all courses."""
-    print("📋 Course Summary Comparison")
-    print("-" * 60)
+    rows = ["📋 Course Summary Comparison\n", "-" * 60 + "\n"]
 
     # Header
-    print(
-        f"{'Course':<15} {'Distance':<10} {'Elevation':<12} {'Climbs':<8} {'Rating':<15}"
-    )
-    print(f"{'=' * 15} {'=' * 10} {'=' * 12} {'=' * 8} {'=' * 15}")
+    rows.append(_SUMMARY_ROW("Course", "Distance", "Elevation", "Climbs", "Rating"))
+    rows.append(_SUMMARY_ROW("=" * 15, "=" * 10, "=" * 12, "=" * 8, "=" * 15))
 
     # Course data
-    for course_data in courses:
-        course = course_data["profile"]
-        name = f"{course_data['emoji']} {course_data['name']}"
+    for c in courses:
+        course = c.profile
+        name = f"{c.emoji} {c.name}"
         distance = f"{course.bike_distance_miles:.1f} mi"
         elevation = f"{course.bike_elevation_gain_ft:,} ft"
         climbs = str(len(course.key_climbs))
         rating = calculate_difficulty_rating(course)
 
-        print(f"{name:<15} {distance:<10} {elevation:<12} {climbs:<8} {rating:<15}")
+        rows.append(_SUMMARY_ROW(name, distance, elevation, climbs, rating))
 
+    sys.stdout.write("".join(rows))
 
-def compare_difficulty_profiles(courses: List[Dict[str, Any]]):
-    """Compare difficulty profiles across courses."""
-    print("⚖️  Difficulty Profile Analysis")
-    print("-" * 60)
 
+def compare_difficulty_profiles(courses: List[Course]):
+    """Compare difficulty profiles across courses."""
     # Calculate various difficulty metrics
     metrics = []
-    for course_data in courses:
-        course = course_data["profile"]
+    for c in courses:
+        course = c.profile
+        distance = course.bike_distance_miles
 
         # Calculate metrics
         elevation_per_mile = (
-            course.bike_elevation_gain_ft / course.bike_distance_miles
-            if course.bike_distance_miles > 0
-            else 0
-        )
-        steepest_climb = max(
-            (climb.max_grade for climb in course.key_climbs), default=0
-        )
-        longest_climb = max(
-            (climb.length_miles for climb in course.key_climbs), default=0
-        )
-        biggest_climb = max(
-            (climb.elevation_gain_ft for climb in course.key_climbs), default=0
+            course.bike_elevation_gain_ft / distance if distance > 0 else 0
         )
 
+        # Track all three climb maxima in one pass; only positive values are shown
+        steepest_climb = longest_climb = biggest_climb = 0
+        for max_grade, length, gain in map(_CLIMB_EXTREMES, course.key_climbs):
+            if max_grade > steepest_climb:
+                steepest_climb = max_grade
+            if length > longest_climb:
+                longest_climb = length
+            if gain > biggest_climb:
+                biggest_climb = gain
+
         metrics.append(
             {
-                "name": course_data["name"],
-                "emoji": course_data["emoji"],
+                "name": c.name,
+                "emoji": c.emoji,
                 "elevation_per_mile": elevation_per_mile,
                 "steepest_climb": steepest_climb,
                 "longest_climb": longest_climb,
@@ -159,10 +194,14 @@ def compare_difficulty_profiles(courses: List[Dict[str, Any]]):
         )
 
     # Print metrics
-    print(
-        f"{'Course':<15} {'Elev/Mile':<10} {'Steepest':<10} {'Longest':<10} {'Biggest':<10} {'Altitude':<10}"
-    )
-    print(f"{'=' * 15} {'=' * 10} {'=' * 10} {'=' * 10} {'=' * 10} {'=' * 10}")
+    rows = [
+        "⚖️  Difficulty Profile Analysis\n",
+        "-" * 60 + "\n",
+        _PROFILE_ROW(
+            "Course", "Elev/Mile", "Steepest", "Longest", "Biggest", "Altitude"
+        ),
+        _PROFILE_ROW("=" * 15, "=" * 10, "=" * 10, "=" * 10, "=" * 10, "=" * 10),
+    ]
 
     for m in metrics:
         name = f"{m['emoji']} {m['name']}"
@@ -172,117 +211,117 @@ def compare_difficulty_profiles(courses: List[Dict[str, Any]]):
         biggest = f"{m['biggest_climb']:,} ft" if m["biggest_climb"] > 0 else "None"
         altitude = f"{m['altitude']:,} ft"
 
-        print(
-            f"{name:<15} {elev_per_mile:<10} {steepest:<10} {longest:<10} {biggest:<10} {altitude:<10}"
+        rows.append(
+            _PROFILE_ROW(name, elev_per_mile, steepest, longest, biggest, altitude)
         )
 
+    sys.stdout.write("".join(rows))
 
-def compare_climb_statistics(courses: List[Dict[str, Any]]):
+
+def compare_climb_statistics(courses: List[Course]):
     """Compare climbing statistics across courses."""
-    print("🏔️  Climb Statistics Comparison")
-    print("-" * 60)
+    buf = io.StringIO()
+    w = buf.write
+
+    w("🏔️  Climb Statistics Comparison\n")
+    w("-" * 60 + "\n")
 
-    for course_data in courses:
-        course = course_data["profile"]
-        name = f"{course_data['emoji']} {course_data['name']}"
+    for c in courses:
+        course = c.profile
+        name = f"{c.emoji} {c.name}"
 
-        print(f"{name}:")
+        w(f"{name}:\n")
         if not course.key_climbs:
-            print("   No significant climbs detected")
+            w("   No significant climbs detected\n")
         else:
-            total_climb_distance = sum(
-                climb.length_miles for climb in course.key_climbs
+            # Pull climb lengths and grades into arrays once per course and
+            # reuse them for the totals and the grade buckets
+            n_climbs = len(course.key_climbs)
+            lengths = np.fromiter(
+                (climb.length_miles for climb in course.key_climbs),
+                dtype=np.float64,
+                count=n_climbs,
             )
-            avg_climb_grade = sum(climb.avg_grade for climb in course.key_climbs) / len(
-                course.key_climbs
+            grades = np.fromiter(
+                (climb.avg_grade for climb in course.key_climbs),
+                dtype=np.float64,
+                count=n_climbs,
             )
+            total_climb_distance = lengths.sum()
+            avg_climb_grade = grades.mean()
+            easy_climbs, moderate_climbs, hard_climbs = classify_climb_grades(grades)
 
-            print(f"   Total Climbs: {len(course.key_climbs)}")
-            print(f"   Total Climb Distance: {total_climb_distance:.1f} miles")
-            print(f"   Average Climb Grade: {avg_climb_grade:.1f}%")
+            w(f"   Total Climbs: {n_climbs}\n")
+            w(f"   Total Climb Distance: {total_climb_distance:.1f} miles\n")
+            w(f"   Average Climb Grade: {avg_climb_grade:.1f}%\n")
 
             # Grade distribution
-            grades = [climb.avg_grade for climb in course.key_climbs]
-            easy_climbs = len([g for g in grades if g < 6])
-            moderate_climbs = len([g for g in grades if 6 <= g < 10])
-            hard_climbs = len([g for g in grades if g >= 10])
-
             if easy_climbs > 0:
-                print(f"   Easy Climbs (<6%): {easy_climbs}")
+                w(f"   Easy Climbs (<6%): {easy_climbs}\n")
             if moderate_climbs > 0:
-                print(f"   Moderate Climbs (6-10%): {moderate_climbs}")
+                w(f"   Moderate Climbs (6-10%): {moderate_climbs}\n")
             if hard_climbs > 0:
-                print(f"   Hard Climbs (>10%): {hard_climbs}")
-        print()
+                w(f"   Hard Climbs (>10%): {hard_climbs}\n")
+        w("\n")
+
+    sys.stdout.write(buf.getvalue())
 
 
-def analyze_elevation_profiles(courses: List[Dict[str, Any]]):
+def analyze_elevation_profiles(courses: List[Course]):
     """Analyze elevation profile characteristics."""
-    print("📈 Elevation Profile Analysis")
-    print("-" * 60)
+    buf = io.StringIO()
+    w = buf.write
+
+    w("📈 Elevation Profile Analysis\n")
+    w("-" * 60 + "\n")
 
-    for course_data in courses:
-        course = course_data["profile"]
-        name = f"{course_data['emoji']} {course_data['name']}"
+    for c in courses:
+        course = c.profile
+        name = f"{c.emoji} {c.name}"
 
-        print(f"{name}:")
+        w(f"{name}:\n")
 
         if course.elevation_profile:
-            # Analyze elevation data
-            elevations = [point.elevation_ft for point in course.elevation_profile]
-            min_elev = min(elevations)
-            max_elev = max(elevations)
+            # Analyze elevation data as contiguous columns
+            dist, elev = course.elevation_arrays()
+            min_elev = elev.min()
+            max_elev = elev.max()
             elev_range = max_elev - min_elev
 
-            print(
-                f"   Elevation Range: {min_elev:,} ft to {max_elev:,} ft ({elev_range:,} ft)"
+            w(
+                f"   Elevation Range: {min_elev:,} ft to {max_elev:,} ft ({elev_range:,} ft)\n"
             )
-            print(f"   Total GPS Points: {len(course.elevation_profile):,}")
-
-            # Calculate grade distribution
-            if len(course.elevation_profile) > 1:
-                grades = []
-                for i in range(1, len(course.elevation_profile)):
-                    prev_point = course.elevation_profile[i - 1]
-                    curr_point = course.elevation_profile[i]
-
-                    # Calculate distance between points (simplified)
-                    distance_miles = abs(
-                        curr_point.distance_miles - prev_point.distance_miles
-                    )
-                    if distance_miles > 0:
-                        elev_change = curr_point.elevation_ft - prev_point.elevation_ft
-                        grade = (elev_change / (distance_miles * 5280)) * 100
-                        grades.append(abs(grade))
-
-                if grades:
-                    avg_grade = sum(grades) / len(grades)
-                    max_grade = max(grades)
-                    steep_sections = len([g for g in grades if g > 8])
-
-                    print(f"   Average Grade: {avg_grade:.1f}%")
-                    print(f"   Maximum Grade: {max_grade:.1f}%")
-                    print(f"   Steep Sections (>8%): {steep_sections}")
+            w(f"   Total GPS Points: {elev.size:,}\n")
+
+            # Calculate grade distribution over the whole profile at once
+            if elev.size > 1:
+                grades = compute_grades(dist, elev)
+
+                if grades.size:
+                    w(f"   Average Grade: {grades.mean():.1f}%\n")
+                    w(f"   Maximum Grade: {grades.max():.1f}%\n")
+                    w(f"   Steep Sections (>8%): {int((grades > 8).sum())}\n")
         else:
-            print("   No elevation profile data available")
+            w("   No elevation profile data available\n")
 
-        print()
+        w("\n")
 
+    sys.stdout.write(buf.getvalue())
 
-def compare_data_quality(courses: List[Dict[str, Any]]):
-    """Compare GPS data quality across courses."""
-    print("📊 GPS Data Quality Comparison")
-    print("-" * 60)
 
-    print(
-        f"{'Course':<15} {'Points':<10} {'Quality':<10} {'Errors':<10} {'Missing':<10}"
-    )
-    print(f"{'=' * 15} {'=' * 10} {'=' * 10} {'=' * 10} {'=' * 10}")
+def compare_data_quality(courses: List[Course]):
+    """Compare GPS data quality across courses."""
+    rows = [
+        "📊 GPS Data Quality Comparison\n",
+        "-" * 60 + "\n",
+        _QUALITY_ROW("Course", "Points", "Quality", "Errors", "Missing"),
+        _QUALITY_ROW("=" * 15, "=" * 10, "=" * 10, "=" * 10, "=" * 10),
+    ]
 
-    for course_data in courses:
-        course = course_data["profile"]
+    for c in courses:
+        course = c.profile
         metadata = course.gps_metadata
-        name = f"{course_data['emoji']} {course_data['name']}"
+        name = f"{c.emoji} {c.name}"
 
         if metadata:
             points = f"{metadata.total_points:,}"
@@ -295,79 +334,75 @@ def compare_data_quality(courses: List[Dict[str, Any]]):
             errors = "N/A"
             missing = "N/A"
 
-        print(f"{name:<15} {points:<10} {quality:<10} {errors:<10} {missing:<10}")
+        rows.append(_QUALITY_ROW(name, points, quality, errors, missing))
+
+    sys.stdout.write("".join(rows))
 
 
-def provide_course_recommendations(courses: List[Dict[str, Any]]):
+def provide_course_recommendations(courses: List[Course]):
     """Provide recommendations based on course analysis."""
-    print("🎯 Course Recommendations")
-    print("-" * 60)
-
-    # Find courses with specific characteristics
-    easiest_course = min(
-        courses,
-        key=lambda x: (
-            x["profile"].bike_elevation_gain_ft / x["profile"].bike_distance_miles
-            if x["profile"].bike_distance_miles > 0
-            else float("inf")
-        ),
+    buf = io.StringIO()
+    w = buf.write
+
+    w("🎯 Course Recommendations\n")
+    w("-" * 60 + "\n")
+
+    # Find courses with specific characteristics from per-course metric arrays
+    n = len(courses)
+    profiles = [c.profile for c in courses]
+    gain = np.fromiter(
+        (p.bike_elevation_gain_ft for p in profiles), dtype=np.float64, count=n
     )
-    hardest_course = max(
-        courses,
-        key=lambda x: x["profile"].bike_elevation_gain_ft
-        / x["profile"].bike_distance_miles,
+    dist = np.fromiter(
+        (p.bike_distance_miles for p in profiles), dtype=np.float64, count=n
     )
-    most_climbs = max(courses, key=lambda x: len(x["profile"].key_climbs))
-    highest_altitude = max(courses, key=lambda x: x["profile"].altitude_ft)
-
-    print("🥉 Beginner-Friendly Course:")
-    print(
-        f"   {easiest_course['emoji']} {easiest_course['name']} - Good for first-time triathletes"
+    climbs = np.fromiter((len(p.key_climbs) for p in profiles), dtype=int, count=n)
+    altitude = np.fromiter((p.altitude_ft for p in profiles), dtype=int, count=n)
+
+    # Courses without a bike distance can't be the easiest or the hardest
+    easiest_course = courses[int(elevation_gain_per_mile(gain, dist).argmin())]
+    hardest_course = courses[int(elevation_gain_per_mile(gain, dist, -np.inf).argmax())]
+    most_climbs_idx = int(climbs.argmax())
+    most_climbs = courses[most_climbs_idx]
+    most_climbs_count = int(climbs[most_climbs_idx])
+    highest_altitude = courses[int(altitude.argmax())]
+
+    w("🥉 Beginner-Friendly Course:\n")
+    w(
+        f"   {easiest_course.emoji} {easiest_course.name} - Good for first-time triathletes\n"
     )
-    print()
+    w("\n")
 
-    print("🥇 Most Challenging Course:")
-    print(
-        f"   {hardest_course['emoji']} {hardest_course['name']} - For experienced athletes seeking a challenge"
+    w("🥇 Most Challenging Course:\n")
+    w(
+        f"   {hardest_course.emoji} {hardest_course.name} - For experienced athletes seeking a challenge\n"
     )
-    print()
+    w("\n")
 
-    print("🏔️  Best for Climb Training:")
-    print(
-        f"   {most_climbs['emoji']} {most_climbs['name']} - Most climbing opportunities ({len(most_climbs['profile'].key_climbs)} climbs)"
+    w("🏔️  Best for Climb Training:\n")
+    w(
+        f"   {most_climbs.emoji} {most_climbs.name} - Most climbing opportunities ({most_climbs_count} climbs)\n"
     )
-    print()
+    w("\n")
 
-    print("🏔️  High Altitude Training:")
-    print(
-        f"   {highest_altitude['emoji']} {highest_altitude['name']} - Altitude effects at {highest_altitude['profile'].altitude_ft:,} ft"
+    w("🏔️  High Altitude Training:\n")
+    w(
+        f"   {highest_altitude.emoji} {highest_altitude.name} - Altitude effects at {highest_altitude.profile.altitude_ft:,} ft\n"
     )
-    print()
+    w("\n")
+
+    w("💡 Training Tips:\n")
+    w("   • Start with flatter courses before progressing to hills\n")
+    w("   • Practice climbing on courses with moderate grades first\n")
+    w("   • Consider altitude acclimatization for high-elevation races\n")
+    w("   • Urban courses help practice technical handling and pacing\n")
 
-    print("💡 Training Tips:")
-    print("   • Start with flatter courses before progressing to hills")
-    print("   • Practice climbing on courses with moderate grades first")
-    print("   • Consider altitude acclimatization for high-elevation races")
-    print("   • Urban courses help practice technical handling and pacing")
+    sys.stdout.write(buf.getvalue())
 
 
 def calculate_difficulty_rating(course: CourseProfile) -> str:
     """Calculate difficulty rating for comparison."""
-    distance = course.bike_distance_miles
-    elevation_gain = course.bike_elevation_gain_ft
-
-    elevation_per_mile = elevation_gain / distance if distance > 0 else 0
-
-    if elevation_per_mile < 50:
-        return "Easy"
-    elif elevation_per_mile < 150:
-        return "Moderate"
-    elif elevation_per_mile < 300:
-        return "Hard"
-    elif elevation_per_mile < 500:
-        return "Very Hard"
-    else:
-        return "Extreme"
+    return _RATING_LABELS[elevation_rating_index(course)]
 
 
 if __name__ == "__main__":
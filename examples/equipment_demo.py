@@ -7,89 +7,91 @@ course and athlete scenarios. Shows bike setup, swim gear, and run equipment
 recommendations based on course profile, conditions, and athlete capabilities.
 """
 
+import io
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
 from src.models.athlete import AthleteProfile
 from src.models.conditions import RaceConditions
 from src.models.course import CourseProfile
 from src.utils.equipment_database import EquipmentDatabase
 
 
+def format_section_header(title):
+    """Format a section header as text ending in a newline"""
+    return f"\n{'=' * 60}\n{title.center(60)}\n{'=' * 60}\n"
+
+
+def format_subsection(title):
+    """Format a subsection heading as text ending in a newline"""
+    return f"\n{title}\n{'-' * len(title)}\n"
+
+
 def print_section_header(title):
     """Print a formatted section header"""
-    print(f"\n{'=' * 60}")
-    print(f"{title.center(60)}")
-    print(f"{'=' * 60}")
+    sys.stdout.write(format_section_header(title))
 
 
 def print_subsection(title):
     """Print a formatted subsection"""
-    print(f"\n{title}")
-    print("-" * len(title))
+    sys.stdout.write(format_subsection(title))
 
 
-def display_equipment_recommendations(db, course, athlete, conditions, scenario_name):
-    """Display equipment recommendations for a given scenario"""
+def render_equipment_recommendations(db, course, athlete, conditions, scenario_name):
+    """Render equipment recommendations for a given scenario as text"""
+    buf = io.StringIO()
+    w = buf.write
 
-    print_section_header(f"EQUIPMENT RECOMMENDATIONS: {scenario_name}")
+    w(format_section_header(f"EQUIPMENT RECOMMENDATIONS: {scenario_name}"))
+
+    # All database recommendations come from one shared course analysis
+    selection = db.recommend_all(course, athlete, conditions)
+    course_analysis = selection.course_analysis
+    gearing, wheels = selection.gearing, selection.wheels
+    wetsuit_decision, shoes = selection.wetsuit_decision, selection.shoes
 
     # Course and conditions summary
-    course_analysis = db.analyze_course_demands(course)
-    print(f"Course: {course.name}")
-    print(f"Bike Distance: {course.bike_distance_miles} miles")
-    print(
-        f"Bike Elevation: {course.bike_elevation_gain_ft} ft ({course_analysis['elevation_per_mile']} ft/mile)"
+    w(f"Course: {course.name}\n")
+    w(f"Bike Distance: {course.bike_distance_miles} miles\n")
+    w(
+        f"Bike Elevation: {course.bike_elevation_gain_ft} ft ({course_analysis['elevation_per_mile']} ft/mile)\n"
     )
-    print(
-        f"Course Type: {course_analysis['course_type']} ({course_analysis['climbing_demand']} climbing demand)"
+    w(
+        f"Course Type: {course_analysis['course_type']} ({course_analysis['climbing_demand']} climbing demand)\n"
     )
-    print(
-        f"Conditions: {conditions.temperature_f}°F, {conditions.wind_speed_mph} mph {conditions.wind_direction} wind"
+    w(
+        f"Conditions: {conditions.temperature_f}°F, {conditions.wind_speed_mph} mph {conditions.wind_direction} wind\n"
     )
-    print(
-        f"Athlete: {athlete.name} ({athlete.experience_level}, {athlete.ftp_watts}W FTP)"
+    w(
+        f"Athlete: {athlete.name} ({athlete.experience_level}, {athlete.ftp_watts}W FTP)\n"
     )
 
     # Bike setup recommendations
-    print_subsection("🚴 BIKE SETUP")
-    gearing, gearing_rationale = db.recommend_bike_gearing(course, athlete, conditions)
-    wheels, wheel_rationale = db.recommend_wheels(course, conditions)
-
-    print(f"Gearing: {gearing.upper()}")
-    print(f"Rationale: {gearing_rationale}")
-    print()
-    print(f"Wheels: {wheels.upper()}")
-    print(f"Rationale: {wheel_rationale}")
+    w(format_subsection("🚴 BIKE SETUP"))
+    w(f"Gearing: {gearing.upper()}\n")
+    w(f"Rationale: {selection.gearing_rationale}\n")
+    w("\n")
+    w(f"Wheels: {wheels.upper()}\n")
+    w(f"Rationale: {selection.wheel_rationale}\n")
 
     # Swim gear recommendations
-    print_subsection("🏊 SWIM GEAR")
-    wetsuit_decision, wetsuit_type, wetsuit_rationale = db.recommend_wetsuit_decision(
-        conditions, athlete
-    )
-
-    print(f"Wetsuit Decision: {wetsuit_decision.upper()}")
+    w(format_subsection("🏊 SWIM GEAR"))
+    w(f"Wetsuit Decision: {wetsuit_decision.upper()}\n")
     if wetsuit_decision == "wetsuit":
-        print(f"Wetsuit Type: {wetsuit_type.upper()}")
-    print(f"Rationale: {wetsuit_rationale}")
+        w(f"Wetsuit Type: {selection.wetsuit_type.upper()}\n")
+    w(f"Rationale: {selection.wetsuit_rationale}\n")
 
     # Run equipment recommendations
-    print_subsection("👟 RUN EQUIPMENT")
-    shoes, shoe_rationale = db.recommend_running_shoes(course, athlete)
-
-    print(f"Shoes: {shoes.upper()}")
-    print(f"Rationale: {shoe_rationale}")
+    w(format_subsection("👟 RUN EQUIPMENT"))
+    w(f"Shoes: {shoes.upper()}\n")
+    w(f"Rationale: {selection.shoe_rationale}\n")
 
     # Performance impact analysis
-    print_subsection("⚡ PERFORMANCE IMPACT")
-    equipment_changes = {
-        "gearing": gearing,
-        "wheels": wheels,
-        "wetsuit_decision": wetsuit_decision,
-        "shoes": shoes,
-    }
-    time_savings = db.estimate_time_savings(equipment_changes, course)
-    print(f"Estimated Time Savings: {time_savings}")
+    w(format_subsection("⚡ PERFORMANCE IMPACT"))
+    w(f"Estimated Time Savings: {selection.time_savings}\n")
 
     # Equipment priority ranking
-    print_subsection("🎯 EQUIPMENT PRIORITIES")
+    w(format_subsection("🎯 EQUIPMENT PRIORITIES"))
     priorities = []
 
     if course_analysis["climbing_demand"] == "high" and gearing == "compact":
@@ -112,7 +114,16 @@ def display_equipment_recommendations(db, course, athlete, conditions, scenario_
         priorities = ["Standard equipment setup appropriate for conditions"]
 
     for priority in priorities:
-        print(priority)
+        w(f"{priority}\n")
+
+    return buf.getvalue()
+
+
+def display_equipment_recommendations(db, course, athlete, conditions, scenario_name):
+    """Display equipment recommendations for a given scenario"""
+    sys.stdout.write(
+        render_equipment_recommendations(db, course, athlete, conditions, scenario_name)
+    )
 
 
 def main():
@@ -161,14 +172,6 @@ def main():
         humidity_percent=55,
     )
 
-    display_equipment_recommendations(
-        db,
-        hilly_course,
-        beginner_athlete,
-        moderate_conditions,
-        "Beginner on Hilly Course",
-    )
-
     # Scenario 2: Advanced athlete, flat course, windy conditions
     advanced_athlete = AthleteProfile(
         name="Mike Chen",
@@ -205,14 +208,6 @@ def main():
         humidity_percent=65,
     )
 
-    display_equipment_recommendations(
-        db,
-        flat_course,
-        advanced_athlete,
-        windy_conditions,
-        "Advanced Athlete in Windy Conditions",
-    )
-
     # Scenario 3: Intermediate athlete, cold water, rolling course
     intermediate_athlete = AthleteProfile(
         name="Lisa Rodriguez",
@@ -249,13 +244,40 @@ def main():
         humidity_percent=70,
     )
 
-    display_equipment_recommendations(
-        db,
-        rolling_course,
-        intermediate_athlete,
-        cold_conditions,
-        "Cold Water Swimming Conditions",
-    )
+    scenarios = [
+        (
+            db,
+            hilly_course,
+            beginner_athlete,
+            moderate_conditions,
+            "Beginner on Hilly Course",
+        ),
+        (
+            db,
+            flat_course,
+            advanced_athlete,
+            windy_conditions,
+            "Advanced Athlete in Windy Conditions",
+        ),
+        (
+            db,
+            rolling_course,
+            intermediate_athlete,
+            cold_conditions,
+            "Cold Water Swimming Conditions",
+        ),
+    ]
+
+    # Scenarios are independent, so render them concurrently and print the
+    # reports in scenario order
+    with ThreadPoolExecutor(max_workers=len(scenarios)) as executor:
+        reports = list(
+            executor.map(
+                lambda scenario: render_equipment_recommendations(*scenario),
+                scenarios,
+            )
+        )
+    sys.stdout.write("".join(reports))
 
     # Summary
     print_section_header("EQUIPMENT SYSTEM SUMMARY")
@@ -22,8 +22,18 @@ project_root = current_dir.parent
 sys.path.insert(0, str(project_root))
 
 from src.models.course import CourseProfile
+from src.utils.course_analyzer import elevation_rating_index
 from src.utils.gps_parser import GPSParser, GPSParserConfig
 
+# Labels for each elevation_rating_index bucket, easiest first
+_RATING_LABELS = (
+    "🟢 Easy (Flat)",
+    "🟡 Moderate (Rolling)",
+    "🟠 Hard (Hilly)",
+    "🔴 Very Hard (Mountainous)",
+    "⚫ Extreme (Alpine)",
+)
+
 
 def main():
     """Main demo function showing GPS parser usage."""
@@ -61,8 +71,8 @@ def main():
         print("-" * 40)
 
         try:
-            # Parse the GPX file
-            course_profile = parser.parse_gpx_file(str(file_path))
+            # Parse the GPX file (reused from the on-disk cache when unchanged)
+            course_profile = parser.parse_gpx_file_cached(str(file_path))
 
             # Display basic course information
             display_course_info(course_profile)
@@ -151,23 +161,7 @@ def display_key_climbs(climbs):
 
 def calculate_difficulty_rating(course: CourseProfile) -> str:
     """Calculate a simple difficulty rating for the course."""
-    distance = course.bike_distance_miles
-    elevation_gain = course.bike_elevation_gain_ft
-
-    # Calculate elevation gain per mile
-    elevation_per_mile = elevation_gain / distance if distance > 0 else 0
-
-    # Simple rating system
-    if elevation_per_mile < 50:
-        return "🟢 Easy (Flat)"
-    elif elevation_per_mile < 150:
-        return "🟡 Moderate (Rolling)"
-    elif elevation_per_mile < 300:
-        return "🟠 Hard (Hilly)"
-    elif elevation_per_mile < 500:
-        return "🔴 Very Hard (Mountainous)"
-    else:
-        return "⚫ Extreme (Alpine)"
+    return _RATING_LABELS[elevation_rating_index(course)]
 
 
 def classify_climb_difficulty(climb) -> str:
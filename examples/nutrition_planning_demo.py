@@ -12,34 +12,36 @@ Usage:
 
 import sys
 from pathlib import Path
+from typing import List
+
+import numpy as np
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.models.athlete import AthleteProfile
 from src.models.conditions import RaceConditions
-from src.pipelines.core_strategy import RaceStrategyPipeline
 from src.utils.course_loader import load_happy_valley_70_3_gps
 from src.utils.nutrition_calculator import NutritionCalculator
 
 
-def print_header(title: str):
-    """Print a formatted header"""
-    print(f"\n{'=' * 60}")
-    print(f"  {title}")
-    print(f"{'=' * 60}")
+def format_header(title: str) -> str:
+    """Return a formatted header"""
+    return f"\n{'=' * 60}\n  {title}\n{'=' * 60}\n"
 
 
-def print_section(title: str, content: str):
-    """Print a formatted section"""
-    print(f"\n🔸 {title}")
-    print("-" * 40)
-    print(content)
+def format_section(title: str, content: str) -> str:
+    """Return a formatted section"""
+    return f"\n🔸 {title}\n{'-' * 40}\n{content}\n"
 
 
 def demo_nutrition_calculator():
     """Demonstrate the NutritionCalculator utilities"""
-    print_header("NUTRITION CALCULATOR DEMO")
+    # Collect the demo's output and emit it with a single write
+    parts: List[str] = []
+    out = parts.append
+
+    out(format_header("NUTRITION CALCULATOR DEMO"))
 
     # Create test athlete and conditions
     athlete = AthleteProfile(
@@ -75,19 +77,24 @@ def demo_nutrition_calculator():
 
     calc = NutritionCalculator()
 
-    print(
+    out(
         f"Athlete: {athlete.name} ({athlete.weight_lbs} lbs, "
-        f"{athlete.experience_level})"
+        f"{athlete.experience_level})\n"
     )
-    print(f"Target Time: {athlete.target_finish_time}")
+    out(f"Target Time: {athlete.target_finish_time}\n")
 
-    # Compare hot vs cool conditions
-    hot_sweat = calc.calculate_sweat_rate(athlete, hot_conditions)
-    cool_sweat = calc.calculate_sweat_rate(athlete, cool_conditions)
+    # Evaluate hot and cool conditions together in one scenario sweep
+    sweep = calc.sweep_scenarios(
+        athlete.weight_lbs,
+        np.array([hot_conditions.temperature_f, cool_conditions.temperature_f]),
+        np.array([hot_conditions.humidity_percent, cool_conditions.humidity_percent]),
+    )
+    hot_sweat, cool_sweat = sweep.sweat_rate_oz_per_hour.tolist()
 
-    print_section(
-        "SWEAT RATE CALCULATIONS",
-        f"""
+    out(
+        format_section(
+            "SWEAT RATE CALCULATIONS",
+            f"""
 Hot Conditions (88°F, 75% humidity):
   Predicted Sweat Rate: {hot_sweat:.1f} oz/hour
 
@@ -96,6 +103,7 @@ Cool Conditions (68°F, 50% humidity):
 
 Difference: {hot_sweat - cool_sweat:.1f} oz/hour more in heat
 """,
+        )
     )
 
     # Carbohydrate needs
@@ -103,50 +111,66 @@ Difference: {hot_sweat - cool_sweat:.1f} oz/hour more in heat
     moderate_carbs = calc.calculate_carb_needs(race_duration, "moderate")
     high_carbs = calc.calculate_carb_needs(race_duration, "high")
 
-    print_section(
-        "CARBOHYDRATE RECOMMENDATIONS",
-        f"""
+    hot_sodium, cool_sodium = sweep.sodium_mg_per_hour.tolist()
+    hot_fluid, cool_fluid = sweep.fluid_oz_per_hour.tolist()
+    hot_pct = cool_pct = sweep.replacement_percentage
+
+    # Whole-race totals, rounded to integers in one pass for the sections below
+    per_hour = np.array(
+        [moderate_carbs, high_carbs, hot_sodium, cool_sodium, hot_fluid, cool_fluid]
+    )
+    (
+        moderate_carbs_total,
+        high_carbs_total,
+        hot_sodium_total,
+        cool_sodium_total,
+        hot_fluid_total,
+        cool_fluid_total,
+    ) = np.rint(per_hour * race_duration).astype(np.int64).tolist()
+
+    out(
+        format_section(
+            "CARBOHYDRATE RECOMMENDATIONS",
+            f"""
 Race Duration: {race_duration} hours
 
 Moderate Intensity: {moderate_carbs}g/hour
 High Intensity: {high_carbs}g/hour
 
-Total Carbs Needed: {moderate_carbs * race_duration:.0f}g - """
-        f"""{high_carbs * race_duration:.0f}g
+Total Carbs Needed: {moderate_carbs_total}g - {high_carbs_total}g
 """,
+        )
     )
 
     # Sodium calculations
-    hot_sodium = calc.calculate_sodium_needs(hot_sweat, hot_conditions, athlete)
-    cool_sodium = calc.calculate_sodium_needs(cool_sweat, cool_conditions, athlete)
-
-    print_section(
-        "SODIUM REQUIREMENTS",
-        f"""
+    out(
+        format_section(
+            "SODIUM REQUIREMENTS",
+            f"""
 Hot Conditions: {hot_sodium}mg/hour
 Cool Conditions: {cool_sodium}mg/hour
 
 Total Race Sodium:
-  Hot: {hot_sodium * race_duration:.0f}mg
-  Cool: {cool_sodium * race_duration:.0f}mg
+  Hot: {hot_sodium_total}mg
+  Cool: {cool_sodium_total}mg
 """,
+        )
     )
 
     # Fluid replacement
-    hot_fluid, hot_pct = calc.calculate_fluid_replacement(hot_sweat)
-    cool_fluid, cool_pct = calc.calculate_fluid_replacement(cool_sweat)
-
-    print_section(
-        "FLUID REPLACEMENT STRATEGY",
-        f"""
+    out(
+        format_section(
+            "FLUID REPLACEMENT STRATEGY",
+            f"""
 Hot Conditions:
   Target: {hot_fluid} oz/hour ({hot_pct:.0f}% of sweat loss)
-  Race Total: {hot_fluid * race_duration:.0f} oz
+  Race Total: {hot_fluid_total} oz
 
 Cool Conditions:
   Target: {cool_fluid} oz/hour ({cool_pct:.0f}% of sweat loss)
-  Race Total: {cool_fluid * race_duration:.0f} oz
+  Race Total: {cool_fluid_total} oz
 """,
+        )
     )
 
     # Hour-by-hour schedule
@@ -154,32 +178,43 @@ Cool Conditions:
         race_duration, moderate_carbs, hot_fluid, hot_sodium
     )
 
-    print_section(
-        "HOURLY NUTRITION SCHEDULE (Hot Day)",
-        f"""
+    num_hours = len(hot_schedule.carbs)
+    schedule_rows = "\n".join(
+        f"  {hour}  |    {carbs:2d}     |     {fluids:2d}      |     {sodium:3d}"
+        for hour, (carbs, fluids, sodium) in enumerate(
+            zip(
+                hot_schedule.carbs.tolist(),
+                hot_schedule.fluids.tolist(),
+                hot_schedule.sodium.tolist(),
+            ),
+            1,
+        )
+    )
+
+    out(
+        format_section(
+            "HOURLY NUTRITION SCHEDULE (Hot Day)",
+            f"""
 Hour | Carbs (g) | Fluids (oz) | Sodium (mg)
 -----|-----------|-------------|-------------
-  1  |    {hot_schedule["carbs"][0]:2d}     |     {hot_schedule["fluids"][0]:2d}      |     {hot_schedule["sodium"][0]:3d}
-  2  |    {hot_schedule["carbs"][1]:2d}     |     {hot_schedule["fluids"][1]:2d}      |     {hot_schedule["sodium"][1]:3d}
-  3  |    {hot_schedule["carbs"][2]:2d}     |     {hot_schedule["fluids"][2]:2d}      |     {hot_schedule["sodium"][2]:3d}
-  4  |    {hot_schedule["carbs"][3]:2d}     |     {hot_schedule["fluids"][3]:2d}      |     {hot_schedule["sodium"][3]:3d}
-  5  |    {hot_schedule["carbs"][4]:2d}     |     {hot_schedule["fluids"][4]:2d}      |     {hot_schedule["sodium"][4]:3d}
-  6  |    {hot_schedule["carbs"][5]:2d}     |     {hot_schedule["fluids"][5]:2d}      |     {hot_schedule["sodium"][5]:3d}
+{schedule_rows}
 
 Notes:
 - Hour 1 is reduced due to race start nerves
-- Hour 6 is partial hour based on {race_duration} total race time
-- Maintain consistent intake hours 2-5 for best performance
+- Hour {num_hours} is partial hour based on {race_duration} total race time
+- Maintain consistent intake hours 2-{num_hours - 1} for best performance
 """,
+        )
     )
 
     # Environmental risk assessment
     hot_risks = calc.assess_environmental_risk(hot_conditions)
     cool_risks = calc.assess_environmental_risk(cool_conditions)
 
-    print_section(
-        "ENVIRONMENTAL RISK ASSESSMENT",
-        f"""
+    out(
+        format_section(
+            "ENVIRONMENTAL RISK ASSESSMENT",
+            f"""
 Hot Day Risks:
   Heat Risk: {hot_risks["heat"]}
   Humidity Risk: {hot_risks["humidity"]}
@@ -188,19 +223,26 @@ Cool Day Risks:
   Heat Risk: {cool_risks["heat"]}
   Humidity Risk: {cool_risks["humidity"]}
 """,
+        )
     )
 
+    sys.stdout.write("".join(parts))
+
 
 def demo_full_integration():
     """Demonstrate full nutrition integration with race strategy pipeline"""
-    print_header("FULL PIPELINE INTEGRATION DEMO")
+    # Collect the demo's output and emit it with a single write
+    parts: List[str] = []
+    out = parts.append
+
+    out(format_header("FULL PIPELINE INTEGRATION DEMO"))
 
     # Load a real course
     try:
         course = load_happy_valley_70_3_gps()
-        print(f"✅ Loaded course: {course.name}")
+        out(f"✅ Loaded course: {course.name}\n")
     except Exception as e:
-        print(f"⚠️  Could not load GPS course, using basic profile: {e}")
+        out(f"⚠️  Could not load GPS course, using basic profile: {e}\n")
         from src.models.course import CourseProfile
 
         course = CourseProfile(
@@ -240,22 +282,25 @@ def demo_full_integration():
         humidity_percent=68,
     )
 
-    print(f"Athlete: {athlete.name}")
-    print(f"Target Time: {athlete.target_finish_time}")
-    print(
-        f"Course: {course.name} ({course.bike_distance_miles} mi bike, +{course.bike_elevation_gain_ft}ft)"
+    out(f"Athlete: {athlete.name}\n")
+    out(f"Target Time: {athlete.target_finish_time}\n")
+    out(
+        f"Course: {course.name} ({course.bike_distance_miles} mi bike, +{course.bike_elevation_gain_ft}ft)\n"
     )
-    print(
-        f"Conditions: {conditions.temperature_f}°F, {conditions.humidity_percent}% humidity"
+    out(
+        f"Conditions: {conditions.temperature_f}°F, {conditions.humidity_percent}% humidity\n"
     )
 
     # Generate complete race strategy including nutrition
-    print("\n🔄 Generating comprehensive race strategy with nutrition...")
+    out("\n🔄 Generating comprehensive race strategy with nutrition...\n")
 
     try:
         # Note: This requires DSPy to be configured with an LLM
         # For demo purposes, we'll show the nutrition calculations only
-        pipeline = RaceStrategyPipeline()
+        # Deferred so the calculator-only demo never pays the DSPy import cost
+        from src.pipelines.core_strategy import get_pipeline
+
+        pipeline = get_pipeline()
         calc = pipeline.nutrition_calculator
 
         # Calculate nutrition requirements
@@ -273,20 +318,23 @@ def demo_full_integration():
 
         env_risks = calc.assess_environmental_risk(conditions)
 
-        print_section(
-            "CALCULATED NUTRITION REQUIREMENTS",
-            f"""
+        out(
+            format_section(
+                "CALCULATED NUTRITION REQUIREMENTS",
+                f"""
 Race Duration: {race_duration:.1f} hours (sub-5:00 goal)
 Sweat Rate: {sweat_rate:.1f} oz/hour (hot/humid conditions)
 Fluid Target: {fluid_per_hour} oz/hour ({replacement_pct:.0f}% replacement)
 Carbohydrate Target: {carbs_per_hour}g/hour (high intensity)
 Sodium Target: {sodium_per_hour}mg/hour
 """,
+            )
         )
 
-        print_section(
-            "RACE-SPECIFIC RECOMMENDATIONS",
-            f"""
+        out(
+            format_section(
+                "RACE-SPECIFIC RECOMMENDATIONS",
+                f"""
 Environmental Challenges:
   {env_risks["heat"]}
   {env_risks["humidity"]}
@@ -302,11 +350,13 @@ Course-Specific Notes:
   • Higher carb needs due to aggressive {athlete.target_finish_time} goal
   • Aid station strategy critical for hot day execution
 """,
+            )
         )
 
-        print_section(
-            "HOUR-BY-HOUR EXECUTION PLAN",
-            f"""
+        out(
+            format_section(
+                "HOUR-BY-HOUR EXECUTION PLAN",
+                f"""
 Pre-Race (T-3 hours):
   • Large meal with familiar carbs (600-800 calories)
   • Begin hydration protocol (16-20 oz/hour)
@@ -332,11 +382,13 @@ Hot Weather Adjustments:
   • Pour water over head/neck for cooling
   • Be flexible with carb sources if GI issues develop
 """,
+            )
         )
 
-        print_section(
-            "CONTINGENCY PLANS",
-            """
+        out(
+            format_section(
+                "CONTINGENCY PLANS",
+                """
 IF Overheating:
   • Reduce pace 5-10%
   • Increase cooling strategies (ice, water)
@@ -354,18 +406,23 @@ IF Cramping:
   • Stretch and massage affected areas
   • Consider additional electrolyte sources
 """,
+            )
         )
 
     except Exception as e:
-        print(f"⚠️  Pipeline requires DSPy LLM configuration: {e}")
-        print("   Showing nutrition calculations only for demo")
+        out(f"⚠️  Pipeline requires DSPy LLM configuration: {e}\n")
+        out("   Showing nutrition calculations only for demo\n")
+
+    sys.stdout.write("".join(parts))
 
 
 def main():
     """Run the nutrition planning demonstration"""
-    print("🏊‍♀️🚴‍♀️🏃‍♀️ TRIATHLON NUTRITION STRATEGY DEMO 🏃‍♀️🚴‍♀️🏊‍♀️")
-    print("This demo shows how the system generates personalized nutrition plans")
-    print("based on athlete physiology, race conditions, and course demands.")
+    sys.stdout.write(
+        "🏊‍♀️🚴‍♀️🏃‍♀️ TRIATHLON NUTRITION STRATEGY DEMO 🏃‍♀️🚴‍♀️🏊‍♀️\n"
+        "This demo shows how the system generates personalized nutrition plans\n"
+        "based on athlete physiology, race conditions, and course demands.\n"
+    )
 
     # Demo 1: Basic nutrition calculator
     demo_nutrition_calculator()
@@ -373,9 +430,9 @@ def main():
     # Demo 2: Full integration with race strategy
     demo_full_integration()
 
-    print_header("DEMO COMPLETE")
-    print(
-        """
+    sys.stdout.write(
+        format_header("DEMO COMPLETE")
+        + """
 This demonstration showed:
 ✅ Sweat rate calculations based on weight, temperature, and humidity
 ✅ Personalized carbohydrate recommendations by race duration and intensity
@@ -397,6 +454,7 @@ Key Features:
 
 For race day success, always practice your nutrition strategy during
 training and have backup plans ready!
+
 """
     )
 
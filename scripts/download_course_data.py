@@ -18,13 +18,66 @@ import requests
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 
 from src.models.course import CourseProfile
+from src.utils.course_serializer import course_profile_to_json_dict, save_course_json
+from src.utils.disk_cache import CACHE_DIR
 from src.utils.gps_parser import GPSParser
 
+# Happy Valley details the GPX track doesn't carry
+HAPPY_VALLEY_COURSE_INFO = {
+    "location": "Pennsylvania, USA",
+    "altitude_ft": 1200,  # Happy Valley elevation
+    "swim_venue": "Foster Joseph Sayers Lake",
+    "swim_type": "Lake swim",
+    "typical_water_temp_f": 68,
+    "bike_profile": "Rolling to hilly",
+    "run_profile": "Two loops with hills",
+    "run_surface": "Mixed road and wide pedestrian paths",
+    "surface_types": ["Asphalt", "Minor gravel sections"],
+    "swim_distance_miles": 1.2,
+    "run_distance_miles": 13.1,
+    "run_elevation_gain_ft": 206,
+    "source": "Ride with GPS",
+}
+
+# Shared session so repeated downloads reuse pooled keep-alive connections
+_session = requests.Session()
+
+
+def _load_cache_validators(sidecar_path: Path) -> dict:
+    """Build conditional request headers from a GPX file's validator sidecar"""
+    try:
+        validators = json.loads(sidecar_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+    headers = {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+    return headers
+
+
+def _save_cache_validators(sidecar_path: Path, response_headers) -> None:
+    """Record the ETag/Last-Modified of a downloaded GPX file next to it"""
+    validators = {
+        "etag": response_headers.get("ETag"),
+        "last_modified": response_headers.get("Last-Modified"),
+    }
+    if any(validators.values()):
+        sidecar_path.write_text(json.dumps(validators), encoding="utf-8")
+    else:
+        sidecar_path.unlink(missing_ok=True)
+
 
 def download_gpx_from_ridewithgps(route_id: str, output_path: str = None) -> str:
     """
     Download GPX file from Ride with GPS route
 
+    When output_path already holds an earlier download, the request is made
+    conditional on the ETag/Last-Modified recorded in ``<output_path>.etag``
+    and a 304 response reuses the existing file.
+
     Args:
         route_id: The route ID from the Ride with GPS URL
         output_path: Path to save the GPX file (optional)
@@ -37,16 +90,48 @@ def download_gpx_from_ridewithgps(route_id: str, output_path: str = None) -> str
 
     print(f"Downloading GPX from: {gpx_url}")
 
-    try:
-        response = requests.get(gpx_url)
-        response.raise_for_status()
-
-        # Use provided path or create temporary file
-        if output_path is None:
-            output_path = tempfile.mktemp(suffix=".gpx")
+    # Only revalidate when the previous download is still on disk
+    sidecar_path = Path(f"{output_path}.etag") if output_path else None
+    headers = {}
+    if sidecar_path is not None and os.path.exists(output_path):
+        headers = _load_cache_validators(sidecar_path)
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(response.text)
+    try:
+        with _session.get(
+            gpx_url, headers=headers, stream=True, timeout=(5, 30)
+        ) as response:
+            if response.status_code == 304:
+                print(f"✅ GPX file unchanged, reusing: {output_path}")
+                return output_path
+
+            response.raise_for_status()
+
+            # Use provided path or create temporary file
+            if output_path is None:
+                output_path = tempfile.mktemp(suffix=".gpx")
+
+            # The old validators no longer describe what will be on disk; drop
+            # them first so a failed transfer forces a full download next time
+            if sidecar_path is not None:
+                sidecar_path.unlink(missing_ok=True)
+
+            # Stream the raw bytes into a temp file next to the target and swap
+            # it in only once complete, so a failed transfer never truncates
+            # the previous download
+            fd, tmp_path = tempfile.mkstemp(dir=Path(output_path).parent, suffix=".tmp")
+            try:
+                # mkstemp creates owner-only files; downloads are meant to be shared
+                os.chmod(tmp_path, 0o644)
+                with os.fdopen(fd, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=65536):
+                        f.write(chunk)
+                os.replace(tmp_path, output_path)
+            except BaseException:
+                Path(tmp_path).unlink(missing_ok=True)
+                raise
+
+            if sidecar_path is not None:
+                _save_cache_validators(sidecar_path, response.headers)
 
         print(f"✅ GPX file saved to: {output_path}")
         return output_path
@@ -89,86 +174,6 @@ def parse_gpx_to_course_profile(
         raise Exception(f"Failed to parse GPX file: {e}") from e
 
 
-def course_profile_to_json_dict(course_profile: CourseProfile) -> dict:
-    """
-    Convert CourseProfile to JSON-serializable dictionary
-
-    Args:
-        course_profile: CourseProfile object
-
-    Returns:
-        Dictionary representation suitable for JSON serialization
-    """
-    # Convert ClimbSegment objects to dictionaries
-    key_climbs = []
-    for climb in course_profile.key_climbs:
-        key_climbs.append(
-            {
-                "name": climb.name,
-                "start_mile": climb.start_mile,
-                "length_miles": climb.length_miles,
-                "avg_grade": climb.avg_grade,
-                "max_grade": climb.max_grade,
-                "elevation_gain_ft": climb.elevation_gain_ft,
-            }
-        )
-
-    return {
-        "name": course_profile.name,
-        "location": "Pennsylvania, USA",
-        "bike_distance_miles": course_profile.bike_distance_miles,
-        "bike_elevation_gain_ft": course_profile.bike_elevation_gain_ft,
-        "swim_distance_miles": course_profile.swim_distance_miles,
-        "run_distance_miles": course_profile.run_distance_miles,
-        "run_elevation_gain_ft": course_profile.run_elevation_gain_ft,
-        "altitude_ft": 1200,  # Happy Valley elevation
-        "key_climbs": key_climbs,
-        "technical_sections": course_profile.technical_sections,
-        "surface_types": ["Asphalt", "Minor gravel sections"],
-        "race_details": {
-            "swim_venue": "Foster Joseph Sayers Lake",
-            "swim_type": "Lake swim",
-            "wetsuit_legal": True,
-            "typical_water_temp_f": 68,
-            "bike_profile": "Rolling to hilly",
-            "run_profile": "Two loops with hills",
-            "run_surface": "Mixed road and wide pedestrian paths",
-        },
-        "data_source": {
-            "type": "GPS Track",
-            "source": "Ride with GPS",
-            "route_id": "43480043",
-            "data_quality_score": (
-                course_profile.gps_metadata.data_quality_score
-                if course_profile.gps_metadata
-                else None
-            ),
-            "total_gps_points": (
-                course_profile.gps_metadata.total_points
-                if course_profile.gps_metadata
-                else None
-            ),
-        },
-    }
-
-
-def save_course_json(course_dict: dict, output_path: str):
-    """
-    Save course dictionary to JSON file with pretty formatting
-
-    Args:
-        course_dict: Course data dictionary
-        output_path: Path to save JSON file
-    """
-    # Ensure directory exists
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(course_dict, f, indent=2, ensure_ascii=False)
-
-    print(f"✅ Course JSON saved to: {output_path}")
-
-
 def create_realistic_course_profile() -> dict:
     """
     Create realistic Happy Valley 70.3 course profile based on known characteristics
@@ -282,7 +287,9 @@ def main():
 
     # Paths
     project_root = Path(__file__).parent.parent
-    gpx_output = project_root / "temp_course.gpx"
+    # Kept between runs so unchanged routes can be revalidated instead of
+    # downloaded again
+    gpx_output = CACHE_DIR / "ridewithgps" / f"{route_id}.gpx"
     json_output = (
         project_root / "src" / "data" / "courses" / "happy_valley_70_3_real.json"
     )
@@ -291,6 +298,7 @@ def main():
         # Step 1: Attempt to download GPX file
         print("\n📥 Step 1: Attempting to download GPX file from Ride with GPS...")
         try:
+            gpx_output.parent.mkdir(parents=True, exist_ok=True)
             gpx_path = download_gpx_from_ridewithgps(route_id, str(gpx_output))
 
             # Step 2: Parse GPX to CourseProfile
@@ -299,11 +307,10 @@ def main():
 
             # Step 3: Convert to JSON dictionary
             print("\n📊 Step 3: Converting to JSON format...")
-            course_dict = course_profile_to_json_dict(course_profile)
-
-            # Clean up temporary GPX file
-            if os.path.exists(gpx_path):
-                os.remove(gpx_path)
+            course_dict = course_profile_to_json_dict(
+                course_profile,
+                {**HAPPY_VALLEY_COURSE_INFO, "data_source": {"route_id": route_id}},
+            )
 
         except Exception as gpx_error:
             print(f"   ⚠️  GPX download failed: {gpx_error}")
@@ -314,7 +321,9 @@ def main():
 
         # Step 4: Save course JSON
         print("\n💾 Step 4: Saving course JSON...")
+        json_output.parent.mkdir(parents=True, exist_ok=True)
         save_course_json(course_dict, str(json_output))
+        print(f"✅ Course JSON saved to: {json_output}")
 
         # Step 5: Verification
         print("\n✅ SUCCESS! Happy Valley 70.3 course data processed!")
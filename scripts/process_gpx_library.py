@@ -6,177 +6,116 @@ This script processes a library of GPX files and converts them to standardized
 course JSON format for the race strategy optimizer.
 """
 
-import json
+import copy
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 # Add src to path
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 
-from src.models.course import CourseProfile
+from src.utils.course_serializer import course_profile_to_json_dict, save_course_json
 from src.utils.gps_parser import GPSParser
 
+# Course-specific metadata for known GPX files, built once at import
+_COURSE_CONFIGS: Dict[str, Dict] = {
+    "alpedhuez_triathlon.gpx": {
+        "name": "Alpe d'Huez Triathlon L",
+        "location": "French Alps, France",
+        "altitude_ft": 6000,
+        "swim_venue": "Lac du Verney",
+        "swim_type": "Mountain lake",
+        "typical_water_temp_f": 59,
+        "bike_profile": "Extreme mountain",
+        "run_profile": "Three loops at altitude",
+        "run_surface": "Mixed trail and road at 1800m altitude",
+        "surface_types": ["Mountain asphalt", "Some rough sections"],
+        "swim_distance_miles": 1.37,
+        "run_distance_miles": 11.8,
+        "run_elevation_gain_ft": 360,
+        "notes": "High altitude effects (1800m+), famous 21 switchbacks",
+    },
+    "im70.3_pennstate.gpx": {
+        "name": "Ironman 70.3 Happy Valley (GPS)",
+        "location": "Pennsylvania, USA",
+        "altitude_ft": 1200,
+        "swim_venue": "Foster Joseph Sayers Lake",
+        "swim_type": "Lake swim",
+        "typical_water_temp_f": 68,
+        "bike_profile": "Rolling to hilly with major climbs",
+        "run_profile": "Two loops with hills",
+        "run_surface": "Mixed road and wide pedestrian paths",
+        "surface_types": ["Asphalt", "Some rough road sections"],
+        "swim_distance_miles": 1.2,
+        "run_distance_miles": 13.1,
+        "run_elevation_gain_ft": 206,
+        "notes": "Point-to-point course with dual transitions",
+    },
+}
+
+# Metadata for GPX files without an entry above; the name is filled in per file
+_DEFAULT_COURSE_INFO: Dict = {
+    "location": "Unknown",
+    "altitude_ft": 0,
+    "swim_venue": "Unknown",
+    "swim_type": "Unknown",
+    "typical_water_temp_f": 68,
+    "bike_profile": "Unknown",
+    "run_profile": "Unknown",
+    "run_surface": "Unknown",
+    "surface_types": ["Unknown"],
+    "swim_distance_miles": 1.2,
+    "run_distance_miles": 13.1,
+    "run_elevation_gain_ft": 200,
+    "notes": "Processed from GPX file",
+}
+
 
 def get_course_info(gpx_filename: str) -> Dict[str, str]:
     """
     Get course-specific information based on GPX filename
 
+    Each call returns a fresh copy, so callers may modify it freely.
+
     Args:
         gpx_filename: Name of the GPX file
 
     Returns:
         Dictionary with course-specific metadata
     """
-    course_configs = {
-        "alpedhuez_triathlon.gpx": {
-            "name": "Alpe d'Huez Triathlon L",
-            "location": "French Alps, France",
-            "altitude_ft": 6000,
-            "swim_venue": "Lac du Verney",
-            "swim_type": "Mountain lake",
-            "typical_water_temp_f": 59,
-            "bike_profile": "Extreme mountain",
-            "run_profile": "Three loops at altitude",
-            "run_surface": "Mixed trail and road at 1800m altitude",
-            "surface_types": ["Mountain asphalt", "Some rough sections"],
-            "swim_distance_miles": 1.37,
-            "run_distance_miles": 11.8,
-            "run_elevation_gain_ft": 360,
-            "notes": "High altitude effects (1800m+), famous 21 switchbacks",
-        },
-        "im70.3_pennstate.gpx": {
-            "name": "Ironman 70.3 Happy Valley (GPS)",
-            "location": "Pennsylvania, USA",
-            "altitude_ft": 1200,
-            "swim_venue": "Foster Joseph Sayers Lake",
-            "swim_type": "Lake swim",
-            "typical_water_temp_f": 68,
-            "bike_profile": "Rolling to hilly with major climbs",
-            "run_profile": "Two loops with hills",
-            "run_surface": "Mixed road and wide pedestrian paths",
-            "surface_types": ["Asphalt", "Some rough road sections"],
-            "swim_distance_miles": 1.2,
-            "run_distance_miles": 13.1,
-            "run_elevation_gain_ft": 206,
-            "notes": "Point-to-point course with dual transitions",
-        },
-    }
-
-    return course_configs.get(
-        gpx_filename,
-        {
-            "name": Path(gpx_filename).stem.replace("_", " ").title(),
-            "location": "Unknown",
-            "altitude_ft": 0,
-            "swim_venue": "Unknown",
-            "swim_type": "Unknown",
-            "typical_water_temp_f": 68,
-            "bike_profile": "Unknown",
-            "run_profile": "Unknown",
-            "run_surface": "Unknown",
-            "surface_types": ["Unknown"],
-            "swim_distance_miles": 1.2,
-            "run_distance_miles": 13.1,
-            "run_elevation_gain_ft": 200,
-            "notes": "Processed from GPX file",
-        },
-    )
-
-
-def course_profile_to_json_dict(
-    course_profile: CourseProfile, course_info: Dict
-) -> dict:
-    """
-    Convert CourseProfile to JSON-serializable dictionary with course-specific metadata
-
-    Args:
-        course_profile: CourseProfile object
-        course_info: Course-specific metadata
-
-    Returns:
-        Dictionary representation suitable for JSON serialization
-    """
-    # Convert ClimbSegment objects to dictionaries
-    key_climbs = []
-    for climb in course_profile.key_climbs:
-        key_climbs.append(
-            {
-                "name": climb.name,
-                "start_mile": climb.start_mile,
-                "length_miles": climb.length_miles,
-                "avg_grade": climb.avg_grade,
-                "max_grade": climb.max_grade,
-                "elevation_gain_ft": climb.elevation_gain_ft,
-            }
-        )
+    course_info = _COURSE_CONFIGS.get(gpx_filename)
+    if course_info is not None:
+        # Deep copy so nested lists (surface_types) aren't shared either
+        return copy.deepcopy(course_info)
 
     return {
-        "name": course_info.get("name", course_profile.name),
-        "location": course_info.get("location", "Unknown"),
-        "bike_distance_miles": course_profile.bike_distance_miles,
-        "bike_elevation_gain_ft": course_profile.bike_elevation_gain_ft,
-        "swim_distance_miles": course_info.get("swim_distance_miles", 1.2),
-        "run_distance_miles": course_info.get("run_distance_miles", 13.1),
-        "run_elevation_gain_ft": course_info.get("run_elevation_gain_ft", 200),
-        "altitude_ft": course_info.get("altitude_ft", 0),
-        "key_climbs": key_climbs,
-        "technical_sections": course_profile.technical_sections,
-        "surface_types": course_info.get("surface_types", ["Asphalt"]),
-        "race_details": {
-            "swim_venue": course_info.get("swim_venue", "Unknown"),
-            "swim_type": course_info.get("swim_type", "Unknown"),
-            "wetsuit_legal": True,
-            "typical_water_temp_f": course_info.get("typical_water_temp_f", 68),
-            "bike_profile": course_info.get("bike_profile", "Unknown"),
-            "run_profile": course_info.get("run_profile", "Unknown"),
-            "run_surface": course_info.get("run_surface", "Unknown"),
-        },
-        "data_source": {
-            "type": "GPS Track",
-            "source": "Local GPX file",
-            "gpx_file": course_profile.gps_metadata.source_file
-            if course_profile.gps_metadata
-            else "Unknown",
-            "data_quality_score": course_profile.gps_metadata.data_quality_score
-            if course_profile.gps_metadata
-            else None,
-            "total_gps_points": course_profile.gps_metadata.total_points
-            if course_profile.gps_metadata
-            else None,
-            "parsed_at": course_profile.gps_metadata.parsed_at.isoformat()
-            if course_profile.gps_metadata
-            else None,
-        },
-        "notes": course_info.get("notes", ""),
+        "name": Path(gpx_filename).stem.replace("_", " ").title(),
+        **copy.deepcopy(_DEFAULT_COURSE_INFO),
     }
 
 
-def save_course_json(course_dict: dict, output_path: str):
-    """
-    Save course dictionary to JSON file with pretty formatting
+# Parser shared by every file a pool worker processes, set by _init_worker
+_parser: Optional[GPSParser] = None
 
-    Args:
-        course_dict: Course data dictionary
-        output_path: Path to save JSON file
-    """
-    # Ensure directory exists
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(course_dict, f, indent=2, ensure_ascii=False)
+def _init_worker():
+    """Build one GPSParser per worker process"""
+    global _parser
+    _parser = GPSParser()
 
-    print(f"✅ Course JSON saved to: {output_path}")
 
-
-def process_gpx_file(gpx_path: Path, output_dir: Path) -> bool:
+def process_gpx_file(
+    gpx_path: Path, output_dir: Path, parser: Optional[GPSParser] = None
+) -> bool:
     """
     Process a single GPX file and create corresponding course JSON
 
     Args:
         gpx_path: Path to GPX file
         output_dir: Directory to save course JSON
+        parser: Parser to reuse (defaults to the worker's shared parser)
 
     Returns:
         True if successful, False otherwise
@@ -187,9 +126,9 @@ def process_gpx_file(gpx_path: Path, output_dir: Path) -> bool:
         # Get course-specific information
         course_info = get_course_info(gpx_path.name)
 
-        # Parse GPX file
-        parser = GPSParser()
-        course_profile = parser.parse_gpx_file(str(gpx_path))
+        # Parse GPX file, reusing the cached profile if the file is unchanged
+        parser = parser or _parser or GPSParser()
+        course_profile = parser.parse_gpx_file_cached(str(gpx_path))
 
         # Override course name with configured name
         course_profile.name = course_info.get("name", course_profile.name)
@@ -208,6 +147,7 @@ def process_gpx_file(gpx_path: Path, output_dir: Path) -> bool:
 
         # Save course JSON
         save_course_json(course_dict, str(json_path))
+        print(f"✅ Course JSON saved to: {json_path}")
 
         return True
 
@@ -239,8 +179,14 @@ def process_gpx_library(data_dir: str = None, output_dir: str = None) -> List[st
     print(f"📂 Data directory: {data_path}")
     print(f"💾 Output directory: {output_path}")
 
-    # Find all GPX files
-    gpx_files = list(data_path.glob("*.gpx"))
+    # Find all GPX files; match the extension case-insensitively so *.GPX
+    # exports aren't skipped on case-sensitive filesystems. A missing data
+    # directory simply has no GPX files.
+    gpx_files = []
+    if data_path.is_dir():
+        gpx_files = sorted(
+            p for p in data_path.iterdir() if p.suffix.lower() == ".gpx" and p.is_file()
+        )
 
     if not gpx_files:
         print(f"\n❌ No GPX files found in {data_path}")
@@ -250,17 +196,33 @@ def process_gpx_library(data_dir: str = None, output_dir: str = None) -> List[st
     for gpx_file in gpx_files:
         print(f"   - {gpx_file.name}")
 
+    # Create the output directory once rather than per saved course
+    output_path.mkdir(parents=True, exist_ok=True)
+
     # Process each GPX file
     processed_courses = []
     successful = 0
     failed = 0
 
-    for gpx_file in gpx_files:
-        if process_gpx_file(gpx_file, output_path):
-            processed_courses.append(gpx_file.stem.lower().replace(" ", "_"))
-            successful += 1
-        else:
-            failed += 1
+    # Each file is parsed independently and parsing is CPU-bound, so spread the
+    # files across processes. Submit the largest files first so workers finish
+    # close together, then collect results in sorted file order.
+    with ProcessPoolExecutor(
+        max_workers=max(1, min(len(gpx_files), os.cpu_count() or 1)),
+        initializer=_init_worker,
+    ) as executor:
+        futures = {
+            gpx_file: executor.submit(process_gpx_file, gpx_file, output_path)
+            for gpx_file in sorted(
+                gpx_files, key=lambda p: p.stat().st_size, reverse=True
+            )
+        }
+        for gpx_file in gpx_files:
+            if futures[gpx_file].result():
+                processed_courses.append(gpx_file.stem.lower().replace(" ", "_"))
+                successful += 1
+            else:
+                failed += 1
 
     # Summary
     print("\n📊 Processing Summary:")
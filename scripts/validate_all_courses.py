@@ -17,25 +17,54 @@ Options:
     --min-quality FLOAT            Filter courses by minimum quality score (0.0-10.0)
     --show-valid                   Include valid courses in output
     --verbose                      Show detailed validation messages
+    --jobs N                       Number of worker processes (default: CPU count)
 """
 
 import argparse
 import datetime
 import json
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.utils.data_validator import DataQualityReport, DataValidator
-from src.utils.gps_parser import GPSParser, GPSParserConfig
+from src.utils.course_loader import COURSE_CACHE_VERSION, load_course_from_json
+from src.utils.data_validator import (
+    VALIDATOR_VERSION,
+    DataQualityReport,
+    DataValidator,
+    ValidationResult,
+)
+from src.utils.disk_cache import cached_call, content_cache_key
+from src.utils.gps_parser import PARSER_VERSION, GPSParser, GPSParserConfig
+
+# Column layout shared by the results table header and rows
+_TABLE_ROW = "{:<25} {:<6} {:<8} {:<8} {:<12} {}".format
+
+
+def _scan_files(directory: Path, suffix: str) -> Iterator[Path]:
+    """
+    Yield the regular files in a directory whose names end with ``suffix``.
+
+    os.scandir reports each entry's type from the directory listing itself, so
+    unlike Path.glob this needs no extra stat call per file.
+    """
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.endswith(suffix) and entry.is_file():
+                yield Path(entry.path)
 
 
 class CourseValidationRunner:
     """Orchestrates validation of all course data files."""
 
+    # Checks listed in the table's "Key Issues" column
+    TABLE_KEY_ISSUES = 3
+
     def __init__(self):
         self.validator = DataValidator()
         self.gps_parser = GPSParser(GPSParserConfig())
@@ -45,23 +74,28 @@ class CourseValidationRunner:
         self, gpx_only: bool = False, json_only: bool = False
     ) -> Dict[str, List[Path]]:
         """Find all course files in the repository."""
-        repo_root = Path(__file__).parent.parent
-
         files = {"gpx": [], "json": []}
+        for file_type, path in self.iter_course_files(gpx_only, json_only):
+            files[file_type.lower()].append(path)
+        return files
+
+    def iter_course_files(
+        self, gpx_only: bool = False, json_only: bool = False
+    ) -> Iterator[Tuple[str, Path]]:
+        """Lazily yield ``(file_type, path)`` for each course file, GPX files first."""
+        repo_root = Path(__file__).parent.parent
 
         if not json_only:
             # Find GPX files
             gpx_dir = repo_root / "examples" / "gpx"
             if gpx_dir.exists():
-                files["gpx"] = list(gpx_dir.glob("*.gpx"))
+                yield from (("GPX", path) for path in _scan_files(gpx_dir, ".gpx"))
 
         if not gpx_only:
             # Find JSON course files
             json_dir = repo_root / "src" / "data" / "courses"
             if json_dir.exists():
-                files["json"] = list(json_dir.glob("*.json"))
-
-        return files
+                yield from (("JSON", path) for path in _scan_files(json_dir, ".json"))
 
     def validate_gpx_file(self, gpx_path: Path) -> Tuple[str, DataQualityReport]:
         """Validate a GPX file and return its course profile and quality report."""
@@ -71,8 +105,6 @@ class CourseValidationRunner:
             return course.name or gpx_path.stem, report
         except Exception as e:
             # Create a failed report
-            from src.utils.data_validator import ValidationResult
-
             failed_report = DataQualityReport(
                 course_name=gpx_path.stem,
                 overall_score=0.0,
@@ -94,8 +126,6 @@ class CourseValidationRunner:
     def validate_json_file(self, json_path: Path) -> Tuple[str, DataQualityReport]:
         """Validate a JSON course file and return its quality report."""
         try:
-            from src.utils.course_loader import load_course_from_json
-
             # Use the proper course loader to handle elevation profile conversion
             # Pass just the course name without extension and the directory
             course_name = json_path.stem  # filename without extension
@@ -106,8 +136,6 @@ class CourseValidationRunner:
             return course.name, report
 
         except Exception as e:
-            from src.utils.data_validator import ValidationResult
-
             failed_report = DataQualityReport(
                 course_name=json_path.stem,
                 overall_score=0.0,
@@ -127,60 +155,119 @@ class CourseValidationRunner:
             return json_path.stem, failed_report
 
     def run_validation(
-        self, gpx_only: bool = False, json_only: bool = False, verbose: bool = False
+        self,
+        gpx_only: bool = False,
+        json_only: bool = False,
+        verbose: bool = False,
+        jobs: Optional[int] = None,
+        detail_limit: Optional[int] = None,
     ) -> None:
-        """Run validation on all course files."""
+        """
+        Run validation on all course files.
+
+        Args:
+            gpx_only: Validate only GPX files
+            json_only: Validate only JSON course files
+            verbose: Print each file as it is validated
+            jobs: Number of worker processes (default: CPU count). With a single
+                job, files are validated serially in this process.
+            detail_limit: Keep at most this many per-check results on each
+                report (default: all). Scores and counts are unaffected.
+        """
         print("🔍 Finding course files...")
-        files = self.find_course_files(gpx_only, json_only)
+        # Single scan straight into the task list handed to the validators
+        tasks = list(self.iter_course_files(gpx_only, json_only))
 
-        total_files = len(files["gpx"]) + len(files["json"])
+        total_files = len(tasks)
         if total_files == 0:
             print("❌ No course files found to validate.")
             return
 
+        gpx_count = sum(1 for file_type, _ in tasks if file_type == "GPX")
         print(
-            f"📊 Found {len(files['gpx'])} GPX files and {len(files['json'])} JSON files"
+            f"📊 Found {gpx_count} GPX files and {total_files - gpx_count} JSON files"
         )
         print("🚀 Starting validation...")
         print()
 
-        # Validate GPX files
-        for gpx_file in files["gpx"]:
-            if verbose:
-                print(f"  Validating GPX: {gpx_file.name}")
+        if verbose:
+            for file_type, path in tasks:
+                print(f"  Validating {file_type}: {path.name}")
+
+        jobs = min(jobs or os.cpu_count() or 1, total_files)
+        if jobs == 1:
+            self.results.extend(
+                self.validate_course_file(file_type, path, detail_limit)
+                for file_type, path in tasks
+            )
+        else:
+            # Files are validated independently, so spread them across
+            # processes. Hand out the largest files first so a big file picked
+            # up last doesn't leave the other workers idle, then collect the
+            # results in the original file order.
+            with ProcessPoolExecutor(
+                max_workers=jobs, initializer=_init_worker
+            ) as executor:
+                futures = {
+                    task: executor.submit(_validate_file, *task, detail_limit)
+                    for task in sorted(
+                        tasks, key=lambda task: _file_size(task[1]), reverse=True
+                    )
+                }
+                self.results.extend(futures[task].result() for task in tasks)
 
-            course_name, report = self.validate_gpx_file(gpx_file)
-            self.results.append((gpx_file.name, "GPX", report))
+        if verbose:
+            print()
 
-        # Validate JSON files
-        for json_file in files["json"]:
-            if verbose:
-                print(f"  Validating JSON: {json_file.name}")
+    def validate_course_file(
+        self, file_type: str, path: Path, detail_limit: Optional[int] = None
+    ) -> Tuple[str, str, DataQualityReport]:
+        """
+        Validate one course file and return its result row.
+
+        Reports are cached on disk keyed by a hash of the file's contents and
+        the validator, parser and loader versions, so unchanged files are not
+        parsed or validated again. Set CACHE_RESULTS=false to disable.
+
+        With ``detail_limit``, only the first per-check results are kept on the
+        returned report, so large runs don't hold (or ship back from worker
+        processes) details the chosen output format never shows.
+        """
+        if file_type == "GPX":
+            validate = self.validate_gpx_file
+            versions = (PARSER_VERSION, self.gps_parser.config)
+        else:
+            validate = self.validate_json_file
+            versions = (COURSE_CACHE_VERSION,)
 
-            course_name, report = self.validate_json_file(json_file)
-            self.results.append((json_file.name, "JSON", report))
+        try:
+            key = content_cache_key(path, file_type, VALIDATOR_VERSION, *versions)
+        except OSError:
+            # Let the validator report the unreadable file
+            _, report = validate(path)
+        else:
+            _, report = cached_call("validation_reports", key, lambda: validate(path))
 
-        if verbose:
-            print()
+        if detail_limit is not None:
+            del report.validation_results[detail_limit:]
+        return path.name, file_type, report
 
     def generate_summary(self) -> Dict:
         """Generate summary statistics from validation results."""
         total_courses = len(self.results)
-        valid_courses = sum(
-            1 for _, _, report in self.results if report.is_valid_for_strategy
-        )
-        invalid_courses = total_courses - valid_courses
 
-        total_issues = sum(
-            report.total_checks - report.passed_checks for _, _, report in self.results
-        )
-        critical_issues = sum(report.critical_failures for _, _, report in self.results)
+        # Accumulate every statistic in a single pass over the reports
+        valid_courses = total_issues = critical_issues = 0
+        score_total = 0
+        for _, _, report in self.results:
+            if report.is_valid_for_strategy:
+                valid_courses += 1
+            total_issues += report.total_checks - report.passed_checks
+            critical_issues += report.critical_failures
+            score_total += report.overall_score
+        invalid_courses = total_courses - valid_courses
 
-        avg_quality = (
-            sum(report.overall_score for _, _, report in self.results) / total_courses
-            if total_courses > 0
-            else 0
-        )
+        avg_quality = score_total / total_courses if total_courses > 0 else 0
 
         return {
             "timestamp": datetime.datetime.now().isoformat(),
@@ -199,8 +286,15 @@ class CourseValidationRunner:
         self, show_valid: bool = False, min_quality: Optional[float] = None
     ) -> str:
         """Format results as a table."""
+        return "\n".join(self.iter_table_lines(show_valid, min_quality))
+
+    def iter_table_lines(
+        self, show_valid: bool = False, min_quality: Optional[float] = None
+    ) -> Iterator[str]:
+        """Yield the results table line by line, so it can be written as it's built."""
         if not self.results:
-            return "No validation results available."
+            yield "No validation results available."
+            return
 
         # Filter results
         filtered_results = []
@@ -216,19 +310,17 @@ class CourseValidationRunner:
             filtered_results.append((filename, file_type, report))
 
         if not filtered_results:
-            return "No courses match the specified criteria."
+            yield "No courses match the specified criteria."
+            return
 
         # Build table
-        lines = []
-        lines.append("🏁 Course Data Validation Results")
-        lines.append("=" * 80)
-        lines.append("")
+        yield "🏁 Course Data Validation Results"
+        yield "=" * 80
+        yield ""
 
         # Header
-        lines.append(
-            f"{'File':<25} {'Type':<6} {'Quality':<8} {'Issues':<8} {'Status':<12} {'Key Issues'}"
-        )
-        lines.append("-" * 100)
+        yield _TABLE_ROW("File", "Type", "Quality", "Issues", "Status", "Key Issues")
+        yield "-" * 100
 
         # Results
         for filename, file_type, report in filtered_results:
@@ -241,41 +333,41 @@ class CourseValidationRunner:
             )
             quality_str = f"{report.overall_score:.1f}/100"
 
-            # Get key issues (up to 3)
+            # Get key issues (up to TABLE_KEY_ISSUES)
             key_issues = []
-            for result in report.validation_results[:3]:
+            for result in report.validation_results[: self.TABLE_KEY_ISSUES]:
                 if not result.passed:
                     check_name = result.check_name.replace("_", " ").title()
                     key_issues.append(f"{check_name}")
 
-            key_issues_str = ", ".join(key_issues[:3])
-            if len(report.validation_results) > 3:
+            key_issues_str = ", ".join(key_issues)
+            if len(report.validation_results) > self.TABLE_KEY_ISSUES:
                 key_issues_str += "..."
 
-            lines.append(
-                f"{filename:<25} {file_type:<6} {quality_str:<8} {issues_str:<8} {status:<12} {key_issues_str}"
+            yield _TABLE_ROW(
+                filename, file_type, quality_str, issues_str, status, key_issues_str
             )
 
-        lines.append("")
+        yield ""
 
         # Summary
         summary = self.generate_summary()
-        lines.append("📊 Summary:")
-        lines.append(f"  • Total courses: {summary['total_courses']}")
-        lines.append(
-            f"  • Valid courses: {summary['valid_courses']} ({summary['validation_pass_rate']}%)"
-        )
-        lines.append(
-            f"  • Total issues: {summary['total_issues']} ({summary['critical_issues']} critical)"
-        )
-        lines.append(f"  • Average quality: {summary['average_quality_score']}/100")
-
-        return "\n".join(lines)
+        yield "📊 Summary:"
+        yield f"  • Total courses: {summary['total_courses']}"
+        yield f"  • Valid courses: {summary['valid_courses']} ({summary['validation_pass_rate']}%)"
+        yield f"  • Total issues: {summary['total_issues']} ({summary['critical_issues']} critical)"
+        yield f"  • Average quality: {summary['average_quality_score']}/100"
 
     def format_json_output(
         self, show_valid: bool = False, min_quality: Optional[float] = None
     ) -> str:
         """Format results as JSON."""
+        return "".join(self.iter_json_output(show_valid, min_quality))
+
+    def iter_json_output(
+        self, show_valid: bool = False, min_quality: Optional[float] = None
+    ) -> Iterator[str]:
+        """Yield the JSON report in chunks, so it can be written as it's encoded."""
         # Filter results
         filtered_results = []
         for filename, file_type, report in self.results:
@@ -309,7 +401,8 @@ class CourseValidationRunner:
 
         output = {"summary": self.generate_summary(), "results": filtered_results}
 
-        return json.dumps(output, indent=2)
+        # Encode incrementally; joined, the chunks equal json.dumps(output, indent=2)
+        yield from json.JSONEncoder(indent=2).iterencode(output)
 
     def format_summary_output(self) -> str:
         """Format results as a brief summary."""
@@ -335,6 +428,38 @@ class CourseValidationRunner:
         return "\n".join(lines)
 
 
+# Runner for validation worker processes, created once per process
+_runner: Optional[CourseValidationRunner] = None
+
+
+def _init_worker() -> None:
+    """Create the runner a validation worker process reuses for its files."""
+    global _runner
+    _runner = CourseValidationRunner()
+
+
+def _validate_file(
+    file_type: str, path: Path, detail_limit: Optional[int] = None
+) -> Tuple[str, str, DataQualityReport]:
+    """Validate one course file in a worker process."""
+    runner = _runner or CourseValidationRunner()
+    return runner.validate_course_file(file_type, path, detail_limit)
+
+
+def _file_size(path: Path) -> int:
+    """Return a file's size in bytes, or 0 if it can't be read."""
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
+def _join_lines(lines: Iterator[str]) -> Iterator[str]:
+    """Lazily yield lines separated by newlines, like "\\n".join(lines)."""
+    for index, line in enumerate(lines):
+        yield f"\n{line}" if index else line
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Validate all course data files in the repository",
@@ -379,6 +504,13 @@ Examples:
         "--verbose", action="store_true", help="Show detailed validation messages"
     )
 
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of worker processes (default: CPU count, 1 = serial)",
+    )
+
     args = parser.parse_args()
 
     # Validate arguments
@@ -390,32 +522,51 @@ Examples:
         print("❌ Error: --min-quality must be between 0.0 and 10.0")
         sys.exit(1)
 
-    # Run validation
+    if args.jobs < 1:
+        print("❌ Error: --jobs must be at least 1")
+        sys.exit(1)
+
+    # Run validation, keeping only the per-check detail the output format shows:
+    # none for the summary, and for the table one more than its key issues so
+    # it can still tell when more were left out
+    detail_limits = {
+        "summary": 0,
+        "table": CourseValidationRunner.TABLE_KEY_ISSUES + 1,
+        "json": None,
+    }
     try:
         runner = CourseValidationRunner()
         runner.run_validation(
-            gpx_only=args.gpx_only, json_only=args.json_only, verbose=args.verbose
+            gpx_only=args.gpx_only,
+            json_only=args.json_only,
+            verbose=args.verbose,
+            jobs=args.jobs,
+            detail_limit=detail_limits[args.format],
         )
 
-        # Generate output
+        # Generate output as a stream of chunks so large reports are written
+        # while they're still being formatted
         if args.format == "json":
-            output = runner.format_json_output(
+            chunks = runner.iter_json_output(
                 show_valid=args.show_valid, min_quality=args.min_quality
             )
         elif args.format == "summary":
-            output = runner.format_summary_output()
+            chunks = iter([runner.format_summary_output()])
         else:  # table
-            output = runner.format_table_output(
-                show_valid=args.show_valid, min_quality=args.min_quality
+            chunks = _join_lines(
+                runner.iter_table_lines(
+                    show_valid=args.show_valid, min_quality=args.min_quality
+                )
             )
 
         # Output results
         if args.output:
             with open(args.output, "w") as f:
-                f.write(output)
+                f.writelines(chunks)
             print(f"✅ Report saved to {args.output}")
         else:
-            print(output)
+            sys.stdout.writelines(chunks)
+            sys.stdout.write("\n")
 
     except KeyboardInterrupt:
         print("\n❌ Validation interrupted by user")
@@ -1,10 +1,12 @@
 # src/models/course.py
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import List, Optional, Tuple
 
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True)
 class GPSPoint:
     """Individual GPS data point with coordinates and elevation"""
 
@@ -15,7 +17,49 @@ class GPSPoint:
     gradient_percent: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
+class TrackArrays:
+    """Column-wise view of an elevation profile, one float64 array per field"""
+
+    latitude: np.ndarray
+    longitude: np.ndarray
+    elevation_ft: np.ndarray
+    distance_miles: np.ndarray
+    gradient_percent: np.ndarray  # NaN where a point has no gradient
+
+    def __len__(self) -> int:
+        return len(self.distance_miles)
+
+    @classmethod
+    def from_points(cls, points: List[GPSPoint]) -> "TrackArrays":
+        """Build the arrays from a list of GPS points"""
+        n_points = len(points)
+
+        def column(attr: str) -> np.ndarray:
+            return np.fromiter(
+                (getattr(point, attr) for point in points),
+                dtype=np.float64,
+                count=n_points,
+            )
+
+        gradients = np.fromiter(
+            (
+                np.nan if point.gradient_percent is None else point.gradient_percent
+                for point in points
+            ),
+            dtype=np.float64,
+            count=n_points,
+        )
+        return cls(
+            latitude=column("latitude"),
+            longitude=column("longitude"),
+            elevation_ft=column("elevation_ft"),
+            distance_miles=column("distance_miles"),
+            gradient_percent=gradients,
+        )
+
+
+@dataclass(slots=True)
 class ClimbSegment:
     """Individual climb within a course"""
 
@@ -31,7 +75,32 @@ class ClimbSegment:
     gps_points: List[GPSPoint] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
+class ClimbArrays:
+    """Column-wise view of a course's key climbs, one array per field"""
+
+    names: List[str]
+    start_mile: np.ndarray
+    length_miles: np.ndarray
+    avg_grade: np.ndarray
+    max_grade: np.ndarray
+    elevation_gain_ft: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+@dataclass(slots=True, frozen=True)
+class CourseBounds:
+    """Latitude/longitude bounding box of a GPS track, in degrees"""
+
+    min_lat: float
+    max_lat: float
+    min_lon: float
+    max_lon: float
+
+
+@dataclass(slots=True)
 class GPSMetadata:
     """GPS data quality and source information"""
 
@@ -41,7 +110,7 @@ class GPSMetadata:
     data_quality_score: float = 0.0  # 0-100 scale
     smoothed: bool = False
     parsed_at: Optional[datetime] = None
-    bounds: Optional[Dict[str, float]] = None  # min/max lat/lon
+    bounds: Optional[CourseBounds] = None
 
     # Coordinate validation results
     invalid_latitude_points: int = 0
@@ -51,7 +120,7 @@ class GPSMetadata:
     total_validation_errors: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class AltitudeEffects:
     """High altitude effects and performance impact metadata"""
 
@@ -64,7 +133,7 @@ class AltitudeEffects:
     hydration_multiplier: float = 1.0
 
 
-@dataclass
+@dataclass(slots=True)
 class CourseProfile:
     """Complete race course profile"""
 
@@ -113,3 +182,39 @@ class CourseProfile:
         else:
             # For mixed or unknown, return the larger of the two
             return max(self.bike_elevation_gain_ft, self.run_elevation_gain_ft)
+
+    def elevation_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the elevation profile as (distance_miles, elevation_ft) arrays"""
+        n_points = len(self.elevation_profile)
+        distances = np.fromiter(
+            (point.distance_miles for point in self.elevation_profile),
+            dtype=np.float64,
+            count=n_points,
+        )
+        elevations = np.fromiter(
+            (point.elevation_ft for point in self.elevation_profile),
+            dtype=np.float64,
+            count=n_points,
+        )
+        return distances, elevations
+
+    def climb_arrays(self) -> ClimbArrays:
+        """Get the key climbs as per-field float64 arrays for numeric filtering"""
+        climbs = self.key_climbs
+        n_climbs = len(climbs)
+
+        def column(attr: str) -> np.ndarray:
+            return np.fromiter(
+                (getattr(climb, attr) for climb in climbs),
+                dtype=np.float64,
+                count=n_climbs,
+            )
+
+        return ClimbArrays(
+            names=[climb.name for climb in climbs],
+            start_mile=column("start_mile"),
+            length_miles=column("length_miles"),
+            avg_grade=column("avg_grade"),
+            max_grade=column("max_grade"),
+            elevation_gain_ft=column("elevation_gain_ft"),
+        )
@@ -9,7 +9,7 @@ from dataclasses import dataclass
 from typing import List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class BikeSetup:
     """Bike configuration recommendations"""
 
@@ -23,7 +23,7 @@ class BikeSetup:
     accessories: Optional[List[str]] = None  # Additional bike accessories
 
 
-@dataclass
+@dataclass(slots=True)
 class SwimGear:
     """Swimming equipment recommendations"""
 
@@ -36,7 +36,7 @@ class SwimGear:
     accessories: Optional[List[str]] = None  # Additional swim accessories
 
 
-@dataclass
+@dataclass(slots=True)
 class RunEquipment:
     """Running gear recommendations"""
 
@@ -48,7 +48,7 @@ class RunEquipment:
     fuel_carrying: Optional[str] = None  # How to carry nutrition
 
 
-@dataclass
+@dataclass(slots=True)
 class AccessoryRecommendations:
     """Race accessories and tools"""
 
@@ -58,7 +58,7 @@ class AccessoryRecommendations:
     other_gear: Optional[List[str]] = None  # Other helpful accessories
 
 
-@dataclass
+@dataclass(slots=True)
 class PerformanceImpact:
     """Expected performance benefits and costs"""
 
@@ -69,7 +69,7 @@ class PerformanceImpact:
     alternatives: Optional[str] = None  # Alternative equipment options
 
 
-@dataclass
+@dataclass(slots=True)
 class EquipmentRecommendations:
     """Complete equipment strategy for a race"""
 
@@ -88,7 +88,7 @@ class EquipmentRecommendations:
     notes: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EquipmentItem:
     """Individual equipment item with specifications"""
 
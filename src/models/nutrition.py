@@ -1,8 +1,10 @@
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True)
 class NutritionItem:
     """Individual nutrition item with timing and quantities"""
 
@@ -16,7 +18,7 @@ class NutritionItem:
     notes: Optional[str] = None  # Special instructions or alternatives
 
 
-@dataclass
+@dataclass(slots=True)
 class HydrationPlan:
     """Comprehensive hydration strategy for race day"""
 
@@ -29,7 +31,7 @@ class HydrationPlan:
     cool_weather_adjustments: Optional[str] = None  # Adjustments for cool conditions
 
 
-@dataclass
+@dataclass(slots=True)
 class FuelingSchedule:
     """Race fueling plan with carbohydrate and calorie timing"""
 
@@ -41,7 +43,7 @@ class FuelingSchedule:
     late_race_strategy: Optional[str] = None  # Adjustments for final portion
 
 
-@dataclass
+@dataclass(slots=True)
 class ElectrolyteStrategy:
     """Electrolyte replacement plan based on conditions and duration"""
 
@@ -53,7 +55,37 @@ class ElectrolyteStrategy:
     individual_adjustments: Optional[str] = None  # Athlete-specific needs
 
 
-@dataclass
+@dataclass(slots=True)
+class HourlySchedule:
+    """Hour-by-hour nutrition targets, one integer array per nutrient"""
+
+    carbs: np.ndarray  # Carbohydrate target per hour in grams
+    fluids: np.ndarray  # Fluid target per hour in oz
+    sodium: np.ndarray  # Sodium target per hour in mg
+
+    def __getitem__(self, nutrient: str) -> np.ndarray:
+        """Dict-style access (``schedule["carbs"]``) for existing callers"""
+        if nutrient not in self.__dataclass_fields__:
+            raise KeyError(nutrient)
+        return getattr(self, nutrient)
+
+    def __contains__(self, nutrient: str) -> bool:
+        return nutrient in self.__dataclass_fields__
+
+    def keys(self) -> List[str]:
+        return list(self.__dataclass_fields__)
+
+    def values(self) -> List[np.ndarray]:
+        return [getattr(self, nutrient) for nutrient in self.__dataclass_fields__]
+
+    def items(self) -> List[Tuple[str, np.ndarray]]:
+        return [
+            (nutrient, getattr(self, nutrient))
+            for nutrient in self.__dataclass_fields__
+        ]
+
+
+@dataclass(slots=True)
 class ContingencyNutrition:
     """Backup nutrition plan if primary strategy fails"""
 
@@ -64,7 +96,7 @@ class ContingencyNutrition:
     aid_station_strategy: str  # How to use race-provided nutrition
 
 
-@dataclass
+@dataclass(slots=True)
 class NutritionPlan:
     """Complete race nutrition strategy"""
 
@@ -1,11 +1,14 @@
-from typing import Any, Dict, List
+import functools
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
 
 import dspy
+import numpy as np
 
 from ..models.athlete import AthleteProfile
 from ..models.conditions import RaceConditions
-from ..models.course import CourseProfile
-from ..utils.course_analyzer import DifficultyCalculator
+from ..models.course import ClimbSegment, CourseProfile
+from ..utils.course_analyzer import DifficultyCalculator, DifficultyMetrics
 from ..utils.nutrition_calculator import NutritionCalculator
 from .equipment import EquipmentPipeline
 from .signatures import (
@@ -20,10 +23,28 @@ from .signatures import (
 )
 
 
+@dataclass
+class StaticStrategyInputs:
+    """Pipeline inputs that depend only on the course and athlete"""
+
+    difficulty_metrics: DifficultyMetrics
+    course_analysis_inputs: Dict[str, str]  # kwargs for the course analyzer
+    segment_inputs: List[Dict[str, str]]  # kwargs for each segment analysis
+    athlete_profile: str
+    athlete_nutrition_profile: str
+    race_duration_hours: float
+
+
 class RaceStrategyPipeline:
     """Enhanced DSPy pipeline for race strategy generation with real GPS data and difficulty analysis"""
 
-    def __init__(self):
+    def __init__(self, max_prompt_climbs: Optional[int] = None):
+        """
+        Args:
+            max_prompt_climbs: If set, only the most demanding climbs (scored by
+                length x average grade squared) are listed in the course prompt
+        """
+        self.max_prompt_climbs = max_prompt_climbs
         self.difficulty_calculator = DifficultyCalculator()
         self.nutrition_calculator = NutritionCalculator()
         self.equipment_pipeline = EquipmentPipeline()
@@ -40,34 +61,92 @@ class RaceStrategyPipeline:
         self, course: CourseProfile, athlete: AthleteProfile, conditions: RaceConditions
     ) -> Dict[str, Any]:
         """Execute the enhanced strategy generation pipeline with real GPS data and difficulty analysis"""
+        return self._run_strategy(
+            course, athlete, conditions, self._prepare_static_inputs(course, athlete)
+        )
+
+    def specialize(
+        self, course: CourseProfile, athlete: AthleteProfile
+    ) -> "SpecializedPipeline":
+        """
+        Bind this pipeline to a fixed course and athlete
+
+        Difficulty metrics and every course/athlete prompt string are computed
+        once, so sweeping race conditions only pays for condition-dependent work.
+
+        Args:
+            course: Course the strategies are generated for
+            athlete: Athlete the strategies are generated for
 
+        Returns:
+            SpecializedPipeline whose generate_strategy() takes only conditions
+        """
+        return SpecializedPipeline(self, course, athlete)
+
+    def _prepare_static_inputs(
+        self, course: CourseProfile, athlete: AthleteProfile
+    ) -> "StaticStrategyInputs":
+        """Compute everything in the pipeline that does not depend on conditions"""
         # Step 1: Calculate objective course difficulty metrics
         difficulty_metrics = self.difficulty_calculator.calculate_difficulty(course)
 
+        athlete_context = self._format_athlete_segment_context(athlete)
+        segment_inputs = [
+            {
+                "segment_data": self._format_segment_data(segment, course),
+                "segment_position": self._format_segment_position(segment, course),
+                "athlete_context": self._format_athlete_for_segment(
+                    athlete, segment, athlete_context
+                ),
+            }
+            # Top 5 most critical segments
+            for segment in difficulty_metrics.crux_segments[:5]
+        ]
+
+        return StaticStrategyInputs(
+            difficulty_metrics=difficulty_metrics,
+            course_analysis_inputs={
+                "course_name": course.name,
+                "course_profile": self._format_course_data(course),
+                "elevation_data": self._format_elevation_data(course),
+                "difficulty_metrics": self._format_difficulty_metrics(
+                    difficulty_metrics
+                ),
+                "crux_segments": self._format_crux_segments(
+                    difficulty_metrics.crux_segments
+                ),
+            },
+            segment_inputs=segment_inputs,
+            athlete_profile=self._format_athlete_data(athlete),
+            athlete_nutrition_profile=self._format_athlete_nutrition_profile(athlete),
+            race_duration_hours=self._estimate_race_duration(
+                athlete, difficulty_metrics
+            ),
+        )
+
+    def _run_strategy(
+        self,
+        course: CourseProfile,
+        athlete: AthleteProfile,
+        conditions: RaceConditions,
+        static: "StaticStrategyInputs",
+    ) -> Dict[str, Any]:
+        """Run the DSPy steps using precomputed course and athlete inputs"""
+        difficulty_metrics = static.difficulty_metrics
+
         # Step 2: Enhanced course analysis with real GPS data and difficulty integration
         enhanced_course_analysis = self.enhanced_course_analyzer(
-            course_name=course.name,
-            course_profile=self._format_course_data(course),
-            elevation_data=self._format_elevation_data(course),
-            difficulty_metrics=self._format_difficulty_metrics(difficulty_metrics),
-            crux_segments=self._format_crux_segments(difficulty_metrics.crux_segments),
+            **static.course_analysis_inputs
         )
 
         # Step 3: Segment-by-segment analysis for major climbs/challenges
-        segment_analyses = []
-        for segment in difficulty_metrics.crux_segments[
-            :5
-        ]:  # Top 5 most critical segments
-            segment_analysis = self.segment_analyzer(
-                segment_data=self._format_segment_data(segment, course),
-                segment_position=self._format_segment_position(segment, course),
-                athlete_context=self._format_athlete_for_segment(athlete, segment),
-            )
-            segment_analyses.append(segment_analysis)
+        segment_analyses = [
+            self.segment_analyzer(**inputs) for inputs in static.segment_inputs
+        ]
 
         # Step 4: Assess athlete vs enhanced course analysis
         athlete_assessment = self.athlete_assessor(
-            athlete_profile=self._format_athlete_data(athlete),
+            athlete_profile=static.athlete_profile,
             course_analysis=enhanced_course_analysis.strategic_analysis,
         )
 
@@ -79,28 +158,35 @@ class RaceStrategyPipeline:
             ]
         )
 
+        # Conditions text feeds both pacing and risk assessment; format it once
+        conditions_text = self._format_conditions_data(conditions)
+
         pacing_strategy = self.pacing_strategist(
             athlete_assessment=f"Strengths: {athlete_assessment.strengths_vs_course}\n"
             f"Risks: {athlete_assessment.risk_areas}\n"
             f"Power: {athlete_assessment.power_targets}\n"
             f"Segment Insights: {segment_insights}",
-            race_conditions=self._format_conditions_data(conditions),
+            race_conditions=conditions_text,
+        )
+        pacing_text = (
+            f"Swim: {pacing_strategy.swim_strategy}\n"
+            f"Bike: {pacing_strategy.bike_strategy}\n"
+            f"Run: {pacing_strategy.run_strategy}"
         )
 
         # Step 6: Generate nutrition strategy with calculations and pacing integration
-        race_duration_hours = self._estimate_race_duration(athlete, difficulty_metrics)
+        race_duration_hours = static.race_duration_hours
+        target_time = athlete.target_finish_time or "Sub 6:00:00"
         nutrition_calculations = self._calculate_nutrition_requirements(
             athlete, conditions, race_duration_hours
         )
 
         nutrition_strategy = self.nutrition_strategist(
-            athlete_profile=self._format_athlete_nutrition_profile(athlete),
-            race_duration=f"{race_duration_hours:.1f} hours - {athlete.target_finish_time or 'Sub 6:00:00'}",
+            athlete_profile=static.athlete_nutrition_profile,
+            race_duration=f"{race_duration_hours:.1f} hours - {target_time}",
             conditions=self._format_nutrition_conditions(conditions),
             nutrition_calculations=nutrition_calculations,
-            pacing_strategy=f"Swim: {pacing_strategy.swim_strategy}\n"
-            f"Bike: {pacing_strategy.bike_strategy}\n"
-            f"Run: {pacing_strategy.run_strategy}",
+            pacing_strategy=pacing_text,
         )
 
         # Step 7: Generate equipment recommendations with integration to pacing
@@ -109,41 +195,42 @@ class RaceStrategyPipeline:
                 course=course,
                 athlete=athlete,
                 conditions=conditions,
-                pacing_strategy=f"Swim: {pacing_strategy.swim_strategy}\n"
-                f"Bike: {pacing_strategy.bike_strategy}\n"
-                f"Run: {pacing_strategy.run_strategy}",
+                pacing_strategy=pacing_text,
             )
         )
 
+        # Gear summary shared by the risk and optimizer prompts
+        bike_gear_text = (
+            f"{equipment_recommendations.bike_setup.gearing} gearing, "
+            f"{equipment_recommendations.bike_setup.wheels} wheels"
+        )
+        wetsuit_decision = equipment_recommendations.swim_gear.wetsuit_decision
+
         # Step 8: Assess risks with enhanced analysis, nutrition, and equipment considerations
         risk_assessment = self.risk_assessor(
-            pacing_strategy=f"Swim: {pacing_strategy.swim_strategy}\n"
-            f"Bike: {pacing_strategy.bike_strategy}\n"
-            f"Run: {pacing_strategy.run_strategy}\n"
+            pacing_strategy=f"{pacing_text}\n"
             f"Nutrition: {nutrition_strategy.hydration_plan}\n"
-            f"Equipment: {equipment_recommendations.bike_setup.gearing} gearing, {equipment_recommendations.bike_setup.wheels} wheels, {equipment_recommendations.swim_gear.wetsuit_decision} wetsuit\n"
+            f"Equipment: {bike_gear_text}, {wetsuit_decision} wetsuit\n"
             f"Course Difficulty: {difficulty_metrics.overall_rating}/10\n"
             f"Key Challenges: {enhanced_course_analysis.tactical_insights}",
-            race_conditions=self._format_conditions_data(conditions),
+            race_conditions=conditions_text,
         )
 
         # Step 9: Optimize final strategy with all enhanced data including nutrition and equipment
         final_strategy = self.strategy_optimizer(
             course_analysis=enhanced_course_analysis.strategic_analysis,
             athlete_assessment=athlete_assessment.strengths_vs_course,
-            pacing_strategy=f"Swim: {pacing_strategy.swim_strategy}\n"
-            f"Bike: {pacing_strategy.bike_strategy}\n"
-            f"Run: {pacing_strategy.run_strategy}",
+            pacing_strategy=pacing_text,
             nutrition_strategy=f"Hydration: {nutrition_strategy.hydration_plan}\n"
             f"Fueling: {nutrition_strategy.fueling_schedule}\n"
             f"Electrolytes: {nutrition_strategy.electrolyte_strategy}\n"
             f"Integration: {nutrition_strategy.integration_guidance}",
-            equipment_strategy=f"Bike: {equipment_recommendations.bike_setup.gearing} gearing, {equipment_recommendations.bike_setup.wheels} wheels\n"
-            f"Swim: {equipment_recommendations.swim_gear.wetsuit_decision} wetsuit decision\n"
+            equipment_strategy=f"Bike: {bike_gear_text}\n"
+            f"Swim: {wetsuit_decision} wetsuit decision\n"
             f"Run: {equipment_recommendations.run_equipment.shoes} shoes\n"
             f"Performance Impact: {equipment_recommendations.performance_impact.time_savings_estimate}",
             risk_assessment=risk_assessment.mitigation_plan,
-            target_time=athlete.target_finish_time or "Sub 6:00:00",
+            target_time=target_time,
         )
 
         return {
@@ -164,7 +251,7 @@ class RaceStrategyPipeline:
             [
                 f"- {climb.name}: Mile {climb.start_mile}-{climb.start_mile + climb.length_miles}, "
                 f"{climb.avg_grade}% avg grade (max {climb.max_grade}%)"
-                for climb in course.key_climbs
+                for climb in self._select_prompt_climbs(course)
             ]
         )
 
@@ -180,6 +267,19 @@ Key Climbs:
 Technical Sections: {", ".join(course.technical_sections)}
 """
 
+    def _select_prompt_climbs(self, course: CourseProfile) -> List[ClimbSegment]:
+        """Return the climbs to list in the course prompt, in course order"""
+        limit = self.max_prompt_climbs
+        if limit is None or len(course.key_climbs) <= limit:
+            return course.key_climbs
+        if limit <= 0:
+            return []
+
+        climbs = course.climb_arrays()
+        score = climbs.length_miles * climbs.avg_grade**2
+        top = np.sort(np.argpartition(-score, limit - 1)[:limit])
+        return [course.key_climbs[i] for i in top.tolist()]
+
     def _format_athlete_data(self, athlete: AthleteProfile) -> str:
         """Format athlete data for DSPy input"""
         return f"""
@@ -208,28 +308,26 @@ Water Temp: {conditions.water_temp_f}°F
 
     def _format_elevation_data(self, course: CourseProfile) -> str:
         """Format detailed elevation profile for DSPy input"""
-        elevation_profile = []
-
         # Create mile-by-mile elevation approximation from climb data
-        total_miles = course.bike_distance_miles
-
-        for mile in range(int(total_miles) + 1):
-            mile_float = float(mile)
-            gradient = 0
-
-            # Find if this mile intersects with any climbs
-            for climb in course.key_climbs:
-                climb_start = climb.start_mile
-                climb_end = climb.start_mile + climb.length_miles
-
-                if climb_start <= mile_float <= climb_end:
-                    # Calculate position within climb for gradient estimation
-                    climb_position = (mile_float - climb_start) / climb.length_miles
-                    if climb_position <= 1.0:
-                        gradient = climb.avg_grade
-                        break
+        miles = np.arange(int(course.bike_distance_miles) + 1, dtype=np.float64)
+        gradients = np.zeros_like(miles)
+
+        climbs = course.climb_arrays()
+        if len(climbs):
+            climb_end = climbs.start_mile + climbs.length_miles
+            # (mile, climb) matrix of whether each mile falls within each climb
+            on_climb = (climbs.start_mile <= miles[:, None]) & (
+                miles[:, None] <= climb_end
+            )
+            # The first matching climb in course order sets the mile's gradient
+            gradients = np.where(
+                on_climb.any(axis=1), climbs.avg_grade[on_climb.argmax(axis=1)], 0.0
+            )
 
-            elevation_profile.append(f"Mile {mile}: {gradient:.1f}% gradient")
+        elevation_profile = [
+            f"Mile {mile}: {gradient:.1f}% gradient"
+            for mile, gradient in enumerate(gradients.tolist())
+        ]
 
         return "\n".join(elevation_profile)
 
@@ -300,10 +398,8 @@ Remaining Distance: {total_miles - start_mile - segment["length_miles"]:.1f} mil
 Run Impact: This segment occurs {13.1 if start_mile > total_miles * 0.9 else "well"} before the run leg
 """
 
-    def _format_athlete_for_segment(
-        self, athlete: AthleteProfile, segment: Dict
-    ) -> str:
-        """Format athlete context relevant to a specific segment"""
+    def _format_athlete_segment_context(self, athlete: AthleteProfile) -> str:
+        """Format the segment-independent part of the athlete's segment context"""
         # Calculate approximate watts per kg if possible
         watts_per_kg = "Unknown"
         if athlete.ftp_watts and athlete.weight_lbs:
@@ -325,9 +421,33 @@ Climbing Ability: {climbing_strength}
 Experience Level: {athlete.experience_level}
 Relevant Strengths: {", ".join([s for s in athlete.strengths if s in ["bike", "climbing", "power"]])}
 Relevant Limiters: {", ".join([lim for lim in athlete.limiters if lim in ["bike", "climbing", "hills", "endurance"]])}
-Segment Challenge Level: {"High" if segment["difficulty_score"] > 0.7 else "Moderate" if segment["difficulty_score"] > 0.4 else "Manageable"}
 """
 
+    def _format_athlete_for_segment(
+        self,
+        athlete: AthleteProfile,
+        segment: Dict,
+        athlete_context: Optional[str] = None,
+    ) -> str:
+        """
+        Format athlete context relevant to a specific segment
+
+        Pass athlete_context from _format_athlete_segment_context() to reuse
+        the athlete block across segments.
+        """
+        if athlete_context is None:
+            athlete_context = self._format_athlete_segment_context(athlete)
+
+        difficulty = segment["difficulty_score"]
+        if difficulty > 0.7:
+            challenge = "High"
+        elif difficulty > 0.4:
+            challenge = "Moderate"
+        else:
+            challenge = "Manageable"
+
+        return f"{athlete_context}Segment Challenge Level: {challenge}\n"
+
     def _estimate_race_duration(
         self, athlete: AthleteProfile, difficulty_metrics
     ) -> float:
@@ -393,9 +513,9 @@ Calculated Nutrition Requirements:
 • Sodium Target: {sodium_per_hour}mg/hour
 
 Hourly Schedule:
-• Carbs by hour: {schedule["carbs"]}
-• Fluids by hour: {schedule["fluids"]} oz
-• Sodium by hour: {schedule["sodium"]} mg
+• Carbs by hour: {schedule.carbs.tolist()}
+• Fluids by hour: {schedule.fluids.tolist()} oz
+• Sodium by hour: {schedule.sodium.tolist()} mg
 
 Environmental Considerations:
 • Heat Risk: {env_risks.get("heat", "Not assessed")}
@@ -438,3 +558,35 @@ Nutrition Impact:
 • Rain/wet conditions may limit access to personal nutrition
 • Aid station logistics affected by weather conditions
 """
+
+
+class SpecializedPipeline:
+    """RaceStrategyPipeline bound to one course and athlete for condition sweeps"""
+
+    def __init__(
+        self,
+        pipeline: RaceStrategyPipeline,
+        course: CourseProfile,
+        athlete: AthleteProfile,
+    ):
+        self.pipeline = pipeline
+        self.course = course
+        self.athlete = athlete
+        self.static_inputs = pipeline._prepare_static_inputs(course, athlete)
+
+    def generate_strategy(self, conditions: RaceConditions) -> Dict[str, Any]:
+        """Generate a strategy for the bound course and athlete in these conditions"""
+        return self.pipeline._run_strategy(
+            self.course, self.athlete, conditions, self.static_inputs
+        )
+
+
+@functools.cache
+def get_pipeline() -> RaceStrategyPipeline:
+    """
+    Return a shared RaceStrategyPipeline, built on first use
+
+    Building the pipeline constructs every DSPy module and signature, so
+    callers that run it repeatedly should share one instance.
+    """
+    return RaceStrategyPipeline()
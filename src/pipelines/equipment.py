@@ -76,52 +76,26 @@ class EquipmentPipeline:
     ) -> str:
         """Perform technical equipment analysis using database logic"""
 
-        # Bike equipment analysis
-        gearing, gearing_rationale = self.equipment_db.recommend_bike_gearing(
-            course, athlete, conditions
-        )
-        wheels, wheel_rationale = self.equipment_db.recommend_wheels(course, conditions)
-
-        # Swim equipment analysis
-        wetsuit_decision, wetsuit_type, wetsuit_rationale = (
-            self.equipment_db.recommend_wetsuit_decision(conditions, athlete)
-        )
-
-        # Run equipment analysis
-        shoes, shoe_rationale = self.equipment_db.recommend_running_shoes(
-            course, athlete
-        )
-
-        # Course demands analysis
-        course_analysis = self.equipment_db.analyze_course_demands(course)
-
-        # Performance impact analysis
-        equipment_changes = {
-            "gearing": gearing,
-            "wheels": wheels,
-            "wetsuit_decision": wetsuit_decision,
-            "shoes": shoes,
-        }
-        time_savings = self.equipment_db.estimate_time_savings(
-            equipment_changes, course
-        )
+        # Bike, swim, run and performance analysis from one course analysis
+        selection = self.equipment_db.recommend_all(course, athlete, conditions)
+        course_analysis = selection.course_analysis
 
         # Format technical analysis for DSPy
         technical_analysis = f"""
 BIKE EQUIPMENT ANALYSIS:
-Recommended Gearing: {gearing}
-Rationale: {gearing_rationale}
-Recommended Wheels: {wheels}
-Rationale: {wheel_rationale}
+Recommended Gearing: {selection.gearing}
+Rationale: {selection.gearing_rationale}
+Recommended Wheels: {selection.wheels}
+Rationale: {selection.wheel_rationale}
 
 SWIM EQUIPMENT ANALYSIS:
-Wetsuit Decision: {wetsuit_decision}
-Wetsuit Type: {wetsuit_type}
-Rationale: {wetsuit_rationale}
+Wetsuit Decision: {selection.wetsuit_decision}
+Wetsuit Type: {selection.wetsuit_type}
+Rationale: {selection.wetsuit_rationale}
 
 RUN EQUIPMENT ANALYSIS:
-Recommended Shoes: {shoes}
-Rationale: {shoe_rationale}
+Recommended Shoes: {selection.shoes}
+Rationale: {selection.shoe_rationale}
 
 COURSE DEMANDS:
 Course Type: {course_analysis["course_type"]}
@@ -130,7 +104,7 @@ Technical Level: {course_analysis["technical_level"]}
 Elevation per Mile: {course_analysis["elevation_per_mile"]} ft/mile
 
 PERFORMANCE IMPACT:
-Estimated Time Savings: {time_savings}
+Estimated Time Savings: {selection.time_savings}
 Priority Equipment Changes: Wetsuit (if cold), Gearing (if hilly), Wheels (if flat/windy)
 """
 
@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 
 import dspy
 from dotenv import load_dotenv
@@ -6,8 +7,16 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+@lru_cache(maxsize=1)
 def setup_dspy_model():
-    """Configure DSPy with the appropriate language model"""
+    """
+    Configure DSPy with the appropriate language model
+
+    The configured LM is memoized, so repeated calls (e.g. several demos driven
+    from one notebook) reuse the same client. Call
+    ``setup_dspy_model.cache_clear()`` to force a fresh configuration after
+    changing provider settings.
+    """
     provider = os.getenv("DEFAULT_LM_PROVIDER", "openai").lower()
 
     if provider == "openai":
@@ -7,10 +7,13 @@ GPS elevation data, identifying strategic segments and providing objective
 difficulty ratings.
 """
 
+from bisect import bisect_right
 from dataclasses import dataclass
 from statistics import mean, stdev
 from typing import Dict, List
 
+import numpy as np
+
 from ..models.course import ClimbSegment, CourseProfile
 
 
@@ -30,6 +33,25 @@ class DifficultyMetrics:
     strategic_insights: List[str]  # race strategy recommendations
 
 
+# Elevation-per-mile cut points for the simple five-level course rating
+ELEVATION_RATING_THRESHOLDS = (50, 150, 300, 500)
+
+
+def elevation_rating_index(course: CourseProfile) -> int:
+    """
+    Bucket a course by bike elevation gain per mile.
+
+    Args:
+        course: CourseProfile to rate
+
+    Returns:
+        0 (easy) to 4 (extreme); each threshold starts the next bucket
+    """
+    distance = course.bike_distance_miles
+    elevation_per_mile = course.bike_elevation_gain_ft / distance if distance > 0 else 0
+    return bisect_right(ELEVATION_RATING_THRESHOLDS, elevation_per_mile)
+
+
 class DifficultyCalculator:
     """
     Intelligent course difficulty calculator that analyzes GPS elevation data
@@ -184,21 +206,16 @@ class DifficultyCalculator:
         if not course.key_climbs:
             return 0
 
-        # Calculate distances between climbs
-        climb_positions = [climb.start_mile for climb in course.key_climbs]
-        climb_positions.sort()
-
-        if len(climb_positions) < 2:
+        if len(course.key_climbs) < 2:
             return 0
 
-        # Calculate gaps between climbs
-        gaps = []
-        for i in range(1, len(climb_positions)):
-            gaps.append(climb_positions[i] - climb_positions[i - 1])
+        climbs = course.climb_arrays()
+
+        # Calculate gaps between climbs from their sorted start positions
+        gaps = np.diff(np.sort(climbs.start_mile)).tolist()
 
         # Also consider climb lengths
-        climb_lengths = [climb.length_miles for climb in course.key_climbs]
-        max_climb_length = max(climb_lengths)
+        max_climb_length = float(climbs.length_miles.max())
 
         # Calculate clustering score
         # High variance in gaps = more clustered
@@ -8,6 +8,13 @@ from pathlib import Path
 from typing import Optional
 
 from ..models.course import AltitudeEffects, ClimbSegment, CourseProfile, GPSPoint
+from .disk_cache import cached_call, file_cache_key
+
+# Directory holding the course JSON files bundled with the package
+DEFAULT_DATA_DIR = Path(__file__).parent.parent / "data" / "courses"
+
+# Bump when the pickled CourseProfile layout changes to invalidate cached loads
+COURSE_CACHE_VERSION = 2
 
 
 def load_course_from_json(
@@ -29,8 +36,7 @@ def load_course_from_json(
     """
     # Default to src/data/courses directory
     if data_dir is None:
-        current_dir = Path(__file__).parent.parent
-        data_dir = current_dir / "data" / "courses"
+        data_dir = DEFAULT_DATA_DIR
     else:
         data_dir = Path(data_dir)
 
@@ -41,8 +47,8 @@ def load_course_from_json(
         raise FileNotFoundError(f"Course JSON file not found: {json_path}")
 
     try:
-        with open(json_path, encoding="utf-8") as f:
-            course_data = json.load(f)
+        # One read plus json.loads on the bytes skips the text-mode decode layer
+        course_data = json.loads(json_path.read_bytes())
     except json.JSONDecodeError as e:
         raise ValueError(f"Invalid JSON in course file {json_path}: {e}") from e
 
@@ -139,8 +145,7 @@ def get_available_courses(data_dir: Optional[str] = None) -> list[str]:
     """
     # Default to src/data/courses directory
     if data_dir is None:
-        current_dir = Path(__file__).parent.parent
-        data_dir = current_dir / "data" / "courses"
+        data_dir = DEFAULT_DATA_DIR
     else:
         data_dir = Path(data_dir)
 
@@ -155,25 +160,50 @@ def get_available_courses(data_dir: Optional[str] = None) -> list[str]:
     return sorted(course_names)
 
 
+def load_course_cached(course_name: str) -> CourseProfile:
+    """
+    Load a bundled course profile through the on-disk pickle cache
+
+    Cache entries are keyed on the JSON file's path, mtime and size, so
+    editing a course file invalidates its entry automatically.
+
+    Args:
+        course_name: Name of the bundled course (without .json extension)
+
+    Returns:
+        CourseProfile object
+    """
+    json_path = DEFAULT_DATA_DIR / f"{course_name}.json"
+    if not json_path.exists():
+        # Let load_course_from_json raise its usual FileNotFoundError
+        return load_course_from_json(course_name)
+
+    return cached_call(
+        "courses",
+        file_cache_key(json_path, COURSE_CACHE_VERSION),
+        lambda: load_course_from_json(course_name),
+    )
+
+
 # Predefined course loaders for convenience
 def load_happy_valley_70_3() -> CourseProfile:
     """Load the Happy Valley 70.3 course profile (research-based)"""
-    return load_course_from_json("happy_valley_70_3_real")
+    return load_course_cached("happy_valley_70_3_real")
 
 
 def load_happy_valley_70_3_gps() -> CourseProfile:
     """Load the Happy Valley 70.3 course profile (GPS-based)"""
-    return load_course_from_json("im70.3_pennstate")
+    return load_course_cached("im70.3_pennstate")
 
 
 def load_alpe_dhuez() -> CourseProfile:
     """Load the Alpe d'Huez triathlon course profile"""
-    return load_course_from_json("alpedhuez_triathlon")
+    return load_course_cached("alpedhuez_triathlon")
 
 
 def load_alpe_dhuez_real() -> CourseProfile:
     """Load Alpe d'Huez real course with 4 major climbs and 21-bend ascent"""
-    return load_course_from_json("alpe_dhuez_real")
+    return load_course_cached("alpe_dhuez_real")
 
 
 # Generic loader for any course by name
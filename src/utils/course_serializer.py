@@ -0,0 +1,119 @@
+# src/utils/course_serializer.py
+"""
+Course serializer for writing GPS-derived course profiles to course JSON files
+"""
+
+import contextlib
+import json
+import os
+import tempfile
+from typing import Any, Dict, Optional
+
+from ..models.course import CourseProfile
+
+# ClimbSegment fields written to course JSON; GPS points and coordinates are
+# deliberately left out, which is why dataclasses.asdict isn't used
+CLIMB_JSON_FIELDS = (
+    "name",
+    "start_mile",
+    "length_miles",
+    "avg_grade",
+    "max_grade",
+    "elevation_gain_ft",
+)
+
+
+def course_profile_to_json_dict(
+    course_profile: CourseProfile, overrides: Optional[Dict[str, Any]] = None
+) -> dict:
+    """
+    Convert CourseProfile to JSON-serializable dictionary with course-specific metadata
+
+    Args:
+        course_profile: CourseProfile object, typically parsed from a GPX file
+        overrides: Course metadata the GPX track doesn't carry (name, location,
+            swim/run distances, race venue details, notes). ``source`` names the
+            data source and ``data_source`` adds extra data source fields.
+
+    Returns:
+        Dictionary representation suitable for JSON serialization
+    """
+    info = overrides or {}
+    metadata = course_profile.gps_metadata
+
+    # Convert ClimbSegment objects to dictionaries of the serialized fields
+    key_climbs = [
+        {field: getattr(climb, field) for field in CLIMB_JSON_FIELDS}
+        for climb in course_profile.key_climbs
+    ]
+
+    data_source = {
+        "type": "GPS Track",
+        "source": info.get("source", "Local GPX file"),
+        "gpx_file": metadata.source_file if metadata else "Unknown",
+        "data_quality_score": metadata.data_quality_score if metadata else None,
+        "total_gps_points": metadata.total_points if metadata else None,
+        "parsed_at": metadata.parsed_at.isoformat() if metadata else None,
+    }
+    data_source.update(info.get("data_source", {}))
+
+    return {
+        "name": info.get("name", course_profile.name),
+        "location": info.get("location", "Unknown"),
+        "bike_distance_miles": course_profile.bike_distance_miles,
+        "bike_elevation_gain_ft": course_profile.bike_elevation_gain_ft,
+        "swim_distance_miles": info.get("swim_distance_miles", 1.2),
+        "run_distance_miles": info.get("run_distance_miles", 13.1),
+        "run_elevation_gain_ft": info.get("run_elevation_gain_ft", 200),
+        "altitude_ft": info.get("altitude_ft", 0),
+        "key_climbs": key_climbs,
+        "technical_sections": course_profile.technical_sections,
+        "surface_types": info.get("surface_types", ["Asphalt"]),
+        "race_details": {
+            "swim_venue": info.get("swim_venue", "Unknown"),
+            "swim_type": info.get("swim_type", "Unknown"),
+            "wetsuit_legal": True,
+            "typical_water_temp_f": info.get("typical_water_temp_f", 68),
+            "bike_profile": info.get("bike_profile", "Unknown"),
+            "run_profile": info.get("run_profile", "Unknown"),
+            "run_surface": info.get("run_surface", "Unknown"),
+        },
+        "data_source": data_source,
+        "notes": info.get("notes", ""),
+    }
+
+
+def save_course_json(course_dict: dict, output_path: str) -> None:
+    """
+    Save course dictionary to JSON file with pretty formatting
+
+    The JSON is written to a temporary file next to ``output_path`` and moved
+    into place, so readers never see a partially written course. The output
+    directory must already exist.
+
+    Args:
+        course_dict: Course data dictionary
+        output_path: Path to save JSON file
+    """
+    # Encode in one pass and hand the bytes straight to the OS; a text-mode
+    # file would re-encode and buffer every chunk
+    payload = json.dumps(course_dict, indent=2, ensure_ascii=False).encode("utf-8")
+    # A unique temp file per save, so concurrent saves to the same path can't
+    # clobber each other's partial output
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(output_path)), suffix=".tmp"
+    )
+    try:
+        try:
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
+        # mkstemp creates owner-only files; course JSON is meant to be shared
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp_path)
+        raise
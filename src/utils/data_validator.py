@@ -10,10 +10,15 @@ import logging
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
+import numpy as np
+
 from ..models.course import CourseProfile
 
 logger = logging.getLogger(__name__)
 
+# Bump whenever validation checks or scoring change so cached reports are rebuilt
+VALIDATOR_VERSION = 1
+
 
 @dataclass
 class ValidationResult:
@@ -227,14 +232,14 @@ class DataValidator:
             )
             return results
 
-        # Analyze elevation values
-        elevations = [
-            point.elevation_ft
-            for point in course.elevation_profile
-            if point.elevation_ft is not None
-        ]
+        # Analyze elevation values as one array; missing elevations become NaN
+        elevations = np.array(
+            [point.elevation_ft for point in course.elevation_profile],
+            dtype=np.float64,
+        )
+        elevations = elevations[~np.isnan(elevations)]
 
-        if not elevations:
+        if not elevations.size:
             results.append(
                 ValidationResult(
                     check_name="Elevation Values",
@@ -247,25 +252,26 @@ class DataValidator:
             return results
 
         # Check elevation bounds
-        min_elev = min(elevations)
-        max_elev = max(elevations)
-        invalid_elevations = [
-            e
-            for e in elevations
-            if e < self.MIN_ELEVATION_FT or e > self.MAX_ELEVATION_FT
-        ]
+        min_elev = float(elevations.min())
+        max_elev = float(elevations.max())
+        invalid_count = int(
+            np.count_nonzero(
+                (elevations < self.MIN_ELEVATION_FT)
+                | (elevations > self.MAX_ELEVATION_FT)
+            )
+        )
 
-        if invalid_elevations:
+        if invalid_count:
             results.append(
                 ValidationResult(
                     check_name="Elevation Bounds",
                     passed=False,
                     severity="warning",
-                    message=f"Found {len(invalid_elevations)} elevation values outside reasonable bounds",
+                    message=f"Found {invalid_count} elevation values outside reasonable bounds",
                     details={
                         "min_elevation": min_elev,
                         "max_elevation": max_elev,
-                        "invalid_count": len(invalid_elevations),
+                        "invalid_count": invalid_count,
                         "bounds": f"{self.MIN_ELEVATION_FT}-{self.MAX_ELEVATION_FT}ft",
                     },
                     suggested_fix="Review GPS data for elevation sensor errors",
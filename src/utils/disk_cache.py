@@ -0,0 +1,124 @@
+"""
+On-disk pickle cache for expensive course loading and parsing results
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+# Cache location can be overridden for CI or sandboxed runs
+CACHE_DIR = Path(
+    os.getenv("RACE_STRATEGY_CACHE_DIR", str(Path.home() / ".cache" / "race-strategy"))
+)
+
+
+def cache_enabled() -> bool:
+    """Return False when caching is switched off via CACHE_RESULTS in .env"""
+    return os.getenv("CACHE_RESULTS", "true").strip().lower() not in (
+        "0",
+        "false",
+        "no",
+        "off",
+    )
+
+
+def file_cache_key(source_path: PathLike, *extra: Any) -> str:
+    """
+    Build a cache key from a source file's path, mtime and size
+
+    Args:
+        source_path: File the cached value is derived from
+        *extra: Additional values (versions, options) that affect the result
+
+    Returns:
+        Hex digest identifying this version of the file
+    """
+    stat = os.stat(source_path)
+    raw = "|".join(
+        [os.path.abspath(source_path), str(stat.st_mtime_ns), str(stat.st_size)]
+        + [repr(value) for value in extra]
+    )
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def content_cache_key(source_path: PathLike, *extra: Any) -> str:
+    """
+    Build a cache key from a source file's path and a hash of its contents
+
+    Unlike file_cache_key, the key survives checkouts and copies that only
+    change the file's mtime.
+
+    Args:
+        source_path: File the cached value is derived from
+        *extra: Additional values (versions, options) that affect the result
+
+    Returns:
+        Hex digest identifying this version of the file
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(source_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+
+    raw = "|".join(
+        [os.path.abspath(source_path), digest.hexdigest()]
+        + [repr(value) for value in extra]
+    )
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def cached_call(
+    namespace: str,
+    key: str,
+    compute: Callable[[], Any],
+    cache_dir: Optional[PathLike] = None,
+) -> Any:
+    """
+    Return the pickled value stored under ``namespace/key``, computing it on a miss
+
+    Unreadable or stale cache entries are treated as misses and overwritten.
+
+    Args:
+        namespace: Subdirectory grouping related cache entries
+        key: Cache key, typically from file_cache_key() or content_cache_key()
+        compute: Zero-argument callable producing the value on a miss
+        cache_dir: Optional cache root (defaults to CACHE_DIR)
+
+    Returns:
+        The cached or freshly computed value
+    """
+    if not cache_enabled():
+        return compute()
+
+    entry_dir = Path(cache_dir or CACHE_DIR) / namespace
+    entry_path = entry_dir / f"{key}.pkl"
+
+    try:
+        with open(entry_path, "rb") as f:
+            return pickle.load(f)
+    except Exception:
+        # Missing, corrupt or incompatible entry; fall through and rebuild it
+        pass
+
+    value = compute()
+
+    tmp_path = None
+    try:
+        entry_dir.mkdir(parents=True, exist_ok=True)
+        # Write to a temp file and rename so concurrent readers never see
+        # a partially written pickle
+        fd, tmp_path = tempfile.mkstemp(dir=entry_dir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, entry_path)
+    except OSError:
+        # Caching is best-effort; a read-only home directory shouldn't fail loads
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    return value
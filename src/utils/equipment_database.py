@@ -6,7 +6,7 @@ for triathlon equipment selection based on course, conditions, and athlete profi
 """
 
 import logging
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
 from ..models.athlete import AthleteProfile
 from ..models.conditions import RaceConditions
@@ -38,6 +38,22 @@ WIND_AERO_PENALTY = 0.3  # Penalty for aero wheels in strong wind
 logger = logging.getLogger(__name__)
 
 
+class EquipmentSelection(NamedTuple):
+    """All database equipment picks for one course, athlete and conditions"""
+
+    course_analysis: Dict[str, str]
+    gearing: str
+    gearing_rationale: str
+    wheels: str
+    wheel_rationale: str
+    wetsuit_decision: str
+    wetsuit_type: str
+    wetsuit_rationale: str
+    shoes: str
+    shoe_rationale: str
+    time_savings: str
+
+
 class EquipmentDatabase:
     """Equipment catalog and recommendation engine"""
 
@@ -100,17 +116,22 @@ class EquipmentDatabase:
         }
 
     def recommend_bike_gearing(
-        self, course: CourseProfile, athlete: AthleteProfile, conditions: RaceConditions
+        self,
+        course: CourseProfile,
+        athlete: AthleteProfile,
+        conditions: RaceConditions,
+        course_analysis: Optional[Dict[str, str]] = None,
     ) -> Tuple[str, str]:
         """Recommend optimal bike gearing based on course and athlete"""
 
-        course_analysis = self.analyze_course_demands(course)
+        if course_analysis is None:
+            course_analysis = self.analyze_course_demands(course)
         course_type = course_analysis["course_type"]
 
         # Get gearing scores
         gearing_scores = self.bike_gearing_matrix.get(
             course_type, self.bike_gearing_matrix["rolling_course"]
-        )
+        ).copy()  # Use copy to avoid modifying original
 
         # Athlete adjustments using constants
         if athlete.experience_level == "beginner":
@@ -130,11 +151,15 @@ class EquipmentDatabase:
         return best_gearing[0], rationale
 
     def recommend_wheels(
-        self, course: CourseProfile, conditions: RaceConditions
+        self,
+        course: CourseProfile,
+        conditions: RaceConditions,
+        course_analysis: Optional[Dict[str, str]] = None,
     ) -> Tuple[str, str]:
         """Recommend optimal wheel choice based on course and conditions"""
 
-        course_analysis = self.analyze_course_demands(course)
+        if course_analysis is None:
+            course_analysis = self.analyze_course_demands(course)
 
         # Validate wind speed input
         wind_speed = self._validate_wind_speed(conditions.wind_speed_mph)
@@ -217,11 +242,15 @@ class EquipmentDatabase:
             return "no-wetsuit", None
 
     def recommend_running_shoes(
-        self, course: CourseProfile, athlete: AthleteProfile
+        self,
+        course: CourseProfile,
+        athlete: AthleteProfile,
+        course_analysis: Optional[Dict[str, str]] = None,
     ) -> Tuple[str, str]:
         """Recommend running shoe category based on course and athlete needs"""
 
-        course_analysis = self.analyze_course_demands(course)
+        if course_analysis is None:
+            course_analysis = self.analyze_course_demands(course)
 
         # Base recommendation on athlete experience and course
         if athlete.experience_level == "beginner" or "run" in athlete.limiters:
@@ -241,7 +270,10 @@ class EquipmentDatabase:
         return shoe_type, rationale
 
     def estimate_time_savings(
-        self, equipment_changes: Dict[str, str], course: CourseProfile
+        self,
+        equipment_changes: Dict[str, str],
+        course: CourseProfile,
+        course_analysis: Optional[Dict[str, str]] = None,
     ) -> str:
         """Estimate time savings from equipment recommendations"""
 
@@ -258,7 +290,8 @@ class EquipmentDatabase:
 
         # Optimal gearing
         if equipment_changes.get("gearing") == "compact":
-            course_analysis = self.analyze_course_demands(course)
+            if course_analysis is None:
+                course_analysis = self.analyze_course_demands(course)
             if course_analysis["climbing_demand"] == "high":
                 total_seconds_saved += 120  # 2 minutes for proper gearing on hills
 
@@ -272,6 +305,50 @@ class EquipmentDatabase:
             minutes = total_seconds_saved / 60
             return f"~{minutes:.1f} minutes"
 
+    def recommend_all(
+        self, course: CourseProfile, athlete: AthleteProfile, conditions: RaceConditions
+    ) -> EquipmentSelection:
+        """Produce every equipment recommendation from a single course analysis"""
+
+        course_analysis = self.analyze_course_demands(course)
+
+        gearing, gearing_rationale = self.recommend_bike_gearing(
+            course, athlete, conditions, course_analysis
+        )
+        wheels, wheel_rationale = self.recommend_wheels(
+            course, conditions, course_analysis
+        )
+        wetsuit_decision, wetsuit_type, wetsuit_rationale = (
+            self.recommend_wetsuit_decision(conditions, athlete)
+        )
+        shoes, shoe_rationale = self.recommend_running_shoes(
+            course, athlete, course_analysis
+        )
+
+        equipment_changes = {
+            "gearing": gearing,
+            "wheels": wheels,
+            "wetsuit_decision": wetsuit_decision,
+            "shoes": shoes,
+        }
+        time_savings = self.estimate_time_savings(
+            equipment_changes, course, course_analysis
+        )
+
+        return EquipmentSelection(
+            course_analysis=course_analysis,
+            gearing=gearing,
+            gearing_rationale=gearing_rationale,
+            wheels=wheels,
+            wheel_rationale=wheel_rationale,
+            wetsuit_decision=wetsuit_decision,
+            wetsuit_type=wetsuit_type,
+            wetsuit_rationale=wetsuit_rationale,
+            shoes=shoes,
+            shoe_rationale=shoe_rationale,
+            time_savings=time_savings,
+        )
+
     def _generate_gearing_rationale(
         self, gearing: str, course_analysis: Dict, athlete: AthleteProfile
     ) -> str:
@@ -2,15 +2,28 @@
 import logging
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import gpxpy
-from geopy.distance import geodesic
-
-from ..models.course import ClimbSegment, CourseProfile, GPSMetadata, GPSPoint
+import numpy as np
+
+from ..models.course import (
+    ClimbSegment,
+    CourseBounds,
+    CourseProfile,
+    GPSMetadata,
+    GPSPoint,
+    TrackArrays,
+)
+from .disk_cache import cached_call, content_cache_key
+from .geo_kernels import geodesic_step_miles
+from .grade_kernels import find_climb_spans
 
 logger = logging.getLogger(__name__)
 
+# Bump when parse_gpx_file output changes so cached profiles are rebuilt
+PARSER_VERSION = 4
+
 
 @dataclass
 class ActivityConfig:
@@ -123,6 +136,33 @@ class GPSParser:
         self.activity_config = activity_config
         self.manual_activity_type = activity_type
 
+    def parse_gpx_file_cached(self, file_path: str) -> CourseProfile:
+        """
+        Parse GPX file, reusing a pickled result when the file is unchanged
+
+        Results are keyed on the file's path and a hash of its contents together
+        with PARSER_VERSION and this parser's configuration.
+
+        Args:
+            file_path: Path to GPX file
+
+        Returns:
+            CourseProfile with GPS data populated
+        """
+        try:
+            key = content_cache_key(
+                file_path,
+                PARSER_VERSION,
+                self.config,
+                self.activity_config,
+                self.manual_activity_type,
+            )
+        except OSError:
+            # Let parse_gpx_file raise its usual error for missing files
+            return self.parse_gpx_file(file_path)
+
+        return cached_call("gpx_profiles", key, lambda: self.parse_gpx_file(file_path))
+
     def parse_gpx_file(self, file_path: str) -> CourseProfile:
         """
         Parse GPX file and convert to CourseProfile
@@ -159,8 +199,9 @@ class GPSParser:
 
         logger.info(f"Processing {len(track_points)} GPS points from {file_path}")
 
-        # Convert to GPS points with distance and elevation calculations
-        gps_points = self._process_track_points(track_points)
+        # Convert to GPS points with distance and elevation calculations, keeping
+        # a column-wise copy for the per-point passes below
+        gps_points, track = self._build_track(track_points)
 
         # Detect or use manual activity type
         if self.manual_activity_type:
@@ -169,22 +210,24 @@ class GPSParser:
         else:
             activity_type, activity_confidence = self._detect_activity_type(gps_points)
 
-        # Get activity-specific configuration
-        if not self.activity_config:
-            self.activity_config = self._get_activity_specific_config(activity_type)
+        # Get activity-specific configuration. Kept local so a parser reused
+        # across files detects each file's activity afresh.
+        activity_config = self.activity_config or self._get_activity_specific_config(
+            activity_type
+        )
 
         # Update parser configuration with activity-specific parameters
         original_climb_grade = self.min_climb_grade
         original_climb_distance = self.min_climb_distance
 
-        self.min_climb_grade = self.activity_config.min_climb_grade
-        self.min_climb_distance = self.activity_config.min_climb_distance
+        self.min_climb_grade = activity_config.min_climb_grade
+        self.min_climb_distance = activity_config.min_climb_distance
 
         # Generate metadata
-        metadata = self._generate_metadata(file_path, gps_points, track_points)
+        metadata = self._generate_metadata(file_path, gps_points, track_points, track)
 
         # Detect climbs using activity-specific parameters
-        climbs = self._detect_climbs(gps_points)
+        climbs = self._detect_climbs(gps_points, track)
 
         # Create course profile
         course_name = (
@@ -193,7 +236,7 @@ class GPSParser:
 
         # Calculate total distance and elevation gain
         total_distance = gps_points[-1].distance_miles if gps_points else 0
-        total_elevation_gain = self._calculate_total_elevation_gain(gps_points)
+        total_elevation_gain = self._calculate_total_elevation_gain(gps_points, track)
 
         # Assign distance and elevation based on activity type
         bike_distance = total_distance if activity_type in ["cycling", "mixed"] else 0.0
@@ -220,7 +263,7 @@ class GPSParser:
             activity_confidence=activity_confidence,
             key_climbs=climbs,
             technical_sections=self._identify_technical_sections(
-                gps_points, self.activity_config
+                gps_points, activity_config, track
             ),
             gps_metadata=metadata,
             elevation_profile=gps_points,
@@ -238,71 +281,76 @@ class GPSParser:
 
     def _process_track_points(self, track_points: List) -> List[GPSPoint]:
         """Convert GPX track points to GPSPoints with distance and gradient"""
-        gps_points = []
-        total_distance = 0.0
-
-        for i, point in enumerate(track_points):
-            # Handle missing elevation data
-            elevation_ft = 0.0
-            if point.elevation is not None:
-                elevation_ft = point.elevation * 3.28084  # Convert meters to feet
-
-            # Calculate distance from previous point (only for valid coordinates)
-            if i > 0:
-                prev_point = track_points[i - 1]
-
-                # Check if both current and previous coordinates are valid before using geodesic
-                if (
-                    self._is_coordinate_valid(
-                        prev_point.latitude,
-                        self.config.min_latitude,
-                        self.config.max_latitude,
-                    )
-                    and self._is_coordinate_valid(
-                        prev_point.longitude,
-                        self.config.min_longitude,
-                        self.config.max_longitude,
-                    )
-                    and self._is_coordinate_valid(
-                        point.latitude,
-                        self.config.min_latitude,
-                        self.config.max_latitude,
-                    )
-                    and self._is_coordinate_valid(
-                        point.longitude,
-                        self.config.min_longitude,
-                        self.config.max_longitude,
-                    )
-                ):
-                    try:
-                        distance = geodesic(
-                            (prev_point.latitude, prev_point.longitude),
-                            (point.latitude, point.longitude),
-                        ).miles
-                        total_distance += distance
-                    except ValueError as e:
-                        # Log error and use a default small distance for invalid points
-                        logger.warning(
-                            f"Distance calculation failed for point {i}: {e}"
-                        )
-                        total_distance += 0.001  # Small default distance
-                else:
-                    # Skip distance calculation for invalid coordinates
-                    total_distance += 0.001  # Small default distance
-
-            gps_point = GPSPoint(
-                latitude=point.latitude,
-                longitude=point.longitude,
-                elevation_ft=elevation_ft,
-                distance_miles=total_distance,
-            )
+        return self._build_track(track_points)[0]
+
+    def _build_track(self, track_points: List) -> Tuple[List[GPSPoint], TrackArrays]:
+        """Convert GPX track points to GPSPoints plus the same data as arrays"""
+        if not track_points:
+            return [], TrackArrays.from_points([])
 
-            gps_points.append(gps_point)
+        lats = np.fromiter(
+            (p.latitude for p in track_points), np.float64, len(track_points)
+        )
+        lons = np.fromiter(
+            (p.longitude for p in track_points), np.float64, len(track_points)
+        )
+
+        # Only measure steps whose endpoints both have valid coordinates
+        valid = (
+            (lats >= self.config.min_latitude)
+            & (lats <= self.config.max_latitude)
+            & (lons >= self.config.min_longitude)
+            & (lons <= self.config.max_longitude)
+        )
+        measurable = valid[:-1] & valid[1:]
+
+        steps = geodesic_step_miles(lats, lons)
+        failed = measurable & np.isnan(steps)
+        for i in np.flatnonzero(failed).tolist():
+            logger.warning(f"Distance calculation failed for point {i + 1}")
+        # Use a small default distance for steps that cannot be measured
+        steps[~measurable | failed] = 0.001
+
+        distances = np.zeros(len(track_points))
+        np.cumsum(steps, out=distances[1:])
+
+        # Handle missing elevation data; convert meters to feet
+        elevations = np.fromiter(
+            (
+                p.elevation * 3.28084 if p.elevation is not None else 0.0
+                for p in track_points
+            ),
+            np.float64,
+            len(track_points),
+        )
 
         # Calculate gradients using smoothed elevation profile
-        self._calculate_gradients(gps_points)
+        gradients = self._gradient_array(distances, elevations)
 
-        return gps_points
+        gps_points = [
+            GPSPoint(
+                latitude=point.latitude,
+                longitude=point.longitude,
+                elevation_ft=elevation,
+                distance_miles=distance,
+                gradient_percent=None if gradient != gradient else gradient,
+            )
+            for point, elevation, distance, gradient in zip(
+                track_points,
+                elevations.tolist(),
+                distances.tolist(),
+                gradients.tolist(),
+            )
+        ]
+
+        track = TrackArrays(
+            latitude=lats,
+            longitude=lons,
+            elevation_ft=elevations,
+            distance_miles=distances,
+            gradient_percent=gradients,
+        )
+        return gps_points, track
 
     def _calculate_gradients(
         self, gps_points: List[GPSPoint], smoothing_window: Optional[int] = None
@@ -311,26 +359,49 @@ class GPSParser:
         if len(gps_points) < 2:
             return
 
+        track = TrackArrays.from_points(gps_points)
+        gradients = self._gradient_array(
+            track.distance_miles, track.elevation_ft, smoothing_window
+        )
+        for point, gradient in zip(gps_points[1:], gradients[1:].tolist()):
+            if gradient == gradient:
+                point.gradient_percent = gradient
+
+    def _gradient_array(
+        self,
+        distances: np.ndarray,
+        elevations: np.ndarray,
+        smoothing_window: Optional[int] = None,
+    ) -> np.ndarray:
+        """
+        Compute the percent grade arriving at each point
+
+        Returns NaN for the first point and for points that do not advance
+        along the track.
+        """
+        gradients = np.full(len(distances), np.nan)
+        if len(distances) < 2:
+            return gradients
+
         # Use config smoothing window if not provided
         if smoothing_window is None:
             smoothing_window = self.config.smoothing_window
 
         # Smooth elevation data to reduce noise
-        elevations = [p.elevation_ft for p in gps_points]
         if smoothing_window > 1:
-            elevations = self._smooth_data(elevations, smoothing_window)
-
-        # Calculate gradients
-        for i in range(1, len(gps_points)):
-            distance_diff = (
-                gps_points[i].distance_miles - gps_points[i - 1].distance_miles
+            elevations = np.asarray(
+                self._smooth_data(elevations.tolist(), smoothing_window)
             )
-            elevation_diff = elevations[i] - elevations[i - 1]
 
-            if distance_diff > 0:
-                # Convert to percentage grade
-                gradient = (elevation_diff / (distance_diff * 5280)) * 100
-                gps_points[i].gradient_percent = gradient
+        distance_diff = np.diff(distances)
+        elevation_diff = np.diff(elevations)
+        moving = distance_diff > 0
+
+        # Convert to percentage grade
+        gradients[1:][moving] = (
+            elevation_diff[moving] / (distance_diff[moving] * 5280)
+        ) * 100
+        return gradients
 
     def _smooth_data(self, data: List[float], window: int) -> List[float]:
         """Apply moving average smoothing to data"""
@@ -346,69 +417,53 @@ class GPSParser:
 
         return smoothed
 
-    def _detect_climbs(self, gps_points: List[GPSPoint]) -> List[ClimbSegment]:
+    def _detect_climbs(
+        self, gps_points: List[GPSPoint], track: Optional[TrackArrays] = None
+    ) -> List[ClimbSegment]:
         """Detect climb segments from GPS data"""
+        if track is None:
+            track = TrackArrays.from_points(gps_points)
+
         climbs = []
-        current_climb = None
+        spans = find_climb_spans(track.gradient_percent, self.min_climb_grade)
 
-        for i, point in enumerate(gps_points):
-            if point.gradient_percent is None:
+        # Only points at climb boundaries are turned back into Python objects
+        for start_idx, end_idx in spans.tolist():
+            start_mile = float(track.distance_miles[start_idx])
+            climb_length = float(track.distance_miles[end_idx]) - start_mile
+            if climb_length < self.min_climb_distance:
                 continue
 
-            # Start of a climb
-            if point.gradient_percent >= self.min_climb_grade and current_climb is None:
-                current_climb = {
-                    "start_idx": i,
-                    "start_mile": point.distance_miles,
-                    "start_elevation": point.elevation_ft,
-                    "max_grade": point.gradient_percent,
-                    "grades": [point.gradient_percent],
-                }
-
-            # Continue climb
-            elif current_climb is not None and point.gradient_percent >= 0:
-                current_climb["max_grade"] = max(
-                    current_climb["max_grade"], point.gradient_percent or 0
-                )
-                current_climb["grades"].append(point.gradient_percent or 0)
-
-            # End of climb
-            elif current_climb is not None and (
-                point.gradient_percent < 0 or i == len(gps_points) - 1
-            ):
-                climb_length = point.distance_miles - current_climb["start_mile"]
-
-                if climb_length >= self.min_climb_distance:
-                    avg_grade = sum(current_climb["grades"]) / len(
-                        current_climb["grades"]
-                    )
-                    elevation_gain = (
-                        point.elevation_ft - current_climb["start_elevation"]
-                    )
-
-                    # Create climb segment
-                    climb = ClimbSegment(
-                        name=f"Climb at mile {current_climb['start_mile']:.1f}",
-                        start_mile=current_climb["start_mile"],
-                        length_miles=climb_length,
-                        avg_grade=avg_grade,
-                        max_grade=current_climb["max_grade"],
-                        elevation_gain_ft=int(max(0, elevation_gain)),
-                        start_coords=(
-                            gps_points[current_climb["start_idx"]].latitude,
-                            gps_points[current_climb["start_idx"]].longitude,
-                        ),
-                        end_coords=(point.latitude, point.longitude),
-                        gps_points=gps_points[current_climb["start_idx"] : i + 1],
-                    )
+            grades = track.gradient_percent[start_idx:end_idx]
+            grades = grades[~np.isnan(grades)].tolist()
+            elevation_gain = float(track.elevation_ft[end_idx]) - float(
+                track.elevation_ft[start_idx]
+            )
 
-                    climbs.append(climb)
-                    logger.debug(
-                        f"Detected climb: {climb.name} - "
-                        f"{climb.length_miles:.1f}mi at {climb.avg_grade:.1f}% avg"
-                    )
+            # Create climb segment
+            climb = ClimbSegment(
+                name=f"Climb at mile {start_mile:.1f}",
+                start_mile=start_mile,
+                length_miles=climb_length,
+                avg_grade=sum(grades) / len(grades),
+                max_grade=max(grades),
+                elevation_gain_ft=int(max(0, elevation_gain)),
+                start_coords=(
+                    float(track.latitude[start_idx]),
+                    float(track.longitude[start_idx]),
+                ),
+                end_coords=(
+                    float(track.latitude[end_idx]),
+                    float(track.longitude[end_idx]),
+                ),
+                gps_points=gps_points[start_idx : end_idx + 1],
+            )
 
-                current_climb = None
+            climbs.append(climb)
+            logger.debug(
+                f"Detected climb: {climb.name} - "
+                f"{climb.length_miles:.1f}mi at {climb.avg_grade:.1f}% avg"
+            )
 
         return climbs
 
@@ -495,21 +550,25 @@ class GPSParser:
         else:  # Default to cycling
             return ActivityConfig.get_cycling_config()
 
-    def _calculate_total_elevation_gain(self, gps_points: List[GPSPoint]) -> float:
+    def _calculate_total_elevation_gain(
+        self, gps_points: List[GPSPoint], track: Optional[TrackArrays] = None
+    ) -> float:
         """Calculate total elevation gain from GPS points"""
-        total_gain = 0.0
-
-        for i in range(1, len(gps_points)):
-            elevation_diff = gps_points[i].elevation_ft - gps_points[i - 1].elevation_ft
-            if elevation_diff > 0:
-                total_gain += elevation_diff
+        if len(gps_points) < 2:
+            return 0.0
 
-        return total_gain
+        if track is None:
+            track = TrackArrays.from_points(gps_points)
+        # Clamp descents to zero in place and sum the climbs, branch-free
+        rises = np.diff(track.elevation_ft)
+        np.maximum(rises, 0.0, out=rises)
+        return float(rises.sum())
 
     def _identify_technical_sections(
         self,
         gps_points: List[GPSPoint],
         activity_config: Optional[ActivityConfig] = None,
+        track: Optional[TrackArrays] = None,
     ) -> List[str]:
         """Identify technical sections like sharp turns or steep descents"""
         technical_sections = []
@@ -521,35 +580,40 @@ class GPSParser:
             descent_threshold = self.config.descent_threshold
 
         min_descent_length = self.config.min_descent_length
+        continuation_threshold = self.config.descent_continuation_threshold
+
+        if track is None:
+            track = TrackArrays.from_points(gps_points)
+        # Points without a gradient are NaN, which fails every comparison below
+        grades = track.gradient_percent.tolist()
+        distances = track.distance_miles.tolist()
+        n_points = len(grades)
 
-        for i in range(len(gps_points)):
-            if (
-                gps_points[i].gradient_percent
-                and gps_points[i].gradient_percent <= descent_threshold
-            ):
+        for i in range(n_points):
+            if grades[i] and grades[i] <= descent_threshold:
                 # Check if descent continues for minimum length
-                start_mile = gps_points[i].distance_miles
+                start_mile = distances[i]
                 j = i + 1
                 while (
-                    j < len(gps_points)
-                    and gps_points[j].gradient_percent
-                    and gps_points[j].gradient_percent
-                    <= self.config.descent_continuation_threshold
+                    j < n_points and grades[j] and grades[j] <= continuation_threshold
                 ):
                     j += 1
 
-                end_mile = gps_points[j - 1].distance_miles if j > i + 1 else start_mile
+                end_mile = distances[j - 1] if j > i + 1 else start_mile
                 descent_length = end_mile - start_mile
                 if descent_length >= min_descent_length:
                     technical_sections.append(
                         f"Steep descent at mile {start_mile:.1f} "
-                        f"({descent_length:.1f}mi, {gps_points[i].gradient_percent:.1f}% grade)"
+                        f"({descent_length:.1f}mi, {grades[i]:.1f}% grade)"
                     )
 
         return technical_sections
 
     def _validate_coordinates(
-        self, gps_points: List[GPSPoint], track_points: List
+        self,
+        gps_points: List[GPSPoint],
+        track_points: List,
+        track: Optional[TrackArrays] = None,
     ) -> Dict[str, int]:
         """
         Validate GPS coordinates and return validation results
@@ -557,6 +621,7 @@ class GPSParser:
         Args:
             gps_points: Processed GPS points with calculated distances
             track_points: Original GPX track points
+            track: Column-wise copy of gps_points, built when not given
 
         Returns:
             Dictionary with validation error counts
@@ -569,9 +634,40 @@ class GPSParser:
             "total_validation_errors": 0,
         }
 
+        if track is None:
+            track = TrackArrays.from_points(gps_points)
+
+        # Flag suspect points for the whole track at once; clean points can't
+        # produce errors, so only flagged ones go through the per-point check
+        # (which also logs the details)
+        n_points = min(len(gps_points), len(track_points))
+        lats = track.latitude[:n_points]
+        lons = track.longitude[:n_points]
+        elevations = track.elevation_ft[:n_points]
+        has_elevation = np.fromiter(
+            (point.elevation is not None for point in track_points),
+            dtype=bool,
+            count=len(track_points),
+        )[:n_points]
+        config = self.config
+        suspect = (
+            ~((lats >= config.min_latitude) & (lats <= config.max_latitude))
+            | ~((lons >= config.min_longitude) & (lons <= config.max_longitude))
+            | (
+                has_elevation
+                & ~(
+                    (elevations >= config.min_elevation_ft)
+                    & (elevations <= config.max_elevation_ft)
+                )
+            )
+            | ((np.abs(lats) < 0.0001) & (np.abs(lons) < 0.0001))
+        )
+
         # Validate individual coordinates
-        for i, (gps_point, track_point) in enumerate(zip(gps_points, track_points)):
-            point_errors = self._validate_single_point(gps_point, track_point, i)
+        for i in np.flatnonzero(suspect).tolist():
+            point_errors = self._validate_single_point(
+                gps_points[i], track_points[i], i
+            )
 
             # Aggregate errors
             validation_results["invalid_latitude_points"] += point_errors[
@@ -586,7 +682,7 @@ class GPSParser:
 
         # Validate distance jumps between adjacent points
         validation_results["large_distance_jumps"] = self._validate_distance_jumps(
-            gps_points
+            gps_points, track
         )
 
         # Calculate total errors
@@ -657,31 +753,32 @@ class GPSParser:
 
         return errors
 
-    def _validate_distance_jumps(self, gps_points: List[GPSPoint]) -> int:
+    def _validate_distance_jumps(
+        self, gps_points: List[GPSPoint], track: Optional[TrackArrays] = None
+    ) -> int:
         """
         Validate distance jumps between adjacent GPS points
 
         Args:
             gps_points: List of GPS points with calculated distances
+            track: Column-wise copy of gps_points, built when not given
 
         Returns:
             Number of large distance jumps detected
         """
-        large_jumps = 0
+        if track is None:
+            track = TrackArrays.from_points(gps_points)
 
-        for i in range(1, len(gps_points)):
-            distance_diff = (
-                gps_points[i].distance_miles - gps_points[i - 1].distance_miles
-            )
+        distance_diff = np.diff(track.distance_miles)
+        jumps = np.flatnonzero(distance_diff > self.config.max_distance_jump_miles)
 
-            if distance_diff > self.config.max_distance_jump_miles:
-                large_jumps += 1
-                logger.warning(
-                    f"Large distance jump detected between points {i - 1} and {i}: "
-                    f"{distance_diff:.3f} miles (threshold: {self.config.max_distance_jump_miles} miles)"
-                )
+        for i in (jumps + 1).tolist():
+            logger.warning(
+                f"Large distance jump detected between points {i - 1} and {i}: "
+                f"{distance_diff[i - 1]:.3f} miles (threshold: {self.config.max_distance_jump_miles} miles)"
+            )
 
-        return large_jumps
+        return len(jumps)
 
     def _is_coordinate_valid(
         self, value: float, min_val: float, max_val: float
@@ -700,13 +797,20 @@ class GPSParser:
         return min_val <= value <= max_val
 
     def _generate_metadata(
-        self, file_path: str, gps_points: List[GPSPoint], track_points: List
+        self,
+        file_path: str,
+        gps_points: List[GPSPoint],
+        track_points: List,
+        track: Optional[TrackArrays] = None,
     ) -> GPSMetadata:
         """Generate GPS metadata for quality assessment"""
         missing_elevation = sum(1 for p in track_points if p.elevation is None)
 
+        if track is None:
+            track = TrackArrays.from_points(gps_points)
+
         # Perform coordinate validation
-        validation_results = self._validate_coordinates(gps_points, track_points)
+        validation_results = self._validate_coordinates(gps_points, track_points, track)
 
         # Calculate data quality score including validation errors
         quality_score = 100.0
@@ -730,12 +834,12 @@ class GPSParser:
         # Calculate bounds
         bounds = None
         if gps_points:
-            bounds = {
-                "min_lat": min(p.latitude for p in gps_points),
-                "max_lat": max(p.latitude for p in gps_points),
-                "min_lon": min(p.longitude for p in gps_points),
-                "max_lon": max(p.longitude for p in gps_points),
-            }
+            bounds = CourseBounds(
+                min_lat=float(track.latitude.min()),
+                max_lat=float(track.latitude.max()),
+                min_lon=float(track.longitude.min()),
+                max_lon=float(track.longitude.max()),
+            )
 
         return GPSMetadata(
             source_file=file_path,
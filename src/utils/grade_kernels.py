@@ -0,0 +1,114 @@
+"""
+Array kernels for gradient calculations over GPS elevation profiles
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+FEET_PER_MILE = 5280.0
+
+
+def compute_grades(dist: np.ndarray, elev: np.ndarray) -> np.ndarray:
+    """
+    Compute absolute segment grades between consecutive profile points
+
+    Steps with no distance change are skipped. Distance is measured as the
+    absolute change between points, so out-of-order points still yield a grade.
+
+    Args:
+        dist: Cumulative distance of each point in miles
+        elev: Elevation of each point in feet
+
+    Returns:
+        Array of absolute grades in percent, one per moving step
+    """
+    dist = np.asarray(dist, dtype=np.float64)
+    elev = np.asarray(elev, dtype=np.float64)
+    if dist.size < 2:
+        return np.empty(0, dtype=np.float64)
+
+    d_diff = np.abs(np.diff(dist))
+    moving = d_diff > 0
+    return np.abs(np.diff(elev)[moving] / (d_diff[moving] * FEET_PER_MILE) * 100.0)
+
+
+def find_climb_spans(grades: np.ndarray, min_grade: float) -> np.ndarray:
+    """
+    Locate climbs in a profile's per-point grades
+
+    A climb starts at the first point graded at least ``min_grade``, runs
+    through non-negative grades and ends at the next descending point. Points
+    without a grade (NaN) are ignored, and a climb still open when the profile
+    ends is dropped.
+
+    Args:
+        grades: Grade arriving at each point in percent, NaN where unknown
+        min_grade: Grade in percent that starts a climb; must be positive
+
+    Returns:
+        Integer array of shape (n_climbs, 2) holding each climb's start index
+        and the index of the descending point that ends it
+
+    Raises:
+        ValueError: If min_grade is not positive
+    """
+    if min_grade <= 0:
+        raise ValueError(f"min_grade must be positive, got {min_grade}")
+
+    grades = np.asarray(grades, dtype=np.float64)
+    graded = np.flatnonzero(~np.isnan(grades))
+    values = grades[graded]
+
+    # Descending points split the profile into runs; run r is closed by the
+    # r-th descent, and its climb starts at the run's first steep point
+    descending = values < 0
+    run = np.cumsum(descending) - descending
+    ends = graded[descending]
+    steep = np.flatnonzero(values >= min_grade)
+    runs, first = np.unique(run[steep], return_index=True)
+    closed = runs < len(ends)
+
+    return np.column_stack((graded[steep[first[closed]]], ends[runs[closed]]))
+
+
+def classify_climb_grades(grades: np.ndarray) -> Tuple[int, int, int]:
+    """
+    Count climbs in the easy (<6%), moderate (6-10%) and hard (>=10%) bands
+
+    Args:
+        grades: Average grade of each climb in percent
+
+    Returns:
+        Tuple of (easy, moderate, hard) climb counts
+    """
+    grades = np.asarray(grades, dtype=np.float64)
+    return (
+        int((grades < 6).sum()),
+        int(((grades >= 6) & (grades < 10)).sum()),
+        int((grades >= 10).sum()),
+    )
+
+
+def elevation_gain_per_mile(
+    gain_ft: np.ndarray, distance_miles: np.ndarray, fill: float = np.inf
+) -> np.ndarray:
+    """
+    Compute elevation gain per mile for a batch of courses
+
+    Args:
+        gain_ft: Elevation gain of each course in feet
+        distance_miles: Distance of each course in miles
+        fill: Value used for courses without a positive distance
+
+    Returns:
+        Array of feet climbed per mile
+    """
+    gain_ft = np.asarray(gain_ft, dtype=np.float64)
+    distance_miles = np.asarray(distance_miles, dtype=np.float64)
+    return np.divide(
+        gain_ft,
+        distance_miles,
+        out=np.full(gain_ft.shape, fill),
+        where=distance_miles > 0,
+    )
@@ -6,10 +6,60 @@ based on athlete physiology, race duration, and environmental conditions.
 """
 
 import math
-from typing import Dict, List, Tuple
+from typing import Dict, NamedTuple, Tuple
+
+import numpy as np
+from numpy.typing import ArrayLike, DTypeLike
 
 from ..models.athlete import AthleteProfile
 from ..models.conditions import RaceConditions
+from ..models.nutrition import HourlySchedule
+
+# Fluid replacement target: 80-85% of sweat losses (prevents overhydration)
+FLUID_REPLACEMENT_PERCENTAGE = 82.5
+_FLUID_REPLACEMENT_FRACTION = FLUID_REPLACEMENT_PERCENTAGE / 100
+
+# Per-nutrient (carbs, fluids, sodium) intake factors for the opening hour and
+# a short final hour; built once and broadcast over every schedule
+_FIRST_HOUR_FACTORS = np.array([0.7, 0.8, 0.8])
+_FINAL_HOUR_FACTORS = np.array([0.8, 1.0, 1.0])
+
+
+class ScenarioSweep(NamedTuple):
+    """Per-scenario hydration targets from NutritionCalculator.sweep_scenarios"""
+
+    sweat_rate_oz_per_hour: np.ndarray
+    sodium_mg_per_hour: np.ndarray
+    fluid_oz_per_hour: np.ndarray
+    replacement_percentage: float
+
+
+def _sweat_rate_kernel(
+    weight_lbs: float, temperature_f: float, humidity_percent: float
+) -> float:
+    """Scalar sweat rate in oz/hr; mirrors calculate_sweat_rate_batch"""
+    total = (
+        NutritionCalculator.BASE_SWEAT_RATE_OZ_PER_HOUR
+        + (weight_lbs - 150) * NutritionCalculator.WEIGHT_SWEAT_FACTOR
+        + max(0, temperature_f - 68) * NutritionCalculator.TEMP_SWEAT_MULTIPLIER
+        + max(0, humidity_percent - 40) * NutritionCalculator.HUMIDITY_SWEAT_MULTIPLIER
+    )
+    return float(min(max(total, 12), 50))
+
+
+def _sodium_kernel(sweat_rate_oz_per_hour: float, temperature_f: float) -> int:
+    """Scalar sodium need in mg/hr; mirrors calculate_sodium_needs_batch"""
+    sodium = NutritionCalculator.BASE_SODIUM_PER_HOUR
+    if sweat_rate_oz_per_hour > 30:
+        sodium += NutritionCalculator.HIGH_SWEAT_SODIUM_BONUS
+    if temperature_f > 80:
+        sodium += NutritionCalculator.HOT_WEATHER_SODIUM_BONUS
+    return min(sodium, 800)
+
+
+def _fluid_kernel(sweat_rate_oz_per_hour: float) -> int:
+    """Scalar fluid target in oz/hr; mirrors calculate_fluid_replacement_batch"""
+    return min(max(int(sweat_rate_oz_per_hour * _FLUID_REPLACEMENT_FRACTION), 12), 32)
 
 
 class NutritionCalculator:
@@ -54,26 +104,57 @@ class NutritionCalculator:
         Returns:
             Predicted sweat rate in oz per hour
         """
-        base_rate = self.BASE_SWEAT_RATE_OZ_PER_HOUR
+        return _sweat_rate_kernel(
+            athlete.weight_lbs, conditions.temperature_f, conditions.humidity_percent
+        )
+
+    def calculate_sweat_rate_batch(
+        self,
+        weight_lbs: ArrayLike,
+        temperature_f: ArrayLike,
+        humidity_percent: ArrayLike,
+        dtype: DTypeLike = np.float64,
+    ) -> np.ndarray:
+        """
+        Calculate predicted sweat rates for many scenarios at once.
+
+        Inputs broadcast against each other, so a single athlete weight can be
+        combined with arrays of temperatures and humidities.
+
+        Args:
+            weight_lbs: Athlete weight(s) in lbs
+            temperature_f: Air temperature(s) in °F
+            humidity_percent: Relative humidity value(s) in %
+            dtype: Float type to compute in; np.float32 halves memory for large
+                sweeps at the cost of matching the scalar methods only to ~1e-5
+
+        Returns:
+            Array of predicted sweat rates in oz per hour
+        """
+        weight = np.asarray(weight_lbs, dtype=dtype)
+        temp = np.asarray(temperature_f, dtype=dtype)
+        humidity = np.asarray(humidity_percent, dtype=dtype)
 
         # Weight adjustment (heavier athletes sweat more)
-        weight_diff = athlete.weight_lbs - 150  # Reference weight
-        weight_adjustment = weight_diff * self.WEIGHT_SWEAT_FACTOR
+        weight_adjustment = (weight - 150) * self.WEIGHT_SWEAT_FACTOR  # Reference
 
-        # Temperature adjustment (more sweat in heat)
-        temp_diff = max(0, conditions.temperature_f - 68)  # Neutral temperature
-        temp_adjustment = temp_diff * self.TEMP_SWEAT_MULTIPLIER
+        # Temperature adjustment (more sweat in heat); 68°F is neutral
+        temp_adjustment = np.maximum(temp - 68, 0) * self.TEMP_SWEAT_MULTIPLIER
 
-        # Humidity adjustment (impairs evaporative cooling)
-        humidity_diff = max(0, conditions.humidity_percent - 40)  # Comfortable humidity
-        humidity_adjustment = humidity_diff * self.HUMIDITY_SWEAT_MULTIPLIER
+        # Humidity adjustment (impairs evaporative cooling); 40% is comfortable
+        humidity_adjustment = (
+            np.maximum(humidity - 40, 0) * self.HUMIDITY_SWEAT_MULTIPLIER
+        )
 
         total_sweat_rate = (
-            base_rate + weight_adjustment + temp_adjustment + humidity_adjustment
+            self.BASE_SWEAT_RATE_OZ_PER_HOUR
+            + weight_adjustment
+            + temp_adjustment
+            + humidity_adjustment
         )
 
         # Cap at reasonable physiological limits
-        return min(max(total_sweat_rate, 12), 50)  # 12-50 oz/hr range
+        return np.clip(total_sweat_rate, 12, 50)  # 12-50 oz/hr range
 
     def calculate_carb_needs(
         self, race_duration_hours: float, intensity: str = "moderate"
@@ -129,18 +210,34 @@ class NutritionCalculator:
         Returns:
             Sodium needs per hour in mg
         """
-        base_sodium = self.BASE_SODIUM_PER_HOUR
+        return _sodium_kernel(sweat_rate_oz_per_hour, conditions.temperature_f)
 
-        # High sweat rate bonus
-        if sweat_rate_oz_per_hour > 30:
-            base_sodium += self.HIGH_SWEAT_SODIUM_BONUS
+    def calculate_sodium_needs_batch(
+        self, sweat_rate_oz_per_hour: ArrayLike, temperature_f: ArrayLike
+    ) -> np.ndarray:
+        """
+        Calculate sodium needs per hour in mg for many scenarios at once.
 
-        # Hot weather bonus
-        if conditions.temperature_f > 80:
-            base_sodium += self.HOT_WEATHER_SODIUM_BONUS
+        Args:
+            sweat_rate_oz_per_hour: Sweat rate(s) from calculate_sweat_rate_batch
+            temperature_f: Air temperature(s) in °F
+
+        Returns:
+            Integer array of sodium needs per hour in mg
+        """
+        sweat_rate = np.asarray(sweat_rate_oz_per_hour)
+        temp = np.asarray(temperature_f)
+
+        base_sodium = (
+            self.BASE_SODIUM_PER_HOUR
+            # High sweat rate bonus
+            + np.where(sweat_rate > 30, self.HIGH_SWEAT_SODIUM_BONUS, 0)
+            # Hot weather bonus
+            + np.where(temp > 80, self.HOT_WEATHER_SODIUM_BONUS, 0)
+        )
 
         # Cap at safe physiological limits
-        return min(base_sodium, 800)  # Max ~800mg/hr for safety
+        return np.minimum(base_sodium, 800)  # Max ~800mg/hr for safety
 
     def calculate_fluid_replacement(
         self, sweat_rate_oz_per_hour: float
@@ -157,14 +254,62 @@ class NutritionCalculator:
         Returns:
             Tuple of (fluid_oz_per_hour, replacement_percentage)
         """
+        # Replace 80-85% of sweat losses, within gastric emptying limits
+        return _fluid_kernel(sweat_rate_oz_per_hour), FLUID_REPLACEMENT_PERCENTAGE
+
+    def calculate_fluid_replacement_batch(
+        self, sweat_rate_oz_per_hour: ArrayLike
+    ) -> Tuple[np.ndarray, float]:
+        """
+        Calculate fluid replacement targets for many sweat rates at once.
+
+        Args:
+            sweat_rate_oz_per_hour: Sweat rate(s) from calculate_sweat_rate_batch
+
+        Returns:
+            Tuple of (integer array of fluid oz per hour, replacement_percentage)
+        """
         # Replace 80-85% of sweat losses (prevents overhydration)
-        replacement_percentage = 82.5
-        fluid_per_hour = int(sweat_rate_oz_per_hour * (replacement_percentage / 100))
+        fluid_per_hour = np.trunc(
+            np.asarray(sweat_rate_oz_per_hour) * _FLUID_REPLACEMENT_FRACTION
+        ).astype(np.int64)
 
         # Practical limits for gastric emptying
-        fluid_per_hour = min(max(fluid_per_hour, 12), 32)  # 12-32 oz/hr
+        fluid_per_hour = np.clip(fluid_per_hour, 12, 32)  # 12-32 oz/hr
 
-        return fluid_per_hour, replacement_percentage
+        return fluid_per_hour, FLUID_REPLACEMENT_PERCENTAGE
+
+    def sweep_scenarios(
+        self,
+        weight_lbs: ArrayLike,
+        temperature_f: ArrayLike,
+        humidity_percent: ArrayLike,
+        dtype: DTypeLike = np.float64,
+    ) -> ScenarioSweep:
+        """
+        Evaluate sweat, sodium and fluid targets across many race-day scenarios.
+
+        Inputs broadcast together, so a heat/humidity grid for one athlete is
+        evaluated in a single vectorized pass.
+
+        Args:
+            weight_lbs: Athlete weight(s) in lbs
+            temperature_f: Air temperature(s) in °F
+            humidity_percent: Relative humidity value(s) in %
+            dtype: Float type for the sweat-rate math (see
+                calculate_sweat_rate_batch)
+
+        Returns:
+            ScenarioSweep with one entry per scenario in each array
+        """
+        sweat_rates = self.calculate_sweat_rate_batch(
+            weight_lbs, temperature_f, humidity_percent, dtype=dtype
+        )
+        sodium = self.calculate_sodium_needs_batch(sweat_rates, temperature_f)
+        fluids, replacement_percentage = self.calculate_fluid_replacement_batch(
+            sweat_rates
+        )
+        return ScenarioSweep(sweat_rates, sodium, fluids, replacement_percentage)
 
     def generate_hourly_schedule(
         self,
@@ -172,7 +317,7 @@ class NutritionCalculator:
         carbs_per_hour: int,
         fluid_per_hour: int,
         sodium_per_hour: int,
-    ) -> Dict[str, List[int]]:
+    ) -> HourlySchedule:
         """
         Generate hour-by-hour nutrition targets.
 
@@ -188,41 +333,32 @@ class NutritionCalculator:
             sodium_per_hour: Target sodium per hour
 
         Returns:
-            Dict with hourly targets for each nutrient
+            HourlySchedule with carbs, fluids and sodium arrays (one entry per
+            hour); also indexable as ``schedule["carbs"]``
         """
         num_hours = int(math.ceil(race_duration_hours))
+        targets = np.array(
+            [carbs_per_hour, fluid_per_hour, sodium_per_hour], dtype=np.float64
+        )
+
+        # Rows are carbs, fluids and sodium; middle hours get full targets
+        schedule = np.empty((3, num_hours))
+        schedule[:] = targets[:, None]
+
+        # Final partial hour: reduce if close to finish
+        partial_hour = race_duration_hours - (num_hours - 1)
+        if num_hours > 1 and partial_hour < 0.75:
+            schedule[:, -1] = targets * partial_hour * _FINAL_HOUR_FACTORS
+
+        # First hour: reduce intake due to race start
+        if num_hours > 0:
+            schedule[:, 0] = targets * _FIRST_HOUR_FACTORS
 
-        carb_schedule = []
-        fluid_schedule = []
-        sodium_schedule = []
-
-        for hour in range(num_hours):
-            # First hour: reduce intake due to race start
-            if hour == 0:
-                carb_hour = int(carbs_per_hour * 0.7)
-                fluid_hour = int(fluid_per_hour * 0.8)
-                sodium_hour = int(sodium_per_hour * 0.8)
-            # Final partial hour: reduce if close to finish
-            elif hour == num_hours - 1 and (race_duration_hours - hour) < 0.75:
-                partial_hour = race_duration_hours - hour
-                carb_hour = int(carbs_per_hour * partial_hour * 0.8)
-                fluid_hour = int(fluid_per_hour * partial_hour)
-                sodium_hour = int(sodium_per_hour * partial_hour)
-            # Middle hours: full targets
-            else:
-                carb_hour = carbs_per_hour
-                fluid_hour = fluid_per_hour
-                sodium_hour = sodium_per_hour
-
-            carb_schedule.append(carb_hour)
-            fluid_schedule.append(fluid_hour)
-            sodium_schedule.append(sodium_hour)
-
-        return {
-            "carbs": carb_schedule,
-            "fluids": fluid_schedule,
-            "sodium": sodium_schedule,
-        }
+        # Truncate in place, then cast; each row of the C-ordered result is a
+        # contiguous per-nutrient buffer
+        np.trunc(schedule, out=schedule)
+        carbs, fluids, sodium = schedule.astype(np.int64)
+        return HourlySchedule(carbs=carbs, fluids=fluids, sodium=sodium)
 
     def assess_environmental_risk(self, conditions: RaceConditions) -> Dict[str, str]:
         """
@@ -6,7 +6,7 @@ Comprehensive tests for the course difficulty calculator.
 import pytest
 
 from src.models.course import ClimbSegment, CourseProfile
-from src.utils.course_analyzer import DifficultyCalculator
+from src.utils.course_analyzer import DifficultyCalculator, elevation_rating_index
 from src.utils.course_loader import (
     load_alpe_dhuez_real,
     load_happy_valley_70_3_gps,
@@ -166,6 +166,23 @@ class TestDifficultyCalculator:
             mountain_clustering > hilly_clustering
         )  # Mountain climbs are more sustained
 
+    def test_climb_arrays_columns(self, hilly_course, flat_course):
+        """Test the column-wise climb view mirrors key_climbs."""
+        climbs = hilly_course.climb_arrays()
+
+        assert len(climbs) == len(hilly_course.key_climbs)
+        assert climbs.names == [c.name for c in hilly_course.key_climbs]
+        assert climbs.start_mile.tolist() == [
+            c.start_mile for c in hilly_course.key_climbs
+        ]
+        assert climbs.avg_grade.tolist() == [
+            c.avg_grade for c in hilly_course.key_climbs
+        ]
+
+        empty = flat_course.climb_arrays()
+        assert len(empty) == 0
+        assert empty.max_grade.shape == (0,)
+
     def test_technical_difficulty_scoring(
         self, calculator, flat_course, mountain_course
     ):
@@ -382,3 +399,41 @@ class TestDifficultyCalculator:
         assert metrics.overall_rating == 1.0
         assert metrics.elevation_intensity == 0
         assert metrics.crux_segments == []
+
+
+class TestElevationRatingIndex:
+    """Test suite for the shared elevation-per-mile rating buckets."""
+
+    @pytest.mark.parametrize(
+        "elevation_gain_ft, expected",
+        [(0, 0), (4999, 0), (5000, 1), (14999, 1), (15000, 2), (30000, 3), (50000, 4)],
+    )
+    def test_threshold_boundaries(self, elevation_gain_ft, expected):
+        """Each threshold value starts the next rating bucket."""
+        course = CourseProfile(
+            name="Rating Test Course",
+            bike_distance_miles=100.0,
+            bike_elevation_gain_ft=elevation_gain_ft,
+            swim_distance_miles=0,
+            run_distance_miles=0,
+            run_elevation_gain_ft=0,
+            key_climbs=[],
+            technical_sections=[],
+        )
+
+        assert elevation_rating_index(course) == expected
+
+    def test_zero_distance_is_easiest(self):
+        """Courses without a bike distance fall in the lowest bucket."""
+        course = CourseProfile(
+            name="No Distance",
+            bike_distance_miles=0,
+            bike_elevation_gain_ft=1000,
+            swim_distance_miles=0,
+            run_distance_miles=0,
+            run_elevation_gain_ft=0,
+            key_climbs=[],
+            technical_sections=[],
+        )
+
+        assert elevation_rating_index(course) == 0
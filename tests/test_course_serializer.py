@@ -0,0 +1,109 @@
+"""
+Tests for writing GPS-derived course profiles to course JSON.
+"""
+
+import errno
+import json
+import os
+
+import pytest
+
+from src.models.course import ClimbSegment, CourseProfile, GPSPoint
+from src.utils.course_serializer import (
+    CLIMB_JSON_FIELDS,
+    course_profile_to_json_dict,
+    save_course_json,
+)
+
+
+def _course() -> CourseProfile:
+    return CourseProfile(
+        name="Parsed Course",
+        bike_distance_miles=20.5,
+        bike_elevation_gain_ft=1500,
+        swim_distance_miles=0.0,
+        run_distance_miles=0.0,
+        run_elevation_gain_ft=0,
+        key_climbs=[
+            ClimbSegment(
+                "Climb at mile 3.0",
+                3.0,
+                1.5,
+                5.2,
+                9.0,
+                400,
+                start_coords=(40.0, -74.0),
+                gps_points=[GPSPoint(40.0, -74.0, 100.0, 3.0)],
+            )
+        ],
+        technical_sections=["Steep descent at mile 8.0 (0.3mi, -9.0% grade)"],
+    )
+
+
+class TestCourseSerializer:
+    """Test course JSON conversion and writing"""
+
+    def test_climbs_keep_only_json_fields(self):
+        """Climb coordinates and GPS points are not serialized"""
+        course_dict = course_profile_to_json_dict(_course())
+
+        (climb,) = course_dict["key_climbs"]
+        assert tuple(climb) == CLIMB_JSON_FIELDS
+        assert climb["avg_grade"] == 5.2
+
+    def test_overrides_fill_course_metadata(self):
+        """Overrides supply details the GPX track doesn't carry"""
+        course_dict = course_profile_to_json_dict(
+            _course(),
+            {
+                "name": "Configured Name",
+                "run_distance_miles": 11.8,
+                "source": "Ride with GPS",
+                "data_source": {"route_id": "123"},
+            },
+        )
+
+        assert course_dict["name"] == "Configured Name"
+        assert course_dict["run_distance_miles"] == 11.8
+        assert course_dict["location"] == "Unknown"
+        assert course_dict["data_source"]["source"] == "Ride with GPS"
+        assert course_dict["data_source"]["route_id"] == "123"
+        # Profiles without GPS metadata still serialize
+        assert course_dict["data_source"]["parsed_at"] is None
+
+    def test_save_course_json_round_trips(self, tmp_path):
+        """Saved JSON loads back to the same dictionary"""
+        course_dict = course_profile_to_json_dict(
+            _course(), {"location": "Alpes, France"}
+        )
+        output = tmp_path / "course.json"
+
+        save_course_json(course_dict, str(output))
+
+        assert json.loads(output.read_text(encoding="utf-8")) == course_dict
+        assert "Alpes, France" in output.read_text(encoding="utf-8")
+
+    def test_save_course_json_replaces_existing_file(self, tmp_path):
+        """Rewriting a course leaves only the final file behind"""
+        output = tmp_path / "course.json"
+        output.write_text("stale contents that are longer than the new JSON" * 100)
+
+        save_course_json({"name": "Café"}, str(output))
+
+        assert json.loads(output.read_text(encoding="utf-8")) == {"name": "Café"}
+        assert [p.name for p in tmp_path.iterdir()] == ["course.json"]
+
+    def test_failed_save_leaves_no_temp_file(self, tmp_path, monkeypatch):
+        """A write error keeps the old course and cleans up the temp file"""
+        output = tmp_path / "course.json"
+        output.write_text('{"name": "Old"}', encoding="utf-8")
+
+        def disk_full(fd, data):
+            raise OSError(errno.ENOSPC, "No space left on device")
+
+        monkeypatch.setattr(os, "write", disk_full)
+        with pytest.raises(OSError):
+            save_course_json({"name": "New"}, str(output))
+
+        assert output.read_text(encoding="utf-8") == '{"name": "Old"}'
+        assert [p.name for p in tmp_path.iterdir()] == ["course.json"]
@@ -242,6 +242,22 @@ class TestDataValidator:
         assert gain_result is not None
         assert not gain_result.passed
 
+    def test_elevation_bounds_skip_missing_values(self):
+        """Missing elevations are ignored when checking elevation bounds."""
+        course = self.create_mock_course()
+        course.elevation_profile = [
+            GPSPoint(40.0, -74.0, elevation, i * 0.1)
+            for i, elevation in enumerate([100.0, None, 30000.0, -600.0, 200.0])
+        ]
+
+        results = self.validator._validate_elevation_data(course)
+        bounds_result = next(r for r in results if r.check_name == "Elevation Bounds")
+
+        assert not bounds_result.passed
+        assert bounds_result.details["invalid_count"] == 2
+        assert bounds_result.details["min_elevation"] == -600.0
+        assert bounds_result.details["max_elevation"] == 30000.0
+
     def test_gradient_calculations_validation(self):
         """Test gradient calculations validation."""
         # Test course with no climbs
@@ -0,0 +1,112 @@
+"""
+Tests for the on-disk course and GPX cache.
+"""
+
+import os
+
+import pytest
+
+from src.utils import disk_cache
+from src.utils.course_loader import load_course_cached, load_course_from_json
+from src.utils.gps_parser import GPSParser
+
+
+class TestDiskCache:
+    """Test pickle cache behaviour"""
+
+    def test_cached_call_computes_once(self, tmp_path):
+        """Second call with the same key is served from disk"""
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return {"value": 42}
+
+        first = disk_cache.cached_call("test", "key", compute, cache_dir=tmp_path)
+        second = disk_cache.cached_call("test", "key", compute, cache_dir=tmp_path)
+
+        assert first == second == {"value": 42}
+        assert len(calls) == 1
+        assert (tmp_path / "test" / "key.pkl").exists()
+
+    def test_cache_disabled_via_env(self, tmp_path, monkeypatch):
+        """CACHE_RESULTS=false bypasses the cache entirely"""
+        monkeypatch.setenv("CACHE_RESULTS", "false")
+        disk_cache.cached_call("test", "key", lambda: 1, cache_dir=tmp_path)
+
+        assert not (tmp_path / "test").exists()
+
+    def test_corrupt_entry_is_rebuilt(self, tmp_path):
+        """Unreadable entries are treated as misses"""
+        entry_dir = tmp_path / "test"
+        entry_dir.mkdir()
+        (entry_dir / "key.pkl").write_bytes(b"not a pickle")
+
+        value = disk_cache.cached_call(
+            "test", "key", lambda: "fresh", cache_dir=tmp_path
+        )
+
+        assert value == "fresh"
+
+    def test_file_cache_key_changes_with_mtime(self, tmp_path):
+        """Touching the source file produces a new key"""
+        source = tmp_path / "course.json"
+        source.write_text("{}")
+        key_before = disk_cache.file_cache_key(source)
+
+        stat = source.stat()
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert disk_cache.file_cache_key(source) != key_before
+
+    def test_content_cache_key_tracks_contents(self, tmp_path):
+        """Content keys ignore mtime but change when the bytes change"""
+        source = tmp_path / "course.gpx"
+        source.write_text("<gpx/>")
+        key_before = disk_cache.content_cache_key(source, 1)
+
+        stat = source.stat()
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert disk_cache.content_cache_key(source, 1) == key_before
+        assert disk_cache.content_cache_key(source, 2) != key_before
+
+        source.write_text("<gpx></gpx>")
+        assert disk_cache.content_cache_key(source, 1) != key_before
+
+    def test_cached_course_matches_fresh_load(self, tmp_path, monkeypatch):
+        """Cached bundled course is equivalent to a direct JSON load"""
+        monkeypatch.setattr(disk_cache, "CACHE_DIR", tmp_path)
+
+        cached = load_course_cached("alpe_dhuez_real")
+        reloaded = load_course_cached("alpe_dhuez_real")
+        fresh = load_course_from_json("alpe_dhuez_real")
+
+        assert cached == fresh
+        assert reloaded == fresh
+        assert any((tmp_path / "courses").iterdir())
+
+    def test_cached_gpx_parse_reuses_profile(self, tmp_path, monkeypatch):
+        """A second cached parse of an unchanged GPX file skips parsing"""
+        monkeypatch.setattr(disk_cache, "CACHE_DIR", tmp_path / "cache")
+        gpx_file = tmp_path / "climb.gpx"
+        gpx_file.write_text(
+            '<?xml version="1.0"?><gpx version="1.1" creator="Test"><trk><trkseg>'
+            + "".join(
+                f'<trkpt lat="40.{i:04d}" lon="-74.0000"><ele>{100 + 50 * i}</ele>'
+                "</trkpt>"
+                for i in range(5)
+            )
+            + "</trkseg></trk></gpx>"
+        )
+
+        first = GPSParser().parse_gpx_file_cached(str(gpx_file))
+
+        # A fresh parser with the same settings should hit the cache
+        parser = GPSParser()
+        monkeypatch.setattr(
+            parser, "parse_gpx_file", lambda path: pytest.fail("GPX was reparsed")
+        )
+        second = parser.parse_gpx_file_cached(str(gpx_file))
+
+        assert second == first
+        assert any((tmp_path / "cache" / "gpx_profiles").iterdir())
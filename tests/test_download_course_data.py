@@ -0,0 +1,76 @@
+"""
+Tests for conditional Ride with GPS downloads in the course download script.
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import download_course_data  # noqa: E402
+
+
+def _response(status_code=200, chunks=(b"<gpx/>",), headers=None, fail=False):
+    """Build a streamed response mock, optionally failing mid-body"""
+
+    def iter_content(chunk_size):
+        yield from chunks
+        if fail:
+            raise requests.exceptions.ChunkedEncodingError("connection reset")
+
+    response = MagicMock()
+    response.__enter__.return_value = response
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.iter_content.side_effect = iter_content
+    return response
+
+
+class TestDownloadGpx:
+    """Test ETag revalidation of downloaded GPX files"""
+
+    def test_unchanged_route_reuses_file(self, tmp_path, monkeypatch):
+        """A 304 answer to the stored ETag keeps the existing download"""
+        output = tmp_path / "route.gpx"
+        get = MagicMock(
+            side_effect=[
+                _response(headers={"ETag": '"v1"'}),
+                _response(status_code=304),
+            ]
+        )
+        monkeypatch.setattr(download_course_data._session, "get", get)
+
+        download_course_data.download_gpx_from_ridewithgps("1", str(output))
+        download_course_data.download_gpx_from_ridewithgps("1", str(output))
+
+        assert get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+        assert output.read_bytes() == b"<gpx/>"
+        assert output.stat().st_mode & 0o777 == 0o644
+
+    def test_failed_download_keeps_file_and_drops_etag(self, tmp_path, monkeypatch):
+        """A transfer cut off mid-stream neither truncates nor revalidates"""
+        output = tmp_path / "route.gpx"
+        get = MagicMock(
+            side_effect=[
+                _response(headers={"ETag": '"v1"'}),
+                _response(chunks=(b"<gp",), headers={"ETag": '"v2"'}, fail=True),
+                _response(chunks=(b"<gpx>v2</gpx>",), headers={"ETag": '"v2"'}),
+            ]
+        )
+        monkeypatch.setattr(download_course_data._session, "get", get)
+
+        download_course_data.download_gpx_from_ridewithgps("1", str(output))
+        with pytest.raises(Exception, match="Failed to download GPX file"):
+            download_course_data.download_gpx_from_ridewithgps("1", str(output))
+
+        assert output.read_bytes() == b"<gpx/>"
+        assert [p.name for p in tmp_path.iterdir()] == ["route.gpx"]
+
+        download_course_data.download_gpx_from_ridewithgps("1", str(output))
+
+        assert "If-None-Match" not in get.call_args.kwargs["headers"]
+        assert output.read_bytes() == b"<gpx>v2</gpx>"
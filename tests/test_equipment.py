@@ -328,6 +328,25 @@ class TestEquipmentDatabase:
         assert "second" in savings.lower() or "minute" in savings.lower()
         assert any(char.isdigit() for char in savings)
 
+    def test_recommend_all_matches_individual_calls(self):
+        """recommend_all should agree with the individual recommendation methods"""
+        selection = self.db.recommend_all(
+            self.hilly_course, self.athlete, self.windy_conditions
+        )
+
+        assert selection.course_analysis == self.db.analyze_course_demands(
+            self.hilly_course
+        )
+        assert (selection.wheels, selection.wheel_rationale) == (
+            self.db.recommend_wheels(self.hilly_course, self.windy_conditions)
+        )
+        assert (selection.shoes, selection.shoe_rationale) == (
+            self.db.recommend_running_shoes(self.hilly_course, self.athlete)
+        )
+        assert selection.wetsuit_decision in ["wetsuit", "no-wetsuit"]
+        assert selection.gearing == "compact"
+        assert "minute" in selection.time_savings
+
     def test_equipment_rationale_generation(self):
         """Test that all recommendations include rationales"""
         # Test gearing rationale
@@ -0,0 +1,44 @@
+"""
+Tests for the GPS track distance kernels.
+"""
+
+import numpy as np
+from geopy.distance import geodesic
+
+from src.utils.geo_kernels import geodesic_step_miles
+
+
+class TestGeodesicStepMiles:
+    """Test suite for geodesic_step_miles."""
+
+    def test_matches_geopy_geodesic(self):
+        """Vectorized steps should match geopy's ellipsoidal distance."""
+        rng = np.random.default_rng(0)
+        lats = 40.0 + np.cumsum(rng.normal(0, 0.001, size=300))
+        lons = -77.0 + np.cumsum(rng.normal(0, 0.001, size=300))
+
+        expected = [
+            geodesic((lats[i - 1], lons[i - 1]), (lats[i], lons[i])).miles
+            for i in range(1, len(lats))
+        ]
+
+        np.testing.assert_allclose(
+            geodesic_step_miles(lats, lons), expected, rtol=1e-7, atol=1e-8
+        )
+
+    def test_repeated_point_has_zero_distance(self):
+        """A point recorded twice should add no distance."""
+        np.testing.assert_array_equal(
+            geodesic_step_miles([45.0, 45.0], [7.0, 7.0]), [0.0]
+        )
+
+    def test_out_of_range_latitude_is_nan(self):
+        """Steps touching an impossible latitude cannot be measured."""
+        steps = geodesic_step_miles([95.0, 45.0, 45.1], [7.0, 7.0, 7.0])
+        assert np.isnan(steps[0])
+        assert np.isfinite(steps[1])
+
+    def test_short_tracks_return_empty(self):
+        """Tracks with fewer than two points have no steps."""
+        assert geodesic_step_miles([], []).size == 0
+        assert geodesic_step_miles([45.0], [7.0]).size == 0
@@ -4,9 +4,10 @@ import tempfile
 from datetime import datetime
 from unittest.mock import Mock
 
+import numpy as np
 import pytest
 
-from src.models.course import CourseProfile, GPSPoint
+from src.models.course import CourseBounds, CourseProfile, GPSPoint, TrackArrays
 from src.utils.gps_parser import ActivityConfig, GPSParser, GPSParserConfig
 
 
@@ -143,6 +144,27 @@ class TestGPSParser:
         assert climb.start_coords is not None
         assert climb.end_coords is not None
 
+    def test_track_arrays_mirror_points(self):
+        """Test the column-wise track view used by the parser's scans"""
+        gps_points = [
+            GPSPoint(40.0000, -74.0000, 100.0, 0.0),
+            GPSPoint(40.0010, -74.0000, 120.0, 0.2, 4.0),
+        ]
+
+        track = TrackArrays.from_points(gps_points)
+
+        assert len(track) == 2
+        assert track.latitude.tolist() == [40.0, 40.001]
+        assert track.distance_miles.tolist() == [0.0, 0.2]
+        # Points without a gradient are stored as NaN
+        assert np.isnan(track.gradient_percent[0])
+        assert track.gradient_percent[1] == 4.0
+
+        # Climb detection gives the same result with precomputed arrays
+        assert self.parser._detect_climbs(gps_points, track) == (
+            self.parser._detect_climbs(gps_points)
+        )
+
     def test_short_climb_filtering(self):
         """Test that climbs shorter than minimum distance are filtered out"""
         # Create a short, steep climb
@@ -206,7 +228,9 @@ class TestGPSParser:
         assert metadata.total_points == 3
         assert metadata.missing_elevation_points == 1
         assert metadata.data_quality_score < 100  # Penalized for missing data
-        assert metadata.bounds is not None
+        assert metadata.bounds == CourseBounds(
+            min_lat=40.0, max_lat=40.2, min_lon=-74.2, max_lon=-74.0
+        )
         assert isinstance(metadata.parsed_at, datetime)
 
     def test_data_smoothing(self):
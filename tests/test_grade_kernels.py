@@ -0,0 +1,102 @@
+"""
+Tests for the elevation profile grade kernels.
+"""
+
+import numpy as np
+import pytest
+
+from src.models.course import CourseProfile, GPSPoint
+from src.utils.grade_kernels import (
+    classify_climb_grades,
+    compute_grades,
+    elevation_gain_per_mile,
+    find_climb_spans,
+)
+
+
+class TestComputeGrades:
+    """Test suite for compute_grades."""
+
+    def test_matches_point_by_point_loop(self):
+        """Vectorized grades should match a scalar loop over the points."""
+        rng = np.random.default_rng(0)
+        dist = np.cumsum(rng.choice([0.0, 0.05, 0.1], size=200))
+        elev = rng.uniform(0, 2000, size=200)
+
+        expected = []
+        for i in range(1, len(dist)):
+            step = abs(dist[i] - dist[i - 1])
+            if step > 0:
+                expected.append(abs((elev[i] - elev[i - 1]) / (step * 5280) * 100))
+
+        np.testing.assert_allclose(compute_grades(dist, elev), expected)
+
+    def test_skips_zero_distance_steps(self):
+        """Points recorded at the same distance should not produce a grade."""
+        grades = compute_grades([0.0, 0.0, 1.0], [100.0, 200.0, 252.8])
+        np.testing.assert_allclose(grades, [1.0])
+
+    def test_short_profiles_return_empty(self):
+        """Profiles with fewer than two points have no grades."""
+        assert compute_grades([], []).size == 0
+        assert compute_grades([1.0], [100.0]).size == 0
+
+    def test_course_profile_elevation_arrays(self):
+        """CourseProfile.elevation_arrays should feed compute_grades directly."""
+        course = CourseProfile(
+            name="Array Test Course",
+            bike_distance_miles=1.0,
+            bike_elevation_gain_ft=53,
+            swim_distance_miles=0.0,
+            run_distance_miles=0.0,
+            run_elevation_gain_ft=0,
+            key_climbs=[],
+            technical_sections=[],
+            elevation_profile=[
+                GPSPoint(0.0, 0.0, elevation_ft=100.0, distance_miles=0.0),
+                GPSPoint(0.0, 0.0, elevation_ft=152.8, distance_miles=1.0),
+            ],
+        )
+
+        dist, elev = course.elevation_arrays()
+
+        np.testing.assert_array_equal(dist, [0.0, 1.0])
+        np.testing.assert_array_equal(elev, [100.0, 152.8])
+        np.testing.assert_allclose(compute_grades(dist, elev), [1.0])
+
+
+class TestCourseKernels:
+    """Test suite for the climb and course batch kernels."""
+
+    def test_classify_climb_grades_band_edges(self):
+        """6% and 10% start the moderate and hard bands."""
+        assert classify_climb_grades([2.0, 5.9, 6.0, 9.9, 10.0, 14.0]) == (2, 2, 2)
+
+    def test_classify_climb_grades_empty(self):
+        """No climbs means no counts in any band."""
+        assert classify_climb_grades([]) == (0, 0, 0)
+
+    def test_elevation_gain_per_mile_fills_zero_distance(self):
+        """Courses without distance get the fill value instead of dividing."""
+        result = elevation_gain_per_mile([1000, 500], [10.0, 0.0], fill=-1.0)
+        np.testing.assert_array_equal(result, [100.0, -1.0])
+
+    def test_find_climb_spans_ends_at_descent(self):
+        """A climb starts at the first steep point and ends at the next descent."""
+        nan = np.nan
+        grades = [nan, 1.0, 4.0, 0.0, nan, 2.0, -1.0, 5.0, -2.0, 6.0, 1.0]
+
+        spans = find_climb_spans(grades, min_grade=3.0)
+
+        # The climb still open at the end of the profile is dropped
+        np.testing.assert_array_equal(spans, [[2, 6], [7, 8]])
+
+    def test_find_climb_spans_without_climbs(self):
+        """Profiles that never reach the threshold have no spans."""
+        assert find_climb_spans([np.nan, 1.0, -1.0], min_grade=3.0).shape == (0, 2)
+        assert find_climb_spans([], min_grade=3.0).shape == (0, 2)
+
+    def test_find_climb_spans_requires_positive_threshold(self):
+        """A non-positive threshold would let descents start climbs."""
+        with pytest.raises(ValueError, match="min_grade"):
+            find_climb_spans([1.0, -1.0], min_grade=0.0)
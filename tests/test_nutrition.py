@@ -6,12 +6,15 @@ for triathlon race nutrition planning.
 """
 
 # Test imports
+import numpy as np
+
 from src.models.athlete import AthleteProfile
 from src.models.conditions import RaceConditions
 from src.models.nutrition import (
     ContingencyNutrition,
     ElectrolyteStrategy,
     FuelingSchedule,
+    HourlySchedule,
     HydrationPlan,
     NutritionItem,
     NutritionPlan,
@@ -277,6 +280,86 @@ class TestNutritionCalculator:
         assert 50 <= schedule["carbs"][2] <= 60  # Should be near target
         assert 20 <= schedule["fluids"][2] <= 24  # Should be near target
 
+    def test_hourly_schedule_arrays(self):
+        """Test the schedule exposes one integer array per nutrient"""
+        schedule = self.calculator.generate_hourly_schedule(5.5, 60, 24, 350)
+
+        assert isinstance(schedule, HourlySchedule)
+        assert len(schedule.carbs) == 6
+        assert schedule.carbs.dtype.kind == "i"
+        assert schedule["sodium"] is schedule.sodium
+        assert schedule.carbs.tolist() == [42, 60, 60, 60, 60, 24]
+        assert schedule.fluids.tolist() == [19, 24, 24, 24, 24, 12]
+
+    def test_hourly_schedule_dict_access(self):
+        """Test the schedule still reads like the nutrient dict it replaced"""
+        schedule = self.calculator.generate_hourly_schedule(5.5, 60, 24, 350)
+
+        assert list(schedule.keys()) == ["carbs", "fluids", "sodium"]
+        assert dict(schedule.items())["fluids"] is schedule.fluids
+        assert schedule.values()[2] is schedule.sodium
+        assert "caffeine" not in schedule
+
+    def test_batch_calculations_match_scalar(self):
+        """Test batched calculations agree with the per-scenario methods"""
+        conditions = [self.hot_conditions, self.cool_conditions]
+        temps = [c.temperature_f for c in conditions]
+        humidities = [c.humidity_percent for c in conditions]
+
+        sweat_rates = self.calculator.calculate_sweat_rate_batch(
+            self.athlete.weight_lbs, temps, humidities
+        )
+        sodium = self.calculator.calculate_sodium_needs_batch(sweat_rates, temps)
+        fluids, _ = self.calculator.calculate_fluid_replacement_batch(sweat_rates)
+
+        for i, cond in enumerate(conditions):
+            sweat = self.calculator.calculate_sweat_rate(self.athlete, cond)
+            assert sweat_rates[i] == sweat
+            assert sodium[i] == self.calculator.calculate_sodium_needs(
+                sweat, cond, self.athlete
+            )
+            assert fluids[i] == self.calculator.calculate_fluid_replacement(sweat)[0]
+
+    def test_sweep_scenarios_grid(self):
+        """Test a heat/humidity grid sweep matches per-scenario results"""
+        temps = [[60], [75], [90], [105]]
+        humidities = [30, 60, 90]
+
+        sweep = self.calculator.sweep_scenarios(
+            self.athlete.weight_lbs, temps, humidities
+        )
+
+        assert sweep.sweat_rate_oz_per_hour.shape == (4, 3)
+        assert sweep.sodium_mg_per_hour.max() <= 800
+        for i, (temp,) in enumerate(temps):
+            for j, humidity in enumerate(humidities):
+                conditions = RaceConditions(temp, 5, "variable", "none", humidity)
+                sweat = self.calculator.calculate_sweat_rate(self.athlete, conditions)
+                assert sweep.sweat_rate_oz_per_hour[i, j] == sweat
+                assert (
+                    sweep.fluid_oz_per_hour[i, j]
+                    == (self.calculator.calculate_fluid_replacement(sweat)[0])
+                )
+
+    def test_sweep_scenarios_float32(self):
+        """Test a float32 sweep stays within rounding of the float64 sweep"""
+        temps = np.arange(50, 111, 5)
+        humidities = np.arange(20, 101, 10)[:, None]
+
+        sweep64 = self.calculator.sweep_scenarios(
+            self.athlete.weight_lbs, temps, humidities
+        )
+        sweep32 = self.calculator.sweep_scenarios(
+            self.athlete.weight_lbs, temps, humidities, dtype=np.float32
+        )
+
+        assert sweep32.sweat_rate_oz_per_hour.dtype == np.float32
+        np.testing.assert_allclose(
+            sweep32.sweat_rate_oz_per_hour,
+            sweep64.sweat_rate_oz_per_hour,
+            atol=1e-4,
+        )
+
     def test_environmental_risk_assessment(self):
         """Test environmental risk assessment"""
         hot_risks = self.calculator.assess_environmental_risk(self.hot_conditions)
@@ -0,0 +1,37 @@
+"""
+Tests for the GPX library processing script.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import process_gpx_library  # noqa: E402
+
+
+class TestProcessGpxLibrary:
+    """Test GPX file discovery and course metadata lookup"""
+
+    def test_missing_data_directory_has_no_files(self, tmp_path, capsys):
+        """A data directory that doesn't exist is reported, not raised"""
+        missing = tmp_path / "missing"
+
+        processed = process_gpx_library.process_gpx_library(
+            str(missing), str(tmp_path / "out")
+        )
+
+        assert processed == []
+        assert "No GPX files found" in capsys.readouterr().out
+        assert not (tmp_path / "out").exists()
+
+    def test_course_info_is_not_shared(self):
+        """Modifying returned course info doesn't leak into later calls"""
+        for filename in ("im70.3_pennstate.gpx", "unknown_course.gpx"):
+            info = process_gpx_library.get_course_info(filename)
+            info["surface_types"].append("Gravel")
+            info["location"] = "Elsewhere"
+
+            fresh = process_gpx_library.get_course_info(filename)
+            assert "Gravel" not in fresh["surface_types"]
+            assert fresh["location"] != "Elsewhere"
@@ -11,7 +11,7 @@ import pytest
 from src.models.athlete import AthleteProfile
 from src.models.conditions import RaceConditions
 from src.models.course import ClimbSegment, CourseProfile
-from src.pipelines.core_strategy import RaceStrategyPipeline
+from src.pipelines.core_strategy import RaceStrategyPipeline, get_pipeline
 from src.pipelines.signatures import EnhancedCourseAnalyzer, SegmentAnalyzer
 
 
@@ -185,6 +185,19 @@ class TestRaceStrategyPipelineEnhanced:
         assert hasattr(pipeline, "enhanced_course_analyzer")
         assert hasattr(pipeline, "segment_analyzer")
 
+    @patch("src.pipelines.core_strategy.DifficultyCalculator")
+    def test_get_pipeline_reuses_instance(self, mock_diff_calc_class):
+        """Test that get_pipeline builds the pipeline once and shares it"""
+        get_pipeline.cache_clear()
+        try:
+            pipeline = get_pipeline()
+
+            assert isinstance(pipeline, RaceStrategyPipeline)
+            assert get_pipeline() is pipeline
+            mock_diff_calc_class.assert_called_once()
+        finally:
+            get_pipeline.cache_clear()
+
     @patch("src.pipelines.core_strategy.dspy")
     @patch("src.pipelines.core_strategy.DifficultyCalculator")
     def test_enhanced_pipeline_structure(self, mock_diff_calc_class, mock_dspy):
@@ -287,6 +300,47 @@ class TestRaceStrategyPipelineEnhanced:
             "High" in formatted or "Moderate" in formatted
         )  # Should have challenge level
 
+    def test_specialize_precomputes_course_and_athlete_inputs(
+        self,
+        mock_difficulty_calculator,
+        sample_course,
+        sample_athlete,
+        sample_conditions,
+    ):
+        """Test that a specialized pipeline reuses static inputs across conditions"""
+        pipeline = RaceStrategyPipeline()
+        pipeline.difficulty_calculator = mock_difficulty_calculator
+
+        with patch.object(pipeline, "_run_strategy", return_value={}) as run:
+            specialized = pipeline.specialize(sample_course, sample_athlete)
+            specialized.generate_strategy(sample_conditions)
+            specialized.generate_strategy(sample_conditions)
+
+        mock_difficulty_calculator.calculate_difficulty.assert_called_once_with(
+            sample_course
+        )
+        assert run.call_count == 2
+        static = specialized.static_inputs
+        for call in run.call_args_list:
+            assert call.args[3] is static
+        assert static.course_analysis_inputs["course_name"] == sample_course.name
+        assert sample_athlete.name in static.athlete_profile
+        assert len(static.segment_inputs) == len(
+            mock_difficulty_calculator.calculate_difficulty.return_value.crux_segments
+        )
+
+    def test_max_prompt_climbs_keeps_most_demanding(self, sample_course):
+        """Test that the course prompt can be limited to the hardest climbs"""
+        full = RaceStrategyPipeline()._format_course_data(sample_course)
+        assert "Test Climb 1" in full
+        assert "Test Climb 2" in full
+
+        limited = RaceStrategyPipeline(max_prompt_climbs=1)._format_course_data(
+            sample_course
+        )
+        assert "Test Climb 1" in limited
+        assert "Test Climb 2" not in limited
+
     @patch("src.pipelines.core_strategy.dspy.ChainOfThought")
     def test_generate_strategy_calls_enhanced_modules(
         self,